@@ -2,97 +2,18 @@
 Add Power Cards products (skipping existing ones)
 """
 
-import os
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-
-PACKAGE_NAME = 'com.braggingrights.bragging_rights_app'
-SCOPES = ['https://www.googleapis.com/auth/androidpublisher']
+from play_service import PACKAGE_NAME, get_service
+from product_catalog import catalog_products
 
 # Power cards only (since you already have BR coins)
-POWER_CARDS = [
-    # DEFENSIVE CARDS
-    {
-        'sku': 'extra_life_card',
-        'status': 'active',
-        'defaultPrice': {'priceMicros': '2990000', 'currency': 'USD'},
-        'listings': {
-            'en-US': {
-                'title': 'Extra Life Card',
-                'description': 'Get back into an eliminated pool - second chance!'
-            }
-        },
-        'defaultLanguage': 'en-US'
-    },
-    {
-        'sku': 'eraser_card',
-        'status': 'active',
-        'defaultPrice': {'priceMicros': '3990000', 'currency': 'USD'},
-        'listings': {
-            'en-US': {
-                'title': 'Eraser Card',
-                'description': 'Turn one loss into a win - rewrite history!'
-            }
-        },
-        'defaultLanguage': 'en-US'
-    },
-    {
-        'sku': 'shield_card', 
-        'status': 'active',
-        'defaultPrice': {'priceMicros': '1990000', 'currency': 'USD'},
-        'listings': {
-            'en-US': {
-                'title': 'Shield Card',
-                'description': 'Block attack cards - defend your position!'
-            }
-        },
-        'defaultLanguage': 'en-US'
-    },
-    # OFFENSIVE CARDS
-    {
-        'sku': 'steal_card',
-        'status': 'active',
-        'defaultPrice': {'priceMicros': '4990000', 'currency': 'USD'},
-        'listings': {
-            'en-US': {
-                'title': 'Steal Card', 
-                'description': 'Swap your loss with another win - revenge!'
-            }
-        },
-        'defaultLanguage': 'en-US'
-    },
-    # CARD PACKS
-    {
-        'sku': 'starter_pack',
-        'status': 'active',
-        'defaultPrice': {'priceMicros': '2990000', 'currency': 'USD'},
-        'listings': {
-            'en-US': {
-                'title': 'Starter Card Pack',
-                'description': '3 random cards - begin your collection!'
-            }
-        },
-        'defaultLanguage': 'en-US'
-    }
-]
+POWER_CARD_SKUS = ('extra_life_card', 'eraser_card', 'shield_card', 'steal_card', 'starter_pack')
+POWER_CARDS = catalog_products(skus=POWER_CARD_SKUS)
 
 def main():
-    # Authenticate
-    creds = None
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-    
-    if not creds:
-        print("No valid credentials")
+    service = get_service(interactive=False)
+    if not service:
         return
     
-    service = build('androidpublisher', 'v3', credentials=creds)
-    
     print(f"Adding Power Cards for {PACKAGE_NAME}\n")
     print("=" * 50)
     
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Catalog sync load test against the local androidpublisher fake.
+
+Builds a catalog of the real products plus thousands of synthetic seasonal
+card packs, seeds fake_play.FakeAndroidPublisher with a drifted copy of
+it (some SKUs missing, some with changed prices or titles), then runs
+product_catalog.sync and reports:
+
+    wall time, API calls by method, SKUs pushed / failed
+    converged   every SKU except the deliberately bad ones matches the catalog
+    resync      calls made by an immediate second sync (a list page walk, plus
+                retries of the bad SKUs only)
+
+Usage:
+    python bench_catalog_sync.py [--skus 5000] [--latency 0.05] [--transient 0.05]
+                                 [--bad 5] [--drop 0.01] [--workers 4] [--rate 10] [--seed 7]
+"""
+
+import argparse
+import copy
+import random
+import time
+
+from fake_play import FakeAndroidPublisher
+from play_batch import DEFAULT_CALLS_PER_SECOND
+from product_catalog import diff_catalog, load_catalog, play_body, sync
+
+SEASONS = ['spring', 'summer', 'fall', 'winter', 'playoff', 'bowl', 'derby', 'finals']
+# Share of catalog SKUs missing from / changed on the fake before the sync
+MISSING_RATE = 0.3
+CHANGED_RATE = 0.2
+
+
+def synthetic_catalog(base, count, rng):
+    """The real catalog plus `count` seasonal pack SKUs"""
+    catalog = copy.deepcopy(base)
+    for i in range(count):
+        season = SEASONS[i % len(SEASONS)]
+        price = rng.choice([990000, 1990000, 2990000, 4990000, 9990000])
+        catalog['products'].append({
+            'sku': f"{season}_pack_{i:05d}",
+            'category': 'packs',
+            'status': 'active',
+            'purchaseType': 'managedUser',
+            'defaultPrice': {'priceMicros': str(price), 'currency': 'USD'},
+            'defaultLanguage': 'en-US',
+            'listings': {'en-US': {'title': f"{season.title()} Pack #{i}",
+                                   'description': f"Limited {season} card pack with 5 random cards"}},
+        })
+    return catalog
+
+
+def drifted_remote(products, rng):
+    """What Play might hold: some SKUs missing, some with old prices or titles"""
+    remote = []
+    for product in products:
+        roll = rng.random()
+        if roll < MISSING_RATE:
+            continue
+        copy_ = copy.deepcopy(product)
+        if roll < MISSING_RATE + CHANGED_RATE:
+            if rng.random() < 0.5:
+                copy_['defaultPrice']['priceMicros'] = str(int(copy_['defaultPrice']['priceMicros']) + 1000000)
+            else:
+                copy_['listings']['en-US']['title'] += ' (old)'
+        # Play fills in regional prices on its own; sync must not treat them as drift
+        copy_['prices'] = {'GB': {'priceMicros': copy_['defaultPrice']['priceMicros'], 'currency': 'GBP'}}
+        remote.append(copy_)
+    return remote
+
+
+def run(skus, latency, transient, bad, drop, workers, seed, rate=None):
+    rng = random.Random(seed)
+    catalog = synthetic_catalog(load_catalog(), skus, rng)
+    products = [play_body(product) for product in catalog['products']]
+    bad_skus = rng.sample([product['sku'] for product in products], bad) if bad else []
+
+    fake = FakeAndroidPublisher(drifted_remote(products, rng), latency=latency, transient_rate=transient,
+                                bad_skus=bad_skus, drop_rate=drop, seed=seed)
+    before = diff_catalog(products, list(fake.products.values()))
+    to_push = {product['sku'] for product in before['insert']} | {product['sku'] for product, _ in before['update']}
+
+    options = {'max_workers': workers, 'base_delay': 0.05, 'max_calls_per_second': rate}
+    start = time.perf_counter()
+    plan = sync(fake, catalog, batch_options=options)
+    elapsed = time.perf_counter() - start
+    calls = dict(fake.calls)
+    errors = {status: count for status, count in fake.errors.items() if count}
+
+    after = diff_catalog(products, list(fake.products.values()))
+    outstanding = {product['sku'] for product in after['insert']} | {product['sku'] for product, _ in after['update']}
+
+    fake.transient_rate = 0.0
+    for name in fake.calls:
+        fake.calls[name] = 0
+    resync = sync(fake, catalog, batch_options=options)
+
+    return {
+        'skus': len(products),
+        'to_push': len(to_push),
+        'seconds': elapsed,
+        'calls': calls,
+        'errors': errors,
+        'pushed': len(plan['pushed']),
+        'failed': sorted(plan['failed']),
+        'bad_skus': sorted(to_push & set(bad_skus)),
+        'converged': outstanding <= set(bad_skus),
+        'resync_calls': {name: count for name, count in fake.calls.items() if count},
+        'resync_pushed': len(resync['pushed']),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalog sync load test against a local fake")
+    parser.add_argument('--skus', type=int, default=5000, help="Synthetic seasonal pack SKUs")
+    parser.add_argument('--latency', type=float, default=0.05, help="Seconds per fake API call")
+    parser.add_argument('--transient', type=float, default=0.05, help="Share of calls failing with 503")
+    parser.add_argument('--bad', type=int, default=5, help="SKUs the fake always rejects")
+    parser.add_argument('--drop', type=float, default=0.01, help="Share of batch items left out of responses")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--rate', type=float, default=DEFAULT_CALLS_PER_SECOND,
+                        help="batchUpdate calls per second (0 for no cap)")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Catalog Sync Load Test ({args.skus} synthetic SKUs, {args.latency * 1000:.0f} ms/call, "
+          f"{args.transient:.0%} transient errors)")
+    print("=" * 60)
+
+    result = run(args.skus, args.latency, args.transient, args.bad, args.drop, args.workers, args.seed, args.rate)
+
+    print(f"Catalog SKUs:      {result['skus']}")
+    print(f"Needed pushing:    {result['to_push']}")
+    print(f"Sync time:         {result['seconds']:.2f}s "
+          f"({result['to_push'] / result['seconds']:,.0f} SKUs/s)" if result['seconds'] else "")
+    print(f"API calls:         {', '.join(f'{name} {count}' for name, count in result['calls'].items() if count)}")
+    print(f"Errors injected:   {result['errors'] or 'none'}")
+    print(f"Pushed / failed:   {result['pushed']} / {len(result['failed'])}")
+    print(f"Failed = bad SKUs: {result['failed'] == result['bad_skus']}")
+    print(f"Converged:         {result['converged']}")
+    print(f"Second sync:       {result['resync_calls']}, pushed {result['resync_pushed']}")
+
+
+if __name__ == "__main__":
+    main()
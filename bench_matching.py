@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Matching benchmark suite over synthetic multi-league schedules.
+
+The hard-coded cases in test_nba_api.main say nothing about speed or
+accuracy at scale. This suite builds synthetic slates from the real teams
+and fighters in the saved ESPN scoreboard fixtures (NBA, NFL, MLB, NHL,
+EPL, UFC), perturbs the names the way other providers spell them, and
+measures:
+
+    throughput       lookups per second
+    latency          p50 / p95 / p99 per lookup
+    precision        correct ids / ids returned
+    recall           correct ids / lookups that should have matched
+
+Team lookups go through team_matcher.TeamMatcher with an alias table built
+from the same fixtures; fighter lookups go through fighter_matcher.
+
+Usage:
+    python bench_matching.py                       # print results
+    python bench_matching.py --save bench.json     # record a baseline
+    python bench_matching.py --compare bench.json  # exit 1 on regression
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from fighter_matcher import FighterIndex, match_fights
+from generate_team_aliases import build_league_table
+from team_matcher import TeamMatcher, install_alias_tables
+
+# league key -> saved ESPN scoreboard fixtures
+TEAM_FIXTURES = {
+    'nba': ['espn_nba_scoreboard.json', 'nba.json', 'nba_response.json', 'espn_nba_summary.json'],
+    'nfl': ['espn_nfl_scoreboard.json', 'nfl_scoreboard.json'],
+    'mlb': ['espn_mlb_scoreboard.json', 'mlb_tomorrow.json'],
+    'nhl': ['espn_nhl_scoreboard.json', 'completed_nhl_game.json', 'rangers_devils_data.json',
+            'sabres_bluejackets_data.json'],
+    'epl': ['soccer_data.json'],
+}
+FIGHT_FIXTURES = ['espn_mma.json', 'ufc_scoreboard.json', 'ufc_dates.json', 'pfl.json']
+
+# Share of lookups for games that are not on the slate (tests precision)
+NEGATIVE_RATE = 0.1
+
+# Regression limits for --compare
+MAX_THROUGHPUT_DROP = 0.25
+MAX_ACCURACY_DROP = 0.01
+
+
+def load_fixture(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def fixture_competitors(paths):
+    """All competitor objects from a list of scoreboard fixtures"""
+    competitors = []
+    for path in paths:
+        data = load_fixture(path)
+        if not isinstance(data, dict):
+            continue
+        events = data.get('events', [])
+        if 'header' in data:
+            events = events + [data['header']]
+        for event in events:
+            for comp in event.get('competitions', []):
+                competitors.extend(comp.get('competitors', []))
+    return competitors
+
+
+def fixture_teams(paths):
+    """Distinct team objects (by id) from fixtures"""
+    teams = {}
+    for competitor in fixture_competitors(paths):
+        team = competitor.get('team')
+        if team and team.get('displayName'):
+            teams[team.get('id') or team['displayName']] = team
+    return list(teams.values())
+
+
+def fixture_fighters(paths):
+    """Distinct fighter display names from fixtures"""
+    names = {competitor.get('athlete', {}).get('displayName') for competitor in fixture_competitors(paths)}
+    return sorted(name for name in names if name)
+
+
+# Perturbations -------------------------------------------------------------
+
+def perturb_team(team, rng):
+    """One of the ways another provider might name an ESPN team"""
+    display = team['displayName']
+    choice = rng.randrange(6)
+    if choice == 0 and team.get('shortDisplayName'):
+        return team['shortDisplayName']
+    if choice == 1 and team.get('abbreviation') and team.get('name'):
+        return f"{team['abbreviation']} {team['name']}"
+    if choice == 2:
+        return display.upper()
+    if choice == 3:
+        return f" {display}. "
+    if choice == 4:
+        return display.replace('e', 'é', 1)
+    return display
+
+
+def perturb_fighter(name, rng):
+    """Accents, nicknames, name order, case and typo variations"""
+    parts = name.split()
+    choice = rng.randrange(6)
+    if choice == 0:
+        return name.replace('a', 'á', 1).replace('o', 'ó', 1)
+    if choice == 1 and len(parts) >= 2:
+        return f'{parts[0]} "The Kid" {" ".join(parts[1:])}'
+    if choice == 2 and len(parts) >= 2:
+        return f"{parts[-1]}, {' '.join(parts[:-1])}"
+    if choice == 3:
+        return name.upper()
+    if choice == 4 and len(name) > 5:
+        i = rng.randrange(1, len(name) - 2)
+        return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    return name
+
+
+# Synthetic slates ----------------------------------------------------------
+
+def synthetic_event(event_id, home, away):
+    """Minimal ESPN-shaped event"""
+    return {
+        'id': event_id,
+        'competitions': [{'competitors': [
+            {'homeAway': 'home', 'team': home},
+            {'homeAway': 'away', 'team': away},
+        ]}],
+    }
+
+
+def team_slates(league, teams, games, rng):
+    """Synthetic game days: [(events, lookups)], lookups are (home, away, expected id or None).
+
+    Like a real slate, every team plays at most once per day, so a matchup
+    is unique within its day. Negative lookups pair two teams that are both
+    playing that day, but not against each other.
+    """
+    per_day = len(teams) // 2
+    slates = []
+    made = 0
+    day = 0
+    while made < games:
+        shuffled = rng.sample(teams, len(teams))
+        count = min(per_day, games - made)
+        events = []
+        for i in range(count):
+            home, away = shuffled[2 * i], shuffled[2 * i + 1]
+            events.append(synthetic_event(f"{league}-{day}-{i}", home, away))
+
+        lookups = []
+        for event in events:
+            competitors = event['competitions'][0]['competitors']
+            home, away = competitors[0]['team'], competitors[1]['team']
+            if rng.random() < 0.5:
+                home, away = away, home
+            lookups.append((perturb_team(home, rng), perturb_team(away, rng), event['id']))
+
+        if count >= 2:
+            for _ in range(max(1, int(count * NEGATIVE_RATE))):
+                i, j = rng.sample(range(count), 2)
+                lookups.append((perturb_team(shuffled[2 * i], rng), perturb_team(shuffled[2 * j + 1], rng), None))
+
+        rng.shuffle(lookups)
+        slates.append((events, lookups))
+        made += count
+        day += 1
+    return slates
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def score(results):
+    """results: [(expected, actual, latency_ns)] -> metrics dict"""
+    latencies = sorted(latency for _, _, latency in results)
+    total_ns = sum(latencies)
+    returned = sum(1 for _, actual, _ in results if actual is not None)
+    correct = sum(1 for expected, actual, _ in results if actual is not None and actual == expected)
+    positives = sum(1 for expected, _, _ in results if expected is not None)
+    return {
+        'lookups': len(results),
+        'throughput': len(results) / (total_ns / 1e9) if total_ns else 0.0,
+        'p50_us': percentile(latencies, 50) / 1000.0,
+        'p95_us': percentile(latencies, 95) / 1000.0,
+        'p99_us': percentile(latencies, 99) / 1000.0,
+        'precision': correct / returned if returned else 1.0,
+        'recall': correct / positives if positives else 1.0,
+    }
+
+
+def bench_teams(league, teams, games, rng):
+    slates = team_slates(league, teams, games, rng)
+
+    results = []
+    build_seconds = 0.0
+    clock = time.perf_counter_ns
+    for events, lookups in slates:
+        start = time.perf_counter()
+        matcher = TeamMatcher(events, league=league)
+        build_seconds += time.perf_counter() - start
+
+        for home, away, expected in lookups:
+            t0 = clock()
+            event = matcher.lookup(home, away)
+            results.append((expected, event['id'] if event else None, clock() - t0))
+
+    metrics = score(results)
+    metrics['build_us_per_game'] = build_seconds * 1e6 / games if games else 0.0
+    return metrics
+
+
+def bench_fighters(fighters, bouts, rng):
+    """Per-name lookup latency/accuracy plus bulk card join throughput"""
+    if len(fighters) < 4:
+        return None
+
+    index = FighterIndex()
+    for name in fighters:
+        index.add(name)
+
+    results = []
+    clock = time.perf_counter_ns
+    for _ in range(bouts * 2):
+        name = rng.choice(fighters)
+        query = perturb_fighter(name, rng)
+        t0 = clock()
+        _, payload = index.best(query)
+        results.append((name, payload, clock() - t0))
+    metrics = score(results)
+
+    right = []
+    for _ in range(bouts):
+        home, away = rng.sample(fighters, 2)
+        right.append({'home': home, 'away': away})
+    left = [{'home': perturb_fighter(f['away'], rng), 'away': perturb_fighter(f['home'], rng)} for f in right]
+
+    start = time.perf_counter()
+    joined = match_fights(left, right)
+    join_seconds = time.perf_counter() - start
+    metrics['join_fights_per_s'] = len(left) / join_seconds if join_seconds else 0.0
+    metrics['join_recall'] = sum(1 for _, other, _ in joined if other is not None) / len(left)
+    return metrics
+
+
+def run(games, bouts, seed):
+    rng = random.Random(seed)
+
+    teams_by_league = {league: fixture_teams(paths) for league, paths in TEAM_FIXTURES.items()}
+    teams_by_league = {league: teams for league, teams in teams_by_league.items() if len(teams) >= 4}
+    install_alias_tables({league: build_league_table(teams) for league, teams in teams_by_league.items()})
+
+    results = {}
+    for league, teams in sorted(teams_by_league.items()):
+        results[league] = bench_teams(league, teams, games, rng)
+
+    fight_metrics = bench_fighters(fixture_fighters(FIGHT_FIXTURES), bouts, rng)
+    if fight_metrics:
+        results['mma'] = fight_metrics
+    return results
+
+
+def print_results(results):
+    print(f"{'league':<6} {'lookups':>8} {'lookups/s':>12} {'p50 us':>8} {'p95 us':>8} {'p99 us':>8} "
+          f"{'prec':>6} {'recall':>6}")
+    print("-" * 72)
+    for league, m in results.items():
+        print(f"{league:<6} {m['lookups']:>8} {m['throughput']:>12,.0f} {m['p50_us']:>8.1f} "
+              f"{m['p95_us']:>8.1f} {m['p99_us']:>8.1f} {m['precision']:>6.3f} {m['recall']:>6.3f}")
+    if 'mma' in results:
+        m = results['mma']
+        print(f"\nmma card join: {m['join_fights_per_s']:,.0f} fights/s, recall {m['join_recall']:.3f}")
+
+
+def compare(results, baseline):
+    """List of regression messages against a saved baseline"""
+    problems = []
+    for league, old in baseline.items():
+        new = results.get(league)
+        if not new:
+            continue
+        if new['throughput'] < old['throughput'] * (1 - MAX_THROUGHPUT_DROP):
+            problems.append(f"{league}: throughput {new['throughput']:,.0f}/s vs baseline {old['throughput']:,.0f}/s")
+        for key in ('precision', 'recall'):
+            if new[key] < old[key] - MAX_ACCURACY_DROP:
+                problems.append(f"{league}: {key} {new[key]:.3f} vs baseline {old[key]:.3f}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark team and fighter matching")
+    parser.add_argument('--games', type=int, default=20000, help="Synthetic games per league")
+    parser.add_argument('--bouts', type=int, default=2000, help="Synthetic MMA bouts")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--save', help="Write results to this JSON file")
+    parser.add_argument('--compare', help="Fail if results regress against this JSON file")
+    args = parser.parse_args()
+
+    print("=" * 72)
+    print(f"Matching Benchmark ({args.games} games/league, {args.bouts} bouts, seed {args.seed})")
+    print("=" * 72)
+
+    results = run(args.games, args.bouts, args.seed)
+    print_results(results)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            problems = compare(results, json.load(f))
+        if problems:
+            print("\nREGRESSIONS:")
+            for problem in problems:
+                print(f"  {problem}")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
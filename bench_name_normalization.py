@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: legacy normalize_team_name vs name_normalization.
+
+Builds a large synthetic slate from the team names in the saved ESPN
+scoreboard fixtures (with case, punctuation and accent perturbations) and
+times normalizing every name the way test_matching did it: 4 calls per
+candidate game.
+
+The cached speedup depends on the machine and on how often names repeat.
+The default run has ~340 distinct names across 200k calls (a 99.8% hit
+rate) and has measured anywhere from 8x to ~20x over legacy; the uncached
+translate path is ~1.8x.
+
+Usage:
+    python bench_name_normalization.py [--games 50000]
+"""
+
+import argparse
+import glob
+import json
+import random
+import time
+
+import name_normalization
+
+
+def legacy_clean_team_name(team):
+    """The original generator + ''.join implementation, for comparison"""
+    normalized = team.lower().strip()
+    normalized = ''.join(c if c.isalnum() or c.isspace() else '' for c in normalized)
+    normalized = ' '.join(normalized.split())
+    return normalized
+
+
+def fixture_team_names():
+    """Every team displayName in the saved ESPN scoreboard fixtures"""
+    names = set()
+    for path in glob.glob('*scoreboard*.json'):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (ValueError, OSError):
+            continue
+        if not isinstance(data, dict):
+            continue
+        for event in data.get('events', []):
+            for comp in event.get('competitions', []):
+                for competitor in comp.get('competitors', []):
+                    name = competitor.get('team', {}).get('displayName')
+                    if name:
+                        names.add(name)
+    return sorted(names) or ['Houston Rockets', 'Oklahoma City Thunder', 'New York Knicks']
+
+
+def perturb(name, rng):
+    """Case, spacing, punctuation and accent variations of one name"""
+    choice = rng.randrange(5)
+    if choice == 0:
+        return name.upper()
+    if choice == 1:
+        return f"  {name}. "
+    if choice == 2:
+        return name.replace('e', 'é').replace('a', 'á')
+    if choice == 3:
+        return name.replace(' ', '  ')
+    return name
+
+
+def build_slate(games, seed=7):
+    """(home, away) pairs for a synthetic slate"""
+    rng = random.Random(seed)
+    names = fixture_team_names()
+    return [(perturb(rng.choice(names), rng), perturb(rng.choice(names), rng)) for _ in range(games)]
+
+
+def time_normalizer(func, slate, target_home, target_away):
+    """Seconds to normalize a slate the way test_matching did"""
+    start = time.perf_counter()
+    for home, away in slate:
+        func(home)
+        func(away)
+        func(target_home)
+        func(target_away)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark team name normalization")
+    parser.add_argument('--games', type=int, default=50000)
+    args = parser.parse_args()
+
+    slate = build_slate(args.games)
+    calls = len(slate) * 4
+    target_home, target_away = 'Houston Rockets', 'Oklahoma City Thunder'
+
+    print("=" * 60)
+    print(f"Name normalization benchmark: {len(slate)} games, {calls} calls")
+    print("=" * 60)
+
+    legacy = time_normalizer(legacy_clean_team_name, slate, target_home, target_away)
+
+    name_normalization.clean_team_name.cache_clear()
+    uncached = time_normalizer(name_normalization.clean_team_name.__wrapped__, slate, target_home, target_away)
+    cached = time_normalizer(name_normalization.clean_team_name, slate, target_home, target_away)
+
+    for label, seconds in (("legacy join", legacy), ("translate", uncached), ("translate + LRU", cached)):
+        print(f"  {label:<18} {seconds * 1000:>9.1f} ms  {calls / seconds:>12,.0f} names/s  "
+              f"{legacy / seconds:>5.1f}x")
+
+    print(f"\n  Cache: {name_normalization.clean_team_name.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
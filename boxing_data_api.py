@@ -0,0 +1,396 @@
+"""
+Client for the Boxing Data API on RapidAPI (boxing-data-api.p.rapidapi.com).
+
+All requests share one pooled requests.Session. For full syncs, the
+aiter_* methods walk every page of a listing endpoint. The provider
+sends no total count, so pages are fetched one at a time by default;
+callers with quota to spare can prefetch pages ahead, trading possible
+wasted calls past the last page for lower latency.
+
+The free tier allows 100 calls a month (see
+archived_plans/boxing_api_caching_strategy.md), so get_event_by_id and
+get_schedule go through a persistent BoxingApiCache. Cached responses stay
+fresh for longer the further away the fight is, and when the month's
+spend runs ahead of schedule the freshness windows stretch further, so
+quota is spent on events close to fight time.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+
+import requests
+from requests.adapters import HTTPAdapter
+
+REQUEST_TIMEOUT = 15
+# Pages requested ahead of the one being consumed. Any page past the end
+# still costs a call, and the free tier has 100 a month.
+DEFAULT_PREFETCH = 0
+# Concurrent detail fetches in get_events (only cache misses, all real pages)
+DEFAULT_WORKERS = 4
+
+CACHE_FILE = 'boxing_api_cache.db'
+MONTHLY_QUOTA = 100
+# Calls kept back for manual refreshes and retries; only spent on cache misses
+QUOTA_RESERVE = 10
+
+HOUR = 3600
+DAY = 24 * HOUR
+# (seconds until the event starts, freshness window). First match wins.
+EVENT_FRESHNESS = [
+    (-2 * DAY, None),        # finished more than 2 days ago: results are final
+    (-12 * HOUR, 6 * HOUR),  # just finished: results trickle in
+    (12 * HOUR, 30 * 60),    # fight night
+    (2 * DAY, 3 * HOUR),     # fight week, late changes
+    (7 * DAY, DAY),
+    (None, 7 * DAY),         # far out: cards rarely change
+]
+SCHEDULE_FRESHNESS = DAY
+
+
+def fighter_name(fighter):
+    """Full name of a /fights fighter entry; its `name` field holds only the surname"""
+    fighter = fighter or {}
+    return fighter.get('full_name') or fighter.get('name') or ''
+
+
+def seconds_until(event):
+    """Seconds from now until an event's start (negative once it started)"""
+    raw = (event or {}).get('date')
+    if not raw:
+        return None
+    start = datetime.fromisoformat(raw.replace('Z', '+00:00'))
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return (start - datetime.now(timezone.utc)).total_seconds()
+
+
+def event_freshness(event):
+    """Freshness window in seconds for a cached event (None = never refetch)"""
+    until = seconds_until(event)
+    if until is None:
+        return DAY
+    for limit, window in EVENT_FRESHNESS:
+        if limit is None or until < limit:
+            return window
+    return DAY
+
+
+class BoxingApiCache:
+    """Persistent response cache plus a monthly API call counter (SQLite)"""
+
+    def __init__(self, path=CACHE_FILE, monthly_quota=MONTHLY_QUOTA, reserve=QUOTA_RESERVE):
+        self.path = path
+        self.monthly_quota = monthly_quota
+        self.reserve = reserve
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS quota (
+                month TEXT PRIMARY KEY,
+                calls INTEGER NOT NULL,
+                remaining INTEGER
+            );
+        """)
+        self._db.commit()
+
+    @staticmethod
+    def _month():
+        return datetime.now(timezone.utc).strftime('%Y-%m')
+
+    def get(self, key):
+        """(body, age_seconds) for a cached response, or (None, None)"""
+        with self._lock:
+            row = self._db.execute("SELECT body, fetched_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return None, None
+        return json.loads(row[0]), time.time() - row[1]
+
+    def put(self, key, body):
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO responses (key, body, fetched_at) VALUES (?, ?, ?)",
+                             (key, json.dumps(body), time.time()))
+            self._db.commit()
+
+    def record_call(self, remaining=None):
+        """Count one API call this month; `remaining` is the provider's own count if it sent one"""
+        month = self._month()
+        with self._lock:
+            self._db.execute("""
+                INSERT INTO quota (month, calls, remaining) VALUES (?, 1, ?)
+                ON CONFLICT(month) DO UPDATE SET calls = calls + 1,
+                    remaining = COALESCE(excluded.remaining, remaining)
+            """, (month, remaining))
+            self._db.commit()
+
+    def calls_remaining(self):
+        """Calls left this month (provider count when known, else our own)"""
+        with self._lock:
+            row = self._db.execute("SELECT calls, remaining FROM quota WHERE month = ?",
+                                   (self._month(),)).fetchone()
+        if not row:
+            return self.monthly_quota
+        calls, remaining = row
+        own_count = self.monthly_quota - calls
+        return min(own_count, remaining) if remaining is not None else own_count
+
+    def pace_factor(self):
+        """How much to stretch freshness windows: 1.0 on budget, up to 4.0 when overspending.
+
+        Compares the share of quota left with the share of the month left.
+        """
+        now = datetime.now(timezone.utc)
+        next_month = datetime(now.year + now.month // 12, now.month % 12 + 1, 1, tzinfo=timezone.utc)
+        month_start = datetime(now.year, now.month, 1, tzinfo=timezone.utc)
+        time_left = (next_month - now) / (next_month - month_start)
+
+        spendable = self.monthly_quota - self.reserve
+        quota_left = max(0, self.calls_remaining() - self.reserve) / spendable if spendable else 0.0
+        if quota_left >= time_left:
+            return 1.0
+        if quota_left <= 0:
+            return float('inf')
+        return min(4.0, time_left / quota_left)
+
+    def can_spend(self, have_cached_copy):
+        """Whether a network call is allowed. The reserve is only for cache misses."""
+        remaining = self.calls_remaining()
+        if have_cached_copy:
+            return remaining > self.reserve
+        return remaining > 0
+
+    def stats(self):
+        with self._lock:
+            cached = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {'cached_responses': cached, 'calls_remaining': self.calls_remaining(),
+                'pace_factor': self.pace_factor()}
+
+
+class BoxingDataAPI:
+    def __init__(self, api_key, pool_size=10, cache_path=CACHE_FILE, monthly_quota=MONTHLY_QUOTA):
+        self.api_key = api_key
+        self.base_url = "https://boxing-data-api.p.rapidapi.com/v1"
+        self.headers = {
+            "x-rapidapi-host": "boxing-data-api.p.rapidapi.com",
+            "x-rapidapi-key": api_key
+        }
+
+        # One keep-alive pool shared by every call, including prefetch threads
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+
+        # cache_path=None disables caching (every call hits the API)
+        self.cache = BoxingApiCache(cache_path, monthly_quota) if cache_path else None
+
+    def _get(self, path, params=None):
+        """GET a path under base_url; returns parsed JSON or None on error (including network errors)"""
+        url = f"{self.base_url}{path}"
+        try:
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            print(f"Error: {e}")
+            return None
+
+        if self.cache:
+            remaining = response.headers.get('x-ratelimit-requests-remaining')
+            self.cache.record_call(int(remaining) if remaining and remaining.isdigit() else None)
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            print(f"Error: {response.status_code}")
+            print(f"Response: {response.text[:200]}")
+            return None
+
+    @staticmethod
+    def _cache_key(path, params=None):
+        return path + ('?' + json.dumps(params, sort_keys=True) if params else '')
+
+    def _is_fresh(self, body, age, freshness):
+        window = freshness(body)
+        return window is None or age < window * self.cache.pace_factor()
+
+    def _cached_get(self, path, params, freshness):
+        """Serve from cache while fresh (per `freshness(body)`), else spend a call if quota allows"""
+        if not self.cache:
+            return self._get(path, params)
+
+        key = self._cache_key(path, params)
+        body, age = self.cache.get(key)
+
+        if body is not None:
+            if self._is_fresh(body, age, freshness):
+                return body
+            if not self.cache.can_spend(have_cached_copy=True):
+                return body
+        elif not self.cache.can_spend(have_cached_copy=False):
+            print(f"Quota exhausted, no cached copy of {key}")
+            return None
+
+        fresh = self._get(path, params)
+        if fresh is None:
+            # Stale beats nothing when the API errors
+            return body
+        self.cache.put(key, fresh)
+        return fresh
+
+    def get_all_events(self):
+        """Get all boxing events"""
+        return self._get("/events")
+
+    def get_event_by_id(self, event_id):
+        """Get specific event details by ID (cached; fresher as fight time nears)"""
+        return self._cached_get(f"/events/{event_id}", None, event_freshness)
+
+    def get_events(self, event_ids, max_workers=DEFAULT_WORKERS):
+        """Get details for many events; results line up with event_ids (None where unavailable).
+
+        Duplicate ids are fetched once, fresh cached copies are served without
+        touching the network, and only the misses are fetched, at most
+        max_workers at a time over the shared session.
+        """
+        unique_ids = list(dict.fromkeys(str(event_id) for event_id in event_ids))
+        results = {}
+        misses = []
+
+        for event_id in unique_ids:
+            if self.cache:
+                body, age = self.cache.get(self._cache_key(f"/events/{event_id}"))
+                if body is not None and self._is_fresh(body, age, event_freshness):
+                    results[event_id] = body
+                    continue
+            misses.append(event_id)
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for event_id, body in zip(misses, pool.map(self.get_event_by_id, misses)):
+                    results[event_id] = body
+
+        return [results.get(str(event_id)) for event_id in event_ids]
+
+    def search_events(self, page_num=1, page_size=25, date_sort="DESC"):
+        """Search events with pagination"""
+        params = {
+            "page_num": page_num,
+            "page_size": page_size,
+            "date_sort": date_sort
+        }
+        return self._get("/events/", params)
+
+    def get_schedule(self, days=7, past_hours=12, date_sort="ASC", page_num=1, page_size=25):
+        """Get event schedule for specified time period"""
+        params = {
+            "days": days,
+            "past_hours": past_hours,
+            "date_sort": date_sort,
+            "page_num": page_num,
+            "page_size": page_size
+        }
+        return self._cached_get("/events/schedule", params, lambda body: SCHEDULE_FRESHNESS)
+
+    def get_event_fights(self, event_id, event=None):
+        """Fights on one event's card (/fights?event_id=), cached as long as the event itself"""
+        return self._cached_get("/fights", {"event_id": str(event_id)}, lambda body: event_freshness(event))
+
+    async def aiter_pages(self, fetch_page, page_size=25, prefetch=DEFAULT_PREFETCH, max_pages=None):
+        """Yield every item from a paginated endpoint, in page order.
+
+        fetch_page(page_num) returns one page (a list). Besides the page
+        being consumed, up to `prefetch` later pages are in flight on the
+        shared session. Iteration stops at the first short, empty or failed
+        page; once any page comes back like that, no page past it is
+        requested and the tasks already scheduled past it are discarded.
+        """
+        last = max_pages   # highest page number that can still exist
+        pending = {}
+
+        def page_done(page_num, task):
+            nonlocal last
+            if task.cancelled():
+                return
+            page = None if task.exception() else task.result()
+            if page and isinstance(page, list) and len(page) >= page_size:
+                return
+            if last is None or page_num < last:
+                last = page_num
+            for later in [n for n in pending if n > page_num]:
+                pending.pop(later).cancel()
+
+        next_page = 1
+        page_num = 1
+        try:
+            while last is None or page_num <= last:
+                while next_page <= page_num + prefetch and (last is None or next_page <= last):
+                    task = asyncio.ensure_future(asyncio.to_thread(fetch_page, next_page))
+                    task.add_done_callback(partial(page_done, next_page))
+                    pending[next_page] = task
+                    next_page += 1
+
+                page = await pending.pop(page_num)
+                if not page or not isinstance(page, list):
+                    break
+                for item in page:
+                    yield item
+                if len(page) < page_size:
+                    break
+                page_num += 1
+        finally:
+            for task in pending.values():
+                task.cancel()
+
+    def aiter_schedule(self, days=30, past_hours=12, date_sort="ASC", page_size=25, **kwargs):
+        """Async iterator over every scheduled event across all pages"""
+        def fetch_page(page_num):
+            return self.get_schedule(days=days, past_hours=past_hours, date_sort=date_sort,
+                                     page_num=page_num, page_size=page_size)
+        return self.aiter_pages(fetch_page, page_size=page_size, **kwargs)
+
+    def aiter_events(self, date_sort="DESC", page_size=25, **kwargs):
+        """Async iterator over every event returned by search_events"""
+        def fetch_page(page_num):
+            return self.search_events(page_num=page_num, page_size=page_size, date_sort=date_sort)
+        return self.aiter_pages(fetch_page, page_size=page_size, **kwargs)
+
+    def get_full_schedule(self, days=30, past_hours=12, **kwargs):
+        """Every scheduled event across all pages (blocking wrapper)"""
+        async def collect():
+            return [event async for event in self.aiter_schedule(days=days, past_hours=past_hours, **kwargs)]
+        return asyncio.run(collect())
+
+    def format_event_display(self, event):
+        """Format event for display"""
+        date_obj = datetime.fromisoformat(event['date'].replace('Z', '+00:00'))
+        formatted_date = date_obj.strftime("%B %d, %Y at %I:%M %p")
+
+        output = f"\n{'='*60}\n"
+        output += f"Event: {event['title']}\n"
+        output += f"Date: {formatted_date}\n"
+        output += f"Location: {event.get('location', 'TBA')}\n"
+        output += f"Venue: {event.get('venue', 'TBA')}\n"
+
+        if event.get('promotion'):
+            output += f"Promotion: {event['promotion']}\n"
+
+        if event.get('broadcasters'):
+            broadcasters = []
+            for broadcaster in event['broadcasters']:
+                for country, network in broadcaster.items():
+                    broadcasters.append(f"{country}: {network}")
+            output += f"Broadcast: {', '.join(broadcasters)}\n"
+
+        if event.get('poster_image_url'):
+            output += f"Poster: {event['poster_image_url']}\n"
+
+        return output
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Incremental boxing schedule sync into a local SQLite store.
+
+Artifacts like boxing_events.json, boxing_future.json and october_cards.pkl
+used to be regenerated by re-pulling everything. BoxingStore keeps events
+and fights in boxing_store.db, indexed by date, promotion and fighter, and
+sync() only asks the API for the moving window of events around today
+(the past few days for results, the next few weeks for new cards), then
+fetches /fights?event_id= only for events that are new or changed since
+the last sync. Rows outside the window are never refetched, and rows
+whose content did not change are not rewritten. Card listings then come
+from a local query.
+
+The RapidAPI key is read from the BOXING_DATA_API_KEY environment
+variable.
+
+Usage:
+    python boxing_sync.py sync [--days 30] [--past-hours 48]
+    python boxing_sync.py cards 2025-10-01 2025-11-01 [--promotion "Top Rank"]   (end exclusive)
+    python boxing_sync.py fighter "Jaron Ennis"
+    python boxing_sync.py export 2025-10-01 2025-11-01 october_cards.brcards
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime, timezone
+
+from boxing_data_api import BoxingDataAPI, fighter_name
+from card_store import write_card_store
+from name_normalization import clean_fighter_name
+
+STORE_FILE = 'boxing_store.db'
+API_KEY_ENV = 'BOXING_DATA_API_KEY'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    date TEXT,
+    promotion TEXT,
+    venue TEXT,
+    location TEXT,
+    content_hash TEXT NOT NULL,
+    raw TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_date ON events (date);
+CREATE INDEX IF NOT EXISTS idx_events_promotion ON events (promotion, date);
+
+CREATE TABLE IF NOT EXISTS fights (
+    id TEXT PRIMARY KEY,
+    event_id TEXT,
+    title TEXT,
+    date TEXT,
+    status TEXT,
+    division TEXT,
+    fighter_1 TEXT,
+    fighter_2 TEXT,
+    content_hash TEXT NOT NULL,
+    raw TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_fights_date ON fights (date);
+CREATE INDEX IF NOT EXISTS idx_fights_event ON fights (event_id);
+
+-- One row per fighter per fight, keyed by normalized name for lookups
+CREATE TABLE IF NOT EXISTS fight_fighters (
+    fighter TEXT NOT NULL,
+    fight_id TEXT NOT NULL,
+    PRIMARY KEY (fighter, fight_id)
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def content_hash(record):
+    return hashlib.sha1(json.dumps(record, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def fight_id(fight):
+    """Provider id, or a stable hash of date + fighters when missing"""
+    if fight.get('id'):
+        return str(fight['id'])
+    fighters = fight.get('fighters', {})
+    seed = f"{fight.get('date')}|{fighter_name(fighters.get('fighter_1'))}|{fighter_name(fighters.get('fighter_2'))}"
+    return hashlib.md5(seed.encode('utf-8')).hexdigest()
+
+
+def with_event_date(fight, event):
+    """Fight record with the event's date filled in when the provider left it out"""
+    if fight.get('date') or not event.get('date'):
+        return fight
+    return dict(fight, date=event['date'])
+
+
+class BoxingStore:
+    """SQLite store of boxing events and fights"""
+
+    def __init__(self, path=STORE_FILE):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+        if self.get_state('fighter_names') != 'full_name':
+            self._reindex_fighters()
+
+    def _reindex_fighters(self):
+        """Rewrite fighter columns and index rows from the stored raw fights.
+
+        Stores written before fighter_name() held surnames only, and unchanged
+        fights are never rewritten by sync, so they are fixed up once here.
+        """
+        with self.db:
+            for row in self.db.execute("SELECT id, raw FROM fights").fetchall():
+                fighters = json.loads(row['raw']).get('fighters', {})
+                names = (fighter_name(fighters.get('fighter_1')), fighter_name(fighters.get('fighter_2')))
+                self.db.execute("UPDATE fights SET fighter_1 = ?, fighter_2 = ? WHERE id = ?", names + (row['id'],))
+                self.db.execute("DELETE FROM fight_fighters WHERE fight_id = ?", (row['id'],))
+                for name in names:
+                    if name:
+                        self.db.execute("INSERT OR IGNORE INTO fight_fighters (fighter, fight_id) VALUES (?, ?)",
+                                        (clean_fighter_name(name), row['id']))
+            self.set_state('fighter_names', 'full_name')
+
+    def close(self):
+        self.db.close()
+
+    def _changed(self, table, record_id, digest):
+        row = self.db.execute(f"SELECT content_hash FROM {table} WHERE id = ?", (record_id,)).fetchone()
+        return row is None or row['content_hash'] != digest
+
+    def event_changed(self, event):
+        """Whether an event is new or differs from the stored copy"""
+        return self._changed('events', str(event['id']), content_hash(event))
+
+    def upsert_event(self, event, synced_at):
+        """Insert or update one event; returns True if anything changed"""
+        digest = content_hash(event)
+        if not self._changed('events', str(event['id']), digest):
+            return False
+        self.db.execute("""
+            INSERT INTO events (id, title, date, promotion, venue, location, content_hash, raw, synced_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                title = excluded.title, date = excluded.date, promotion = excluded.promotion,
+                venue = excluded.venue, location = excluded.location,
+                content_hash = excluded.content_hash, raw = excluded.raw, synced_at = excluded.synced_at
+        """, (str(event['id']), event.get('title'), event.get('date'), event.get('promotion'),
+              event.get('venue'), event.get('location'), digest, json.dumps(event), synced_at))
+        return True
+
+    def upsert_fight(self, fight, synced_at, event_id=None):
+        """Insert or update one fight and its fighter index rows.
+
+        event_id links fights fetched per event whose record carries no event.
+        """
+        event = fight.get('event') or {}
+        event_id = str(event['id']) if event.get('id') else event_id
+        record_id = fight_id(fight)
+        digest = content_hash(fight)
+        if not self._changed('fights', record_id, digest):
+            return False
+
+        fighters = fight.get('fighters', {})
+        name_1 = fighter_name(fighters.get('fighter_1'))
+        name_2 = fighter_name(fighters.get('fighter_2'))
+        division = fight.get('division') or {}
+
+        self.db.execute("""
+            INSERT INTO fights (id, event_id, title, date, status, division, fighter_1, fighter_2,
+                                content_hash, raw, synced_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                event_id = excluded.event_id, title = excluded.title, date = excluded.date,
+                status = excluded.status, division = excluded.division,
+                fighter_1 = excluded.fighter_1, fighter_2 = excluded.fighter_2,
+                content_hash = excluded.content_hash, raw = excluded.raw, synced_at = excluded.synced_at
+        """, (record_id, event_id, fight.get('title'), fight.get('date'), fight.get('status'),
+              division.get('name') if isinstance(division, dict) else division,
+              name_1, name_2, digest, json.dumps(fight), synced_at))
+
+        self.db.execute("DELETE FROM fight_fighters WHERE fight_id = ?", (record_id,))
+        for name in (name_1, name_2):
+            if name:
+                self.db.execute("INSERT OR IGNORE INTO fight_fighters (fighter, fight_id) VALUES (?, ?)",
+                                (clean_fighter_name(name), record_id))
+        return True
+
+    def event_fight_ids(self, event_id):
+        return {row['id'] for row in self.db.execute("SELECT id FROM fights WHERE event_id = ?", (event_id,))}
+
+    def delete_fights(self, fight_ids):
+        """Drop fights (and their fighter index rows) that left a card"""
+        for record_id in fight_ids:
+            self.db.execute("DELETE FROM fight_fighters WHERE fight_id = ?", (record_id,))
+            self.db.execute("DELETE FROM fights WHERE id = ?", (record_id,))
+
+    def set_state(self, key, value):
+        self.db.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+    def get_state(self, key):
+        row = self.db.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    # Queries -------------------------------------------------------------
+
+    def events_between(self, start, end, promotion=None):
+        """Events with start <= date < end (ISO strings), optionally for one promotion"""
+        sql = "SELECT raw FROM events WHERE date >= ? AND date < ?"
+        params = [start, end]
+        if promotion:
+            sql += " AND promotion = ?"
+            params.append(promotion)
+        sql += " ORDER BY date"
+        return [json.loads(row['raw']) for row in self.db.execute(sql, params)]
+
+    def cards_between(self, start, end, promotion=None):
+        """Fight cards (card_store shape) with start <= date < end (ISO strings).
+
+        The end is exclusive, as in CardStore.cards_between. Fights are
+        grouped by their event when the provider links one, otherwise by
+        calendar date.
+        """
+        sql = """
+            SELECT f.id, f.event_id, f.date, f.fighter_1, f.fighter_2, f.division, e.title, e.promotion
+            FROM fights f LEFT JOIN events e ON e.id = f.event_id
+            WHERE f.date >= ? AND f.date < ?
+        """
+        params = [start, end]
+        if promotion:
+            sql += " AND e.promotion = ?"
+            params.append(promotion)
+        sql += " ORDER BY f.date"
+
+        cards = {}
+        for row in self.db.execute(sql, params):
+            when = datetime.fromisoformat(row['date'].replace('Z', '+00:00'))
+            if when.tzinfo is None:
+                when = when.replace(tzinfo=timezone.utc)
+            key = row['event_id'] or when.date().isoformat()
+            card = cards.setdefault(key, {
+                'date': when.date(),
+                'event_id': row['event_id'],
+                'title': row['title'],
+                'promotion': row['promotion'],
+                'fights': [],
+            })
+            card['fights'].append({
+                'id': row['id'],
+                'home': row['fighter_1'],
+                'away': row['fighter_2'],
+                'division': row['division'],
+                'date': when.date(),
+                'time': when.time(),
+                'datetime': when,
+            })
+
+        result = sorted(cards.values(), key=lambda card: (card['date'], card['fights'][0]['datetime']))
+        for card in result:
+            card['card_type'] = 'standalone' if len(card['fights']) == 1 else 'multi-fight'
+        return result
+
+    def fights_for_fighter(self, name):
+        """Every stored fight for a fighter (normalized name lookup)"""
+        rows = self.db.execute("""
+            SELECT f.raw FROM fight_fighters ff JOIN fights f ON f.id = ff.fight_id
+            WHERE ff.fighter = ? ORDER BY f.date
+        """, (clean_fighter_name(name),))
+        return [json.loads(row['raw']) for row in rows]
+
+
+def sync(api, store, days=30, past_hours=48):
+    """Pull the moving window [now - past_hours, now + days] of events and upsert it.
+
+    Fights are fetched (one /fights?event_id= call each) only for events
+    that are new or changed, or that have no fights stored yet. Fights
+    that dropped off a refetched card are removed. Returns counts of rows
+    seen and rows changed.
+    """
+    synced_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+    async def pull():
+        return [event async for event in api.aiter_schedule(days=days, past_hours=past_hours)]
+
+    events = asyncio.run(pull())
+
+    stats = {'events': len(events), 'events_changed': 0, 'event_fights_fetched': 0,
+             'fights': 0, 'fights_changed': 0, 'fights_removed': 0}
+    for event in events:
+        if not event.get('id'):
+            continue
+        event_id = str(event['id'])
+        changed = store.event_changed(event)
+        fights = None
+        if changed or not store.event_fight_ids(event_id):
+            fights = api.get_event_fights(event_id, event)
+            if not isinstance(fights, list):
+                # Leave the event unrecorded so the next sync retries its card
+                continue
+            stats['event_fights_fetched'] += 1
+            stats['fights'] += len(fights)
+
+        with store.db:
+            if changed and store.upsert_event(event, synced_at):
+                stats['events_changed'] += 1
+            if fights is None:
+                continue
+            seen = set()
+            for fight in fights:
+                fight = with_event_date(fight, event)
+                seen.add(fight_id(fight))
+                if store.upsert_fight(fight, synced_at, event_id):
+                    stats['fights_changed'] += 1
+            removed = store.event_fight_ids(event_id) - seen
+            store.delete_fights(removed)
+            stats['fights_removed'] += len(removed)
+
+    with store.db:
+        store.set_state('last_sync', synced_at)
+        store.set_state('last_window', json.dumps({'days': days, 'past_hours': past_hours}))
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental boxing schedule sync")
+    parser.add_argument('--store', default=STORE_FILE)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sync_cmd = sub.add_parser('sync', help="Pull the moving window from the API")
+    sync_cmd.add_argument('--days', type=int, default=30)
+    sync_cmd.add_argument('--past-hours', type=int, default=48)
+
+    cards_cmd = sub.add_parser('cards', help="List cards from the local store")
+    cards_cmd.add_argument('start', help="YYYY-MM-DD")
+    cards_cmd.add_argument('end', help="YYYY-MM-DD (exclusive)")
+    cards_cmd.add_argument('--promotion')
+
+    fighter_cmd = sub.add_parser('fighter', help="List stored fights for a fighter")
+    fighter_cmd.add_argument('name')
+
+    export_cmd = sub.add_parser('export', help="Write cards for a date range to a .brcards file")
+    export_cmd.add_argument('start', help="YYYY-MM-DD")
+    export_cmd.add_argument('end', help="YYYY-MM-DD (exclusive)")
+    export_cmd.add_argument('output')
+
+    args = parser.parse_args()
+    store = BoxingStore(args.store)
+
+    if args.command == 'sync':
+        api_key = os.environ.get(API_KEY_ENV)
+        if not api_key:
+            print(f"ERROR: {API_KEY_ENV} is not set (RapidAPI key for boxing-data-api)")
+            store.close()
+            return 1
+        print(f"Syncing next {args.days} days (+{args.past_hours}h back) into {args.store}")
+        stats = sync(BoxingDataAPI(api_key), store, days=args.days, past_hours=args.past_hours)
+        print(f"Events: {stats['events']} seen, {stats['events_changed']} changed")
+        print(f"Fights: {stats['fights']} seen on {stats['event_fights_fetched']} cards, "
+              f"{stats['fights_changed']} changed, {stats['fights_removed']} removed")
+
+    elif args.command == 'cards':
+        for card in store.cards_between(args.start, args.end, args.promotion):
+            title = card['title'] or card['card_type']
+            print(f"\n{card['date']}  {title}  ({len(card['fights'])} fights)")
+            for fight in card['fights']:
+                print(f"  {fight['time']:%H:%M}  {fight['home']} vs {fight['away']}")
+
+    elif args.command == 'fighter':
+        for fight in store.fights_for_fighter(args.name):
+            print(f"{fight.get('date', '')[:10]}  {fight.get('title', '')}")
+
+    elif args.command == 'export':
+        cards = store.cards_between(args.start, args.end)
+        write_card_store(cards, args.output)
+        print(f"Wrote {len(cards)} cards to {args.output}")
+
+    store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,7 @@ Prerequisites:
 """
 
 import json
+import os
 from googleapiclient.discovery import build
 from google.oauth2 import service_account
 
@@ -15,39 +16,14 @@ from google.oauth2 import service_account
 PACKAGE_NAME = 'com.braggingrights.bragging_rights_app'  # Your app's package name
 SERVICE_ACCOUNT_FILE = 'path/to/your/service-account-key.json'  # Download from Google Cloud Console
 
-# In-app products to create
-PRODUCTS = [
-    {
-        'sku': 'br_coins_250',
-        'status': 'active',
-        'purchaseType': 'consumable',
-        'defaultPrice': {
-            'priceMicros': '5000000',
-            'currency': 'USD'
-        },
-        'listings': {
-            'en-US': {
-                'title': '250 BR Coins',
-                'description': 'Get 250 BR Coins to place wagers and join pools'
-            }
-        }
-    },
-    {
-        'sku': 'br_coins_500',
-        'status': 'active', 
-        'purchaseType': 'consumable',
-        'defaultPrice': {
-            'priceMicros': '10000000',
-            'currency': 'USD'
-        },
-        'listings': {
-            'en-US': {
-                'title': '500 BR Coins + 50 Bonus',
-                'description': 'Best value! Get 550 BR Coins total (500 + 50 bonus)'
-            }
-        }
-    }
-]
+# In-app products to create: the BR Coins entries of the shared catalog
+# (iap_catalog.json in the repository root)
+CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'iap_catalog.json')
+with open(CATALOG_FILE, 'r', encoding='utf-8') as f:
+    PRODUCTS = [
+        {key: value for key, value in product.items() if key != 'category'}
+        for product in json.load(f)['products'] if product['category'] == 'coins'
+    ]
 
 def create_iap_products():
     """Create in-app products using Google Play Developer API"""
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Versioned fight card store (replaces october_cards.pkl).
+
+october_cards.pkl was a pickle of dicts holding datetime objects: slow to
+load, unsafe to unpickle from untrusted sources and tied to Python's object
+layout. A .brcards file is plain msgpack, so any language can read it:
+
+    8 bytes   magic b"BRCARDS\\0"
+    4 bytes   header length (big-endian uint32)
+    header    msgpack map {"version", "count", "index": [[date, offset, length], ...]}
+    body      one msgpack map per card, at header-relative offsets
+
+The index is sorted by date, so opening a file only decodes the header;
+each card is decoded on first access. Dates, times and datetimes are
+stored as ISO 8601 strings and turned back into Python objects on load.
+
+Usage:
+    python card_store.py convert october_cards.pkl october_cards.brcards
+    python card_store.py show october_cards.brcards [2025-10-01 2025-11-01]   (end exclusive)
+"""
+
+import bisect
+import mmap
+import os
+import struct
+import sys
+from datetime import date, datetime, time, timedelta
+
+import msgpack
+
+MAGIC = b"BRCARDS\0"
+FORMAT_VERSION = 1
+_HEADER_LEN = struct.Struct(">I")
+
+# Fields holding ISO strings on disk and date/time objects in memory
+_DATE_FIELDS = {'date': date.fromisoformat, 'time': time.fromisoformat, 'datetime': datetime.fromisoformat}
+
+
+def _encode_value(value):
+    if isinstance(value, (date, time, datetime)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {key: _encode_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item) for item in value]
+    return value
+
+
+def _decode_record(record):
+    """Turn ISO strings in known date/time fields back into objects"""
+    for key, parse in _DATE_FIELDS.items():
+        if isinstance(record.get(key), str):
+            record[key] = parse(record[key])
+    for fight in record.get('fights', ()):
+        _decode_record(fight)
+    return record
+
+
+def write_card_store(cards, path):
+    """Write cards (dicts with a 'date' and a 'fights' list) to a .brcards file"""
+    cards = sorted(cards, key=lambda card: card['date'])
+    blobs = [msgpack.packb(_encode_value(card), use_bin_type=True) for card in cards]
+
+    index = []
+    offset = 0
+    for card, blob in zip(cards, blobs):
+        index.append([card['date'].isoformat(), offset, len(blob)])
+        offset += len(blob)
+
+    header = msgpack.packb({'version': FORMAT_VERSION, 'count': len(cards), 'index': index}, use_bin_type=True)
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LEN.pack(len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+
+    os.replace(tmp_path, path)
+
+
+class CardStore:
+    """Read-only, lazily decoded view of a .brcards file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a card store file")
+
+        start = len(MAGIC)
+        (header_len,) = _HEADER_LEN.unpack_from(self._map, start)
+        start += _HEADER_LEN.size
+        header = msgpack.unpackb(self._map[start:start + header_len], raw=False)
+
+        if header.get('version', 0) > FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{path} is card store version {header['version']}, "
+                             f"this reader supports up to {FORMAT_VERSION}")
+
+        self.version = header['version']
+        self._body = start + header_len
+        self._index = header['index']
+        self._dates = [entry[0] for entry in self._index]
+        self._decoded = {}
+
+    def close(self):
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, position):
+        """Decode (once) and return the card at a position in date order"""
+        card = self._decoded.get(position)
+        if card is None:
+            _, offset, length = self._index[position]
+            start = self._body + offset
+            card = _decode_record(msgpack.unpackb(self._map[start:start + length], raw=False))
+            self._decoded[position] = card
+        return card
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+
+    def dates(self):
+        """Card dates in order, without decoding any card"""
+        return [date.fromisoformat(value) for value in self._dates]
+
+    def cards_between(self, start, end):
+        """Cards with start <= date < end (dates or ISO strings), decoding only those.
+
+        The end is exclusive, as in BoxingStore.cards_between.
+        """
+        lo = bisect.bisect_left(self._dates, _iso(start))
+        hi = bisect.bisect_left(self._dates, _iso(end))
+        return [self[position] for position in range(lo, hi)]
+
+    def cards_on(self, day):
+        day = date.fromisoformat(day) if isinstance(day, str) else day
+        return self.cards_between(day, day + timedelta(days=1))
+
+
+def _iso(value):
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def load_cards(path):
+    """All cards from a .brcards file as a list (convenience for small files)"""
+    with CardStore(path) as store:
+        return list(store)
+
+
+def convert_pickle(src, dest):
+    """One-off migration from the legacy pickle (only run on trusted files)"""
+    import pickle
+    with open(src, 'rb') as f:
+        cards = pickle.load(f)
+    write_card_store(cards, dest)
+    return len(cards)
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ('convert', 'show'):
+        print("Usage: python card_store.py convert <cards.pkl> <cards.brcards>")
+        print("       python card_store.py show <cards.brcards> [start end (exclusive)]")
+        return
+
+    if sys.argv[1] == 'convert':
+        count = convert_pickle(sys.argv[2], sys.argv[3])
+        print(f"Wrote {count} cards to {sys.argv[3]}")
+        return
+
+    with CardStore(sys.argv[2]) as store:
+        cards = store.cards_between(sys.argv[3], sys.argv[4]) if len(sys.argv) > 4 else list(store)
+        print(f"{store.path}: version {store.version}, {len(store)} cards")
+        for card in cards:
+            print(f"\n{card['date']}  {card['card_type']}  ({len(card['fights'])} fights)")
+            for fight in card['fights']:
+                print(f"  {fight['time']:%H:%M}  {fight['home']} vs {fight['away']}")
+
+
+if __name__ == "__main__":
+    main()
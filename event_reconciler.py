@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Cross-provider event reconciliation (Odds API <-> ESPN <-> Boxing Data).
+
+Each feed has its own ids:
+    The Odds API    id, commence_time, home_team/away_team   (test_odds_api.py)
+    ESPN            event.id, date, competitors              (test_nba_api.py)
+                    (MMA: one competition.id per bout on the card)
+    Boxing Data     id, date, title "A vs B"                 (boxing_data_api.py)
+
+EventReconciler assigns every provider event a canonical id. Candidates are
+found by bucketing start times into fixed windows and only comparing events
+in the same or adjacent buckets; teams are compared by normalized matchup
+key (team_matcher), fighters by fuzzy name similarity (fighter_matcher).
+
+The provider id -> canonical id mapping is persisted to event_id_map.json,
+so on the next poll cycle already-seen provider ids resolve with a dict
+lookup and skip matching entirely.
+
+Usage:
+    python event_reconciler.py boxing_events.json espn_nba_scoreboard.json ...
+"""
+
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime, timezone
+
+from boxing_data_api import fighter_name
+from fighter_matcher import name_similarity, normalize_fighter_name
+from team_matcher import matchup_key, normalize_team_name
+
+MAP_FILE = 'event_id_map.json'
+
+# Start-time bucket width; candidates come from the same and adjacent buckets
+BUCKET_SECONDS = 6 * 3600
+# Max start-time difference to accept a match. Boxing Data dates are the card
+# start while the Odds API lists the bout itself, so fights get more slack.
+TEAM_TOLERANCE_SECONDS = 3 * 3600
+FIGHT_TOLERANCE_SECONDS = 12 * 3600
+FIGHTER_THRESHOLD = 0.9
+
+
+def parse_time(value):
+    """ISO 8601 (with 'Z' or offset, ESPN's minute precision too) -> aware UTC datetime"""
+    if not value:
+        return None
+    value = value.replace('Z', '+00:00')
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def odds_event(game):
+    """Normalize an Odds API game"""
+    kind = 'fight' if game.get('sport_key', '').startswith(('boxing', 'mma')) else 'team'
+    return {
+        'provider': 'odds',
+        'id': str(game['id']),
+        'start': parse_time(game.get('commence_time')),
+        'participants': (game.get('home_team', ''), game.get('away_team', '')),
+        'kind': kind,
+    }
+
+
+def _espn_competition(event_id, event, competition):
+    competitors = competition.get('competitors', [])
+    names = []
+    kind = 'team'
+    for competitor in competitors[:2]:
+        if competitor.get('athlete'):
+            kind = 'fight'
+            names.append(competitor['athlete'].get('displayName', ''))
+        else:
+            names.append(competitor.get('team', {}).get('displayName', ''))
+
+    # ESPN lists home first in team sports only via homeAway
+    if kind == 'team' and competitors and competitors[0].get('homeAway') == 'away':
+        names.reverse()
+
+    return {
+        'provider': 'espn',
+        'id': event_id,
+        'start': parse_time(competition.get('date') or event.get('date')),
+        'participants': tuple(names),
+        'kind': kind,
+    }
+
+
+def espn_events(event):
+    """Normalize an ESPN scoreboard event: one record for a team game, one per bout for an MMA card"""
+    competitions = event.get('competitions') or [{}]
+    first = _espn_competition(str(event['id']), event, competitions[0])
+    if first['kind'] != 'fight':
+        return [first]
+    # Every bout on a card is its own competition (and its own betting event)
+    return [_espn_competition(str(competition.get('id') or f"{event['id']}-{i}"), event, competition)
+            for i, competition in enumerate(competitions)]
+
+
+def boxing_data_event(event):
+    """Normalize a Boxing Data API event or fight"""
+    fighters = event.get('fighters')
+    if fighters:
+        names = (fighter_name(fighters.get('fighter_1')), fighter_name(fighters.get('fighter_2')))
+    else:
+        parts = event.get('title', '').split(' vs ')
+        names = (parts[0].strip(), parts[1].split(':')[0].strip()) if len(parts) >= 2 else ()
+
+    return {
+        'provider': 'boxing_data',
+        'id': str(event['id']),
+        'start': parse_time(event.get('date')),
+        'participants': names,
+        'kind': 'fight',
+    }
+
+
+class EventReconciler:
+    """Assigns canonical ids to provider events and remembers the mapping"""
+
+    def __init__(self, path=MAP_FILE):
+        self.path = path
+        self.provider_map = {}   # "provider:id" -> canonical id
+        self.canonical = {}      # canonical id -> record
+        self._buckets = {}       # bucket -> [canonical ids]
+        self._team_keys = {}     # (bucket, matchup key) -> canonical id
+        self.stats = {'cached': 0, 'matched': 0, 'created': 0, 'skipped': 0}
+        self.load()
+
+    # Persistence ---------------------------------------------------------
+
+    def load(self):
+        """Load the persisted mapping and rebuild the in-memory indexes"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            data = json.load(f)
+        self.provider_map = data.get('providers', {})
+        for canonical_id, record in data.get('canonical', {}).items():
+            record['start'] = parse_time(record['start'])
+            record['participants'] = tuple(record['participants'])
+            self._index(canonical_id, record)
+
+    def save(self):
+        """Write the mapping atomically"""
+        canonical = {}
+        for canonical_id, record in self.canonical.items():
+            canonical[canonical_id] = dict(record, start=record['start'].isoformat())
+        data = {'version': 1, 'providers': self.provider_map, 'canonical': canonical}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'), sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    # Indexing ------------------------------------------------------------
+
+    @staticmethod
+    def _bucket(start):
+        return int(start.timestamp()) // BUCKET_SECONDS
+
+    def _normalized(self, kind, participants):
+        if kind == 'team':
+            return tuple(normalize_team_name(name) for name in participants)
+        return tuple(normalize_fighter_name(name) for name in participants)
+
+    def _index(self, canonical_id, record):
+        self.canonical[canonical_id] = record
+        bucket = self._bucket(record['start'])
+        self._buckets.setdefault(bucket, []).append(canonical_id)
+        if record['kind'] == 'team' and len(record['participants']) == 2:
+            key = matchup_key(*self._normalized('team', record['participants']))
+            self._team_keys[(bucket, key)] = canonical_id
+
+    # Matching ------------------------------------------------------------
+
+    def _find(self, event):
+        bucket = self._bucket(event['start'])
+        normalized = self._normalized(event['kind'], event['participants'])
+
+        if event['kind'] == 'team':
+            key = matchup_key(*normalized)
+            for b in (bucket, bucket - 1, bucket + 1):
+                canonical_id = self._team_keys.get((b, key))
+                if canonical_id and self._within(event, canonical_id, TEAM_TOLERANCE_SECONDS):
+                    return canonical_id
+            return None
+
+        # Fights: fuzzy compare against the handful of events near this time
+        best_id, best_score = None, 0.0
+        reach = FIGHT_TOLERANCE_SECONDS // BUCKET_SECONDS + 1
+        for b in range(bucket - reach, bucket + reach + 1):
+            for canonical_id in self._buckets.get(b, ()):
+                record = self.canonical[canonical_id]
+                if record['kind'] != 'fight' or not self._within(event, canonical_id, FIGHT_TOLERANCE_SECONDS):
+                    continue
+                a1, a2 = normalized
+                b1, b2 = self._normalized('fight', record['participants'])
+                score = max(min(name_similarity(a1, b1), name_similarity(a2, b2)),
+                            min(name_similarity(a1, b2), name_similarity(a2, b1)))
+                if score >= FIGHTER_THRESHOLD and score > best_score:
+                    best_id, best_score = canonical_id, score
+        return best_id
+
+    def _within(self, event, canonical_id, tolerance):
+        delta = abs((event['start'] - self.canonical[canonical_id]['start']).total_seconds())
+        return delta <= tolerance
+
+    def _new_canonical_id(self, event):
+        normalized = sorted(self._normalized(event['kind'], event['participants']))
+        seed = f"{event['start'].date().isoformat()}|{'|'.join(normalized)}"
+        return hashlib.sha1(seed.encode('utf-8')).hexdigest()[:16]
+
+    def resolve(self, event):
+        """Canonical id for one normalized provider event (None if unusable)"""
+        provider_key = f"{event['provider']}:{event['id']}"
+        canonical_id = self.provider_map.get(provider_key)
+        if canonical_id:
+            self.stats['cached'] += 1
+            return canonical_id
+
+        if not event['start'] or len(event['participants']) != 2 or not all(event['participants']):
+            self.stats['skipped'] += 1
+            return None
+
+        canonical_id = self._find(event)
+        if canonical_id:
+            self.stats['matched'] += 1
+        else:
+            canonical_id = self._new_canonical_id(event)
+            if canonical_id in self.canonical:
+                self.stats['matched'] += 1
+            else:
+                self._index(canonical_id, {
+                    'start': event['start'],
+                    'participants': tuple(event['participants']),
+                    'kind': event['kind'],
+                    'ids': {},
+                })
+                self.stats['created'] += 1
+
+        self.canonical[canonical_id]['ids'][event['provider']] = event['id']
+        self.provider_map[provider_key] = canonical_id
+        return canonical_id
+
+    def reconcile(self, events):
+        """Resolve a batch of normalized events; returns {provider key: canonical id}"""
+        return {f"{event['provider']}:{event['id']}": self.resolve(event) for event in events}
+
+    def ids_for(self, canonical_id):
+        """Provider ids known for a canonical event, e.g. {'odds': ..., 'espn': ...}"""
+        record = self.canonical.get(canonical_id)
+        return dict(record['ids']) if record else {}
+
+
+def load_feed(path):
+    """Detect a saved feed's provider from its shape and normalize its events"""
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict) and 'events' in data:
+        return [record for event in data['events'] for record in espn_events(event)]
+    if isinstance(data, list) and data and 'commence_time' in data[0]:
+        return [odds_event(game) for game in data]
+    if isinstance(data, list):
+        return [boxing_data_event(event) for event in data]
+    return []
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python event_reconciler.py <feed.json> [feed.json ...]")
+        return
+
+    reconciler = EventReconciler()
+
+    print("=" * 60)
+    print("Cross-Provider Event Reconciliation")
+    print("=" * 60)
+
+    for path in sys.argv[1:]:
+        events = load_feed(path)
+        reconciler.reconcile(events)
+        print(f"  {path:<35} {len(events):>4} events")
+
+    reconciler.save()
+
+    linked = sum(1 for record in reconciler.canonical.values() if len(record['ids']) > 1)
+    print(f"\nCanonical events: {len(reconciler.canonical)} ({linked} linked across providers)")
+    print(f"Resolved: {reconciler.stats}")
+    print(f"Saved mapping to {reconciler.path}")
+
+
+if __name__ == "__main__":
+    main()
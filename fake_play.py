@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+In-memory stand-in for the androidpublisher v3 inappproducts API.
+
+Catalog tooling otherwise only runs against the real Play Console, which
+is slow, rate-limited and risky to experiment on. FakeAndroidPublisher
+mirrors the surface the product scripts use:
+
+    service.inappproducts().list(packageName, token=None, maxResults=None).execute()
+    service.inappproducts().insert(packageName, body).execute()
+    service.inappproducts().update(packageName, sku, body, autoConvertMissingPrices=None).execute()
+    service.inappproducts().batchUpdate(packageName, body).execute()
+
+and can be told to misbehave:
+
+    latency         seconds per call (or a callable returning seconds)
+    transient_rate  share of calls failing with 503
+    rate_limit      calls per second before answering 429
+    bad_skus        SKUs always rejected with a 400 naming them
+    drop_rate       share of batchUpdate items silently left out of the response
+
+execute(http=...) is accepted like HttpRequest.execute; with
+require_http=True, a call without one fails, and http_threads records
+which threads each http object was used from (an httplib2.Http must stay
+on one thread).
+
+Errors are FakeHttpError, which has the resp.status / content attributes
+of googleapiclient's HttpError, so callers handle both the same way.
+"""
+
+import copy
+import json
+import random
+import threading
+import time
+
+PAGE_SIZE = 100
+BATCH_LIMIT = 100
+
+
+class FakeHttpError(Exception):
+    """Looks like googleapiclient.errors.HttpError to error handling code"""
+
+    class _Response(dict):
+        def __init__(self, status):
+            super().__init__(status=str(status))
+            self.status = status
+            self.reason = 'fake'
+
+    def __init__(self, status, message):
+        super().__init__(f"<HttpError {status}: {message}>")
+        self.resp = self._Response(status)
+        self.content = json.dumps({'error': {'code': status, 'message': message}}).encode('utf-8')
+
+
+class _Request:
+    """Deferred call, like googleapiclient's HttpRequest"""
+
+    def __init__(self, service, handler, *args):
+        self._service = service
+        self._handler = handler
+        self._args = args
+
+    def execute(self, http=None, num_retries=0):
+        return self._service._call(self._handler, *self._args, http=http)
+
+
+class _InappProducts:
+    def __init__(self, service):
+        self._service = service
+
+    def list(self, packageName, token=None, maxResults=None, startIndex=None):
+        return _Request(self._service, self._service._list, packageName, token, maxResults)
+
+    def get(self, packageName, sku):
+        return _Request(self._service, self._service._get, packageName, sku)
+
+    def insert(self, packageName, body, autoConvertMissingPrices=None):
+        return _Request(self._service, self._service._insert, packageName, body)
+
+    def update(self, packageName, sku, body, autoConvertMissingPrices=None, allowMissing=None):
+        return _Request(self._service, self._service._update, packageName, sku, body, bool(allowMissing))
+
+    def batchUpdate(self, packageName, body):
+        return _Request(self._service, self._service._batch_update, packageName, body)
+
+
+class FakeAndroidPublisher:
+    """Thread-safe fake androidpublisher service holding products in memory"""
+
+    def __init__(self, products=(), latency=0.0, transient_rate=0.0, rate_limit=None,
+                 bad_skus=(), drop_rate=0.0, seed=None, require_http=False):
+        self.products = {}
+        for product in products:
+            self.products[product['sku']] = copy.deepcopy(product)
+        self.latency = latency
+        self.transient_rate = transient_rate
+        self.rate_limit = rate_limit
+        self.bad_skus = set(bad_skus)
+        self.drop_rate = drop_rate
+        self.require_http = require_http
+        self.http_threads = {}   # id(http) -> thread idents it was used from
+        self.calls = {'list': 0, 'get': 0, 'insert': 0, 'update': 0, 'batchUpdate': 0}
+        self.errors = {429: 0, 400: 0, 404: 0, 409: 0, 503: 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window = []
+
+    def inappproducts(self):
+        return _InappProducts(self)
+
+    # Plumbing ------------------------------------------------------------
+
+    def _fail(self, status, message):
+        with self._lock:
+            self.errors[status] = self.errors.get(status, 0) + 1
+        raise FakeHttpError(status, message)
+
+    def _call(self, handler, *args, http=None):
+        name = handler.__name__.lstrip('_').replace('batch_update', 'batchUpdate')
+        if http is None and self.require_http:
+            raise RuntimeError(f"{name} executed on the shared service http")
+        if http is not None:
+            with self._lock:
+                self.http_threads.setdefault(id(http), set()).add(threading.get_ident())
+        delay = self.latency() if callable(self.latency) else self.latency
+        if delay:
+            time.sleep(delay)
+
+        with self._lock:
+            self.calls[name] += 1
+            now = time.monotonic()
+            limited = False
+            if self.rate_limit:
+                self._window = [stamp for stamp in self._window if now - stamp < 1.0]
+                limited = len(self._window) >= self.rate_limit
+                if not limited:
+                    self._window.append(now)
+            transient = self._rng.random() < self.transient_rate
+
+        if limited:
+            self._fail(429, "Rate limit exceeded")
+        if transient:
+            self._fail(503, "Backend error")
+        return handler(*args)
+
+    def _check(self, body):
+        if body.get('sku') in self.bad_skus:
+            self._fail(400, f"Invalid product {body['sku']}: listing rejected")
+
+    def _store(self, body):
+        product = copy.deepcopy(body)
+        product.pop('packageName', None)
+        with self._lock:
+            self.products[product['sku']] = product
+        return copy.deepcopy(product)
+
+    # Endpoints -----------------------------------------------------------
+
+    def _list(self, package_name, token, max_results):
+        with self._lock:
+            skus = sorted(self.products)
+            start = int(token) if token else 0
+            size = max_results or PAGE_SIZE
+            page = [copy.deepcopy(self.products[sku]) for sku in skus[start:start + size]]
+        result = {'kind': 'androidpublisher#inappproductsListResponse', 'inappproduct': page}
+        if start + size < len(skus):
+            result['tokenPagination'] = {'nextPageToken': str(start + size)}
+        return result
+
+    def _get(self, package_name, sku):
+        with self._lock:
+            product = self.products.get(sku)
+        if product is None:
+            self._fail(404, f"Product {sku} not found")
+        return copy.deepcopy(product)
+
+    def _insert(self, package_name, body):
+        self._check(body)
+        with self._lock:
+            exists = body['sku'] in self.products
+        if exists:
+            self._fail(409, f"Product {body['sku']} already exists")
+        return self._store(body)
+
+    def _update(self, package_name, sku, body, allow_missing):
+        self._check(dict(body, sku=sku))
+        with self._lock:
+            existing = self.products.get(sku)
+        if existing is None and not allow_missing:
+            self._fail(404, f"Product {sku} not found")
+        merged = dict(existing or {}, **body)
+        merged['sku'] = sku
+        if existing and existing.get('purchaseType'):
+            merged['purchaseType'] = existing['purchaseType']
+        return self._store(merged)
+
+    def _batch_update(self, package_name, body):
+        requests = body.get('requests', [])
+        if len(requests) > BATCH_LIMIT:
+            self._fail(400, f"Too many requests in batch: {len(requests)} > {BATCH_LIMIT}")
+        # The real API validates the whole batch before applying any of it
+        for request in requests:
+            self._check(request['inappproduct'])
+
+        updated = []
+        for request in requests:
+            product = request['inappproduct']
+            result = self._update(package_name, request.get('sku', product['sku']), product,
+                                  request.get('allowMissing', False))
+            with self._lock:
+                dropped = self._rng.random() < self.drop_rate
+            if not dropped:
+                updated.append(result)
+        return {'kind': 'androidpublisher#inappproductsBatchUpdateResponse', 'inappproducts': updated}
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Fight-card grouping over flat fight lists.
+
+Both ESPN (competitions under an event) and the boxing data provider
+(/fights?event_id=) can hand us a flat list of bouts. This groups them into
+cards keyed by (card date, venue, promotion), in the same shape as
+october_cards.brcards:
+
+    {'date', 'venue', 'promotion', 'card_type': 'standalone' | 'multi-fight',
+     'fights': [{'id', 'home', 'away', 'date', 'time', 'datetime'}, ...]}
+
+Bouts at the same venue and promotion belong to one card while each
+starts within CARD_GAP of the one before. Grouping on the calendar date
+would split a US evening card that runs past midnight UTC; the card date
+is its first bout's.
+
+group_fights sorts once by (venue, start time) and splits runs, so a full
+rebuild is O(n log n). CardGrouper keeps the cards between calls and
+merges newly arrived fights into only the venues they touch, so the
+calendar does not have to be regrouped when a few fights are announced.
+
+Usage:
+    python fight_card_grouping.py espn_ufc_scoreboard.json [more.json ...]
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from itertools import groupby
+
+from boxing_data_api import fighter_name
+from name_normalization import clean_team_name
+
+# Longest gap between consecutive bouts on one card
+CARD_GAP = timedelta(hours=6)
+
+
+def _parse_datetime(value):
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def fight_from_boxing_data(fight):
+    """Flat fight from a Boxing Data /fights record"""
+    fighters = fight.get('fighters', {})
+    event = fight.get('event') or {}
+    return {
+        'id': str(fight.get('id', '')),
+        'home': fighter_name(fighters.get('fighter_1')),
+        'away': fighter_name(fighters.get('fighter_2')),
+        'datetime': _parse_datetime(fight['date']),
+        'venue': fight.get('venue') or '',
+        'promotion': event.get('promotion') or '',
+    }
+
+
+def fights_from_espn(data):
+    """Flat fights from an ESPN MMA scoreboard payload"""
+    promotion = (data.get('leagues') or [{}])[0].get('abbreviation', '')
+    fights = []
+    for event in data.get('events', []):
+        for comp in event.get('competitions', []):
+            competitors = comp.get('competitors', [])
+            if len(competitors) != 2 or not (comp.get('date') or event.get('date')):
+                continue
+            fights.append({
+                'id': str(comp.get('id', '')),
+                'home': competitors[0].get('athlete', {}).get('displayName', ''),
+                'away': competitors[1].get('athlete', {}).get('displayName', ''),
+                'datetime': _parse_datetime(comp.get('date') or event['date']),
+                'venue': comp.get('venue', {}).get('fullName', ''),
+                'promotion': promotion,
+            })
+    return fights
+
+
+def venue_key(fight):
+    """(venue, promotion) with names normalized so spelling drift doesn't split cards"""
+    return (clean_team_name(fight.get('venue') or ''),
+            clean_team_name(fight.get('promotion') or ''))
+
+
+def card_key(card):
+    """(card date, venue, promotion); the card date is its first bout's"""
+    return (card['date'],) + venue_key(card['fights'][0])
+
+
+def _fight_order(fight):
+    return fight['datetime'], fight.get('id') or ''
+
+
+def _card_order(card):
+    return card['date'], card['fights'][0]['datetime']
+
+
+def _finish_fight(fight):
+    """Add the date/time convenience fields october_cards carried"""
+    fight['date'] = fight['datetime'].date()
+    fight['time'] = fight['datetime'].time()
+    return fight
+
+
+def _new_card(fights):
+    return {
+        'date': fights[0]['date'],
+        'venue': fights[0].get('venue') or '',
+        'promotion': fights[0].get('promotion') or '',
+        'card_type': 'standalone' if len(fights) == 1 else 'multi-fight',
+        'fights': fights,
+    }
+
+
+def _chain(fights):
+    """Split time-ordered fights at one venue into cards wherever bouts are more than CARD_GAP apart"""
+    cards, run = [], []
+    for fight in fights:
+        if run and fight['datetime'] - run[-1]['datetime'] > CARD_GAP:
+            cards.append(_new_card(run))
+            run = []
+        run.append(fight)
+    if run:
+        cards.append(_new_card(run))
+    return cards
+
+
+def group_fights(fights):
+    """Group a flat fight list into cards (one sort, one pass)"""
+    ordered = sorted((_finish_fight(dict(fight)) for fight in fights),
+                     key=lambda fight: (venue_key(fight), _fight_order(fight)))
+    cards = []
+    for _, group in groupby(ordered, key=venue_key):
+        cards.extend(_chain(list(group)))
+    cards.sort(key=_card_order)
+    return cards
+
+
+class CardGrouper:
+    """Cards kept between updates; new fights only regroup their own venue"""
+
+    def __init__(self, fights=()):
+        self._venues = {}        # venue key -> fights in start order
+        self._cards = {}         # card key -> card
+        self._venue_cards = {}   # venue key -> card keys
+        self._fight_venues = {}  # fight id -> venue key, to move rescheduled fights
+        self.add_fights(fights)
+
+    def add_fights(self, fights):
+        """Merge fights in (new, or updated by id); returns the set of card keys changed"""
+        touched = set()
+        for fight in fights:
+            fight = _finish_fight(dict(fight))
+            fight_id = fight.get('id')
+            key = venue_key(fight)
+
+            if fight_id and fight_id in self._fight_venues:
+                touched.add(self._remove(fight_id))
+
+            self._venues.setdefault(key, []).append(fight)
+            if fight_id:
+                self._fight_venues[fight_id] = key
+            touched.add(key)
+
+        changed = set()
+        for key in touched:
+            # One sort per touched venue; the already-ordered runs make it near linear
+            if key in self._venues:
+                self._venues[key].sort(key=_fight_order)
+            changed |= self._regroup(key)
+        return changed
+
+    def _remove(self, fight_id):
+        key = self._fight_venues.pop(fight_id)
+        self._venues[key] = [f for f in self._venues[key] if f.get('id') != fight_id]
+        return key
+
+    def _regroup(self, key):
+        """Re-chain one venue's fights into cards; returns the card keys that differ"""
+        old = {card_key: self._cards.pop(card_key) for card_key in self._venue_cards.pop(key, [])}
+        fights = self._venues.get(key)
+        if not fights:
+            self._venues.pop(key, None)
+            return set(old)
+
+        new = {card_key(card): card for card in _chain(fights)}
+        self._cards.update(new)
+        self._venue_cards[key] = list(new)
+        return {k for k in old.keys() | new.keys()
+                if k not in old or k not in new or old[k]['fights'] != new[k]['fights']}
+
+    def cards(self):
+        """All cards in calendar order"""
+        return sorted(self._cards.values(), key=_card_order)
+
+    def __len__(self):
+        return len(self._cards)
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python fight_card_grouping.py <espn_payload.json> [more.json ...]")
+        return
+
+    fights = []
+    for path in sys.argv[1:]:
+        with open(path, 'r', encoding='utf-8') as f:
+            fights.extend(fights_from_espn(json.load(f)))
+
+    cards = group_fights(fights)
+    print(f"Grouped {len(fights)} fights into {len(cards)} cards")
+    for card in cards:
+        print(f"\n{card['date']}  {card['promotion']}  {card['venue']}  "
+              f"{card['card_type']} ({len(card['fights'])} fights)")
+        for fight in card['fights']:
+            print(f"  {fight['time']:%H:%M}  {fight['home']} vs {fight['away']}")
+
+
+if __name__ == "__main__":
+    main()
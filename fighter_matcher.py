@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Fuzzy fighter name matcher for joining fight cards across providers.
+
+The boxing data provider (october_cards.brcards `home`/`away`) and ESPN
+(`athlete.displayName`, see test_espn_fight_order.py) spell fighters
+differently: accents, quoted nicknames, transliterations, name order.
+
+FighterIndex keeps a character-trigram inverted index, so a lookup only
+scores names that share enough trigrams with the query, and ranks those
+candidates with Jaro-Winkler. match_fights joins two whole fight lists in
+bulk by requiring both fighters of a bout to match.
+
+Usage:
+    python fighter_matcher.py espn_mma.json            # join against october_cards.brcards
+"""
+
+import json
+import sys
+
+from card_store import load_cards
+from name_normalization import clean_fighter_name
+
+# Scores below this are treated as different people
+MATCH_THRESHOLD = 0.88
+# A candidate must share at least this fraction of the query's trigrams
+MIN_TRIGRAM_OVERLAP = 0.3
+
+
+# Kept under the old name for callers (event_reconciler)
+normalize_fighter_name = clean_fighter_name
+
+
+def trigrams(name):
+    """Padded character trigrams of a normalized name"""
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def jaro_winkler(a, b, prefix_scale=0.1):
+    """Jaro-Winkler similarity in [0, 1]"""
+    if a == b:
+        return 1.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+
+    window = max(max(len_a, len_b) // 2 - 1, 0)
+    matched_a = [False] * len_a
+    matched_b = [False] * len_b
+    matches = 0
+
+    for i, ch in enumerate(a):
+        start = max(0, i - window)
+        end = min(i + window + 1, len_b)
+        for j in range(start, end):
+            if not matched_b[j] and b[j] == ch:
+                matched_a[i] = matched_b[j] = True
+                matches += 1
+                break
+
+    if not matches:
+        return 0.0
+
+    transpositions = 0
+    j = 0
+    for i in range(len_a):
+        if matched_a[i]:
+            while not matched_b[j]:
+                j += 1
+            if a[i] != b[j]:
+                transpositions += 1
+            j += 1
+
+    m = float(matches)
+    jaro = (m / len_a + m / len_b + (m - transpositions / 2) / m) / 3
+
+    prefix = 0
+    for ca, cb in zip(a[:4], b[:4]):
+        if ca != cb:
+            break
+        prefix += 1
+
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+def name_similarity(a, b):
+    """Similarity of two normalized names, tolerant of first/last name order"""
+    score = jaro_winkler(a, b)
+    if score < 1.0:
+        sorted_a = ' '.join(sorted(a.split()))
+        sorted_b = ' '.join(sorted(b.split()))
+        score = max(score, jaro_winkler(sorted_a, sorted_b))
+    return score
+
+
+class FighterIndex:
+    """Trigram inverted index over fighter names"""
+
+    def __init__(self, normalize=normalize_fighter_name):
+        self.normalize = normalize
+        self.names = []          # normalized name per entry
+        self.payloads = []       # caller data per entry
+        self._exact = {}         # normalized name -> [entry ids]
+        self._grams = {}         # trigram -> [entry ids]
+
+    def add(self, name, payload=None):
+        """Index one name; returns its entry id"""
+        normalized = self.normalize(name)
+        entry_id = len(self.names)
+        self.names.append(normalized)
+        self.payloads.append(payload if payload is not None else name)
+        self._exact.setdefault(normalized, []).append(entry_id)
+        for gram in trigrams(normalized):
+            self._grams.setdefault(gram, []).append(entry_id)
+        return entry_id
+
+    def __len__(self):
+        return len(self.names)
+
+    def candidates(self, normalized):
+        """Entry ids sharing enough trigrams with a normalized query"""
+        grams = trigrams(normalized)
+        counts = {}
+        for gram in grams:
+            for entry_id in self._grams.get(gram, ()):
+                counts[entry_id] = counts.get(entry_id, 0) + 1
+        needed = max(1, int(len(grams) * MIN_TRIGRAM_OVERLAP))
+        return [entry_id for entry_id, shared in counts.items() if shared >= needed]
+
+    def search(self, name, threshold=MATCH_THRESHOLD):
+        """All (score, entry_id) above threshold, best first"""
+        normalized = self.normalize(name)
+        exact = self._exact.get(normalized)
+        if exact:
+            return [(1.0, entry_id) for entry_id in exact]
+
+        scored = []
+        for entry_id in self.candidates(normalized):
+            score = name_similarity(normalized, self.names[entry_id])
+            if score >= threshold:
+                scored.append((score, entry_id))
+        scored.sort(reverse=True)
+        return scored
+
+    def best(self, name, threshold=MATCH_THRESHOLD):
+        """(score, payload) for the best match, or (0.0, None)"""
+        results = self.search(name, threshold)
+        if not results:
+            return 0.0, None
+        score, entry_id = results[0]
+        return score, self.payloads[entry_id]
+
+
+def match_fights(left, right, threshold=MATCH_THRESHOLD):
+    """Join two fight lists on their fighter pairs, in either corner order.
+
+    Each fight is a dict with 'home' and 'away' names. Returns a list of
+    (left_fight, right_fight, score) where score is the weaker of the two
+    fighter scores; unmatched left fights get (fight, None, 0.0).
+    """
+    index = FighterIndex()
+    for position, fight in enumerate(right):
+        index.add(fight.get('home', ''), position)
+        index.add(fight.get('away', ''), position)
+
+    used = set()
+    results = []
+    for fight in left:
+        home_hits = {}
+        for score, entry_id in index.search(fight.get('home', ''), threshold):
+            position = index.payloads[entry_id]
+            home_hits[position] = max(score, home_hits.get(position, 0.0))
+
+        best_position, best_score = None, 0.0
+        if home_hits:
+            for score, entry_id in index.search(fight.get('away', ''), threshold):
+                position = index.payloads[entry_id]
+                if position in home_hits and position not in used:
+                    pair_score = min(score, home_hits[position])
+                    if pair_score > best_score:
+                        best_position, best_score = position, pair_score
+
+        if best_position is None:
+            results.append((fight, None, 0.0))
+        else:
+            used.add(best_position)
+            results.append((fight, right[best_position], best_score))
+    return results
+
+
+def espn_fights(data):
+    """Flatten an ESPN MMA scoreboard/fightcenter payload into home/away fights"""
+    competitions = []
+    for event in data.get('events', []):
+        competitions.extend(event.get('competitions', []))
+    for card in data.get('cards', []):
+        competitions.extend(card.get('competitions', []))
+
+    fights = []
+    for comp in competitions:
+        competitors = comp.get('competitors', [])
+        if len(competitors) != 2:
+            continue
+        fights.append({
+            'id': comp.get('id'),
+            'home': competitors[0].get('athlete', {}).get('displayName', ''),
+            'away': competitors[1].get('athlete', {}).get('displayName', ''),
+        })
+    return fights
+
+
+def card_fights(cards):
+    """Flatten card_store cards into a fight list"""
+    return [fight for card in cards for fight in card.get('fights', [])]
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python fighter_matcher.py <espn_payload.json> [cards.brcards]")
+        return
+
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        right = espn_fights(json.load(f))
+
+    cards_path = sys.argv[2] if len(sys.argv) > 2 else 'october_cards.brcards'
+    left = card_fights(load_cards(cards_path))
+
+    print(f"Joining {len(left)} provider fights against {len(right)} ESPN fights")
+    print("=" * 60)
+
+    matched = 0
+    for fight, other, score in match_fights(left, right):
+        if other:
+            matched += 1
+            print(f"[{score:.2f}] {fight['home']} vs {fight['away']}  <->  {other['home']} vs {other['away']}")
+        else:
+            print(f"[ -- ] {fight['home']} vs {fight['away']}")
+
+    print("=" * 60)
+    print(f"Matched {matched}/{len(left)} fights")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Generate the team alias table used by team_matcher.normalize_team_name.
+
+Pulls every league's ESPN `/teams` payload (same shape fetch_mlb_teams in
+test_mlb_logo_integration.py reads) and maps each team's displayName,
+shortDisplayName, location, nickname and abbreviation to one canonical
+name. Matching then becomes a single table lookup for every league instead
+of a growing chain of hard-coded `if` rules.
+
+Aliases that point at more than one team inside a league (e.g. "los angeles"
+for the Lakers and Clippers) are never guessed: they are kept as null
+markers, so team_matcher also treats them as ambiguous across leagues
+("new york" is the Knicks in the NBA table but two NFL teams).
+
+Usage:
+    python generate_team_aliases.py                 # all leagues, from ESPN
+    python generate_team_aliases.py --league nba    # one league
+    python generate_team_aliases.py --fixtures espn_nba_scoreboard.json ...
+"""
+
+import argparse
+import json
+import urllib.request
+from datetime import datetime, timezone
+
+from team_matcher import ALIAS_FILE, clean_team_name
+
+TEAMS_URL = "https://site.api.espn.com/apis/site/v2/sports/{sport}/{league}/teams?limit=500"
+
+# Table key -> (ESPN sport, ESPN league slug)
+LEAGUES = {
+    'nba': ('basketball', 'nba'),
+    'wnba': ('basketball', 'wnba'),
+    'nfl': ('football', 'nfl'),
+    'mlb': ('baseball', 'mlb'),
+    'nhl': ('hockey', 'nhl'),
+    'epl': ('soccer', 'eng.1'),
+    'laliga': ('soccer', 'esp.1'),
+    'mls': ('soccer', 'usa.1'),
+}
+
+# ESPN league slug -> table key, for scoreboard fixtures
+SLUG_TO_KEY = {slug: key for key, (_, slug) in LEAGUES.items()}
+
+
+def fetch_teams(sport, league):
+    """Fetch team objects from an ESPN teams endpoint"""
+    url = TEAMS_URL.format(sport=sport, league=league)
+    with urllib.request.urlopen(url, timeout=15) as response:
+        data = json.loads(response.read())
+    teams = data.get('sports', [{}])[0].get('leagues', [{}])[0].get('teams', [])
+    return [team_data.get('team', {}) for team_data in teams]
+
+
+def teams_from_fixture(path):
+    """Read (table key, team objects) from a saved ESPN scoreboard fixture"""
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    slug = data.get('leagues', [{}])[0].get('slug', '')
+    teams = []
+    for event in data.get('events', []):
+        for comp in event.get('competitions', []):
+            for competitor in comp.get('competitors', []):
+                if competitor.get('team'):
+                    teams.append(competitor['team'])
+    return SLUG_TO_KEY.get(slug, slug), teams
+
+
+def team_aliases(team):
+    """Every name a provider might use for one ESPN team"""
+    location = team.get('location', '')
+    nickname = team.get('name', '') or team.get('nickname', '')
+    abbreviation = team.get('abbreviation', '')
+
+    names = [
+        team.get('displayName', ''),
+        team.get('shortDisplayName', ''),
+        team.get('nickname', ''),
+        location,
+        nickname,
+        abbreviation,
+        f"{location} {nickname}",
+        f"{abbreviation} {nickname}",
+    ]
+    return {clean_team_name(name) for name in names if name and name.strip()}
+
+
+def build_league_table(teams):
+    """alias -> canonical name for one league; ambiguous aliases map to None"""
+    candidates = {}
+    for team in teams:
+        canonical = clean_team_name(team.get('displayName', ''))
+        if not canonical:
+            continue
+        for alias in team_aliases(team):
+            candidates.setdefault(alias, set()).add(canonical)
+
+    table = {}
+    for alias, canonicals in candidates.items():
+        if len(canonicals) > 1:
+            table[alias] = None
+            continue
+        canonical = next(iter(canonicals))
+        # Identity entries are implied by the lookup fallback; don't store them
+        if alias != canonical:
+            table[alias] = canonical
+    return dict(sorted(table.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate team_aliases.json from ESPN teams endpoints")
+    parser.add_argument('--league', action='append', choices=sorted(LEAGUES),
+                        help="League to include (repeatable, default: all)")
+    parser.add_argument('--fixtures', nargs='*', default=[],
+                        help="Build from saved scoreboard JSON files instead of the network")
+    parser.add_argument('--output', default=ALIAS_FILE)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Team Alias Table Generator")
+    print("=" * 60)
+
+    teams_by_league = {}
+    if args.fixtures:
+        for path in args.fixtures:
+            key, teams = teams_from_fixture(path)
+            teams_by_league.setdefault(key, []).extend(teams)
+    else:
+        for key in args.league or sorted(LEAGUES):
+            sport, league = LEAGUES[key]
+            try:
+                teams_by_league[key] = fetch_teams(sport, league)
+            except Exception as e:
+                print(f"  [FAIL] {key}: {e}")
+
+    leagues = {}
+    for key, teams in sorted(teams_by_league.items()):
+        leagues[key] = build_league_table(teams)
+        ambiguous = sum(1 for canonical in leagues[key].values() if canonical is None)
+        print(f"  {key:<8} {len(teams):>3} teams  {len(leagues[key]) - ambiguous:>4} aliases  {ambiguous:>3} ambiguous")
+
+    table = {
+        'version': 1,
+        'generated': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'leagues': leagues,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(table, f, separators=(',', ':'), sort_keys=True)
+
+    print(f"\nSaved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Line-movement and steam detection over the odds history store.
+
+test_odds_api only shows the latest sample game, so there is no way to
+see that a line moved sharply before kickoff. This works on everything in
+odds_history/ at once, as flat NumPy arrays with one row per snapshot:
+
+    series   one (game, outcome, bookmaker) line
+    t        snapshot time (epoch seconds)
+    value    implied probability for h2h, the point for spreads/totals
+
+and computes, per series:
+
+    delta      change since the previous snapshot
+    change     change since the last snapshot at least a window (default
+               30 minutes) earlier, or since the first snapshot
+    velocity   change per hour over that span
+
+plus, per (game, outcome), the cross-book consensus (median of each
+book's latest value) and each book's deviation from it.
+
+Flags:
+    move    one book's line moved at least MOVE_THRESHOLDS[market] in the window
+    steam   STEAM_MIN_BOOKS or more books moved the same way in the window
+    outlier a book's latest line is far from the consensus
+
+It is cheap enough to run after every odds poll.
+
+Usage:
+    python line_movement.py [--market h2h] [--window 30] [--root odds_history]
+"""
+
+import argparse
+from datetime import datetime, timezone
+
+import numpy as np
+
+from odds_history import HISTORY_DIR, OddsHistory
+from odds_math import implied_probability
+
+DEFAULT_WINDOW = 30 * 60
+# Minimum change over the window to count as a move
+MOVE_THRESHOLDS = {'h2h': 0.03, 'spreads': 1.0, 'totals': 1.0}
+# Deviation from consensus that marks an outlier book
+OUTLIER_THRESHOLDS = {'h2h': 0.04, 'spreads': 1.5, 'totals': 1.5}
+STEAM_MIN_BOOKS = 3
+
+
+def _tracked(market, name, game):
+    """Which outcomes to track. Point markets are mirrored, so one side is enough."""
+    if market == 'spreads':
+        return name == game.get('home_team')
+    if market == 'totals':
+        return name.startswith('Over')
+    return True
+
+
+def build_frame(history, market='h2h', game_ids=None, start=None):
+    """Snapshot table for one market across games: dict of arrays plus series keys.
+
+    With `start`, each series also gets its last snapshot before it, since
+    the store only writes a row when the line changes.
+    """
+    keys = []
+    series, times, values = [], [], []
+    for game_id in game_ids or list(history.games):
+        game = history.games.get(game_id, {})
+        # prior=True: a line that sat flat since before `start` still has its pre-move value
+        for (bookmaker, _), entry in history.series(game_id, market, start=start, prior=True).items():
+            stamps = [int(when.timestamp()) for when in entry['t']]
+            for name, column in entry['outcomes'].items():
+                if not _tracked(market, name, game):
+                    continue
+                raw = column['price'] if market == 'h2h' else column['point']
+                points = [(t, v) for t, v in zip(stamps, raw) if v is not None]
+                if not points:
+                    continue
+                index = len(keys)
+                keys.append((game_id, name, bookmaker))
+                series.extend([index] * len(points))
+                times.extend(t for t, _ in points)
+                values.extend(v for _, v in points)
+
+    value = np.asarray(values, dtype=float)
+    if market == 'h2h' and len(value):
+        value = implied_probability(value)
+    frame = {
+        'keys': keys,
+        'series': np.asarray(series, dtype=np.int64),
+        't': np.asarray(times, dtype=np.int64),
+        'value': value,
+    }
+    order = np.lexsort((frame['t'], frame['series']))
+    for name in ('series', 't', 'value'):
+        frame[name] = frame[name][order]
+    return frame
+
+
+def movement(frame, window=DEFAULT_WINDOW):
+    """Add delta, change and velocity columns (vectorized over every series)"""
+    series, t, value = frame['series'], frame['t'], frame['value']
+    n = len(value)
+    delta = np.full(n, np.nan)
+    if n > 1:
+        same = series[1:] == series[:-1]
+        delta[1:] = np.where(same, np.diff(value), np.nan)
+
+    # Baseline: the last row of the same series at or before t - window (or
+    # the series' first row). Taking the first row *inside* the window would
+    # compare a move with itself whenever polls are further apart than the window.
+    series_start = np.searchsorted(series, series, side='left')
+    span = int(t.max() - t.min()) + window + 1 if n else 1
+    key = series * span + (t - (t.min() if n else 0))
+    first = np.maximum(np.searchsorted(key, key - window, side='right') - 1, series_start)
+
+    change = value - value[first]
+    elapsed = (t - t[first]).astype(float)
+    velocity = np.divide(change * 3600.0, elapsed, out=np.zeros(n), where=elapsed > 0)
+
+    frame.update(delta=delta, change=change, velocity=velocity)
+    return frame
+
+
+def latest(frame):
+    """Row index of the latest snapshot of each series"""
+    series = frame['series']
+    if not len(series):
+        return np.zeros(0, dtype=np.int64)
+    return np.flatnonzero(np.append(series[1:] != series[:-1], True))
+
+
+def consensus(frame):
+    """Median of each book's latest value per (game, outcome); returns (groups, medians, rows, deviation)"""
+    rows = latest(frame)
+    pairs = [frame['keys'][s][:2] for s in frame['series'][rows]]
+    groups = sorted(set(pairs))
+    group_index = {pair: i for i, pair in enumerate(groups)}
+    group = np.fromiter((group_index[pair] for pair in pairs), dtype=np.int64, count=len(pairs))
+
+    books = sorted({frame['keys'][s][2] for s in frame['series'][rows]})
+    book_index = {book: i for i, book in enumerate(books)}
+    book = np.fromiter((book_index[frame['keys'][s][2]] for s in frame['series'][rows]),
+                       dtype=np.int64, count=len(rows))
+
+    matrix = np.full((len(groups), max(1, len(books))), np.nan)
+    matrix[group, book] = frame['value'][rows]
+    with np.errstate(all='ignore'):
+        medians = np.nanmedian(matrix, axis=1) if len(groups) else np.zeros(0)
+    deviation = frame['value'][rows] - medians[group]
+    return groups, medians, rows, deviation
+
+
+def detect(frame, market='h2h', window=DEFAULT_WINDOW, now=None):
+    """Flags for lines that moved (or steamed) within the window ending at `now`"""
+    if not len(frame['value']):
+        return []
+    movement(frame, window)
+    now = now if now is not None else int(frame['t'].max())
+    threshold = MOVE_THRESHOLDS.get(market, 1.0)
+
+    rows = latest(frame)
+    recent = rows[frame['t'][rows] >= now - window]
+    change = frame['change'][recent]
+    moved = recent[np.abs(change) >= threshold]
+    if market == 'h2h':
+        # Each h2h move shows on both sides; report the side being backed
+        moved = moved[frame['change'][moved] > 0]
+
+    flags = []
+    steam_counts = {}
+    for row in moved:
+        game_id, outcome, bookmaker = frame['keys'][frame['series'][row]]
+        direction = 1 if frame['change'][row] > 0 else -1
+        steam_counts.setdefault((game_id, outcome, direction), []).append((bookmaker, frame['change'][row]))
+        flags.append({'kind': 'move', 'game_id': game_id, 'market': market, 'outcome': outcome,
+                      'bookmakers': [bookmaker], 'value': float(frame['value'][row]),
+                      'change': float(frame['change'][row]), 'velocity': float(frame['velocity'][row]),
+                      'at': datetime.fromtimestamp(int(frame['t'][row]), timezone.utc)})
+
+    for (game_id, outcome, direction), moves in steam_counts.items():
+        if len(moves) >= STEAM_MIN_BOOKS:
+            flags.append({'kind': 'steam', 'game_id': game_id, 'market': market, 'outcome': outcome,
+                          'bookmakers': sorted(book for book, _ in moves),
+                          'change': float(np.mean([change for _, change in moves])),
+                          'direction': direction})
+
+    groups, medians, latest_rows, deviation = consensus(frame)
+    outliers = np.flatnonzero(np.abs(deviation) >= OUTLIER_THRESHOLDS.get(market, 1.5))
+    for i in outliers:
+        row = latest_rows[i]
+        game_id, outcome, bookmaker = frame['keys'][frame['series'][row]]
+        if market == 'h2h' and deviation[i] < 0:
+            continue
+        flags.append({'kind': 'outlier', 'game_id': game_id, 'market': market, 'outcome': outcome,
+                      'bookmakers': [bookmaker], 'value': float(frame['value'][row]),
+                      'consensus': float(medians[groups.index((game_id, outcome))]),
+                      'deviation': float(deviation[i])})
+    return flags
+
+
+def analyze(history, markets=('h2h', 'spreads', 'totals'), window=DEFAULT_WINDOW, lookback=6 * 3600):
+    """Flags for every market, only reading the last `lookback` seconds of history"""
+    start = int(datetime.now(timezone.utc).timestamp()) - lookback if lookback else None
+    flags = []
+    for market in markets:
+        flags.extend(detect(build_frame(history, market, start=start), market, window))
+    return flags
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Line movement and steam detection")
+    parser.add_argument('--root', default=HISTORY_DIR)
+    parser.add_argument('--market', action='append', help="h2h, spreads or totals (repeatable)")
+    parser.add_argument('--window', type=int, default=DEFAULT_WINDOW // 60, help="Minutes")
+    parser.add_argument('--all', action='store_true', help="Scan all history, not just the last 6 hours")
+    args = parser.parse_args()
+
+    history = OddsHistory(args.root)
+    markets = args.market or ['h2h', 'spreads', 'totals']
+    flags = analyze(history, markets, args.window * 60, lookback=None if args.all else 6 * 3600)
+
+    print(f"{len(flags)} flags across {len(history.games)} games")
+    for flag in flags:
+        game = history.games.get(flag['game_id'], {})
+        matchup = f"{game.get('away_team')} @ {game.get('home_team')}"
+        books = ', '.join(flag['bookmakers'])
+        if flag['kind'] == 'outlier':
+            detail = f"{flag['value']:.3f} vs consensus {flag['consensus']:.3f}"
+        else:
+            detail = f"change {flag['change']:+.3f}"
+            if 'velocity' in flag:
+                detail += f" ({flag['velocity']:+.3f}/h)"
+        print(f"  {flag['kind'].upper():<8} {flag['market']:<8} {matchup:<50} {flag['outcome']:<28} {detail}  [{books}]")
+
+
+if __name__ == "__main__":
+    main()
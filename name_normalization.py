@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Shared name normalization for team and fighter matching.
+
+The old normalize_team_name rebuilt every string character by character
+with a generator and ''.join, and test_matching called it four times per
+candidate game. Here each name goes through one NFKD decomposition and one
+str.translate call against a precomputed table (accents dropped, letters
+lowercased, punctuation removed or turned into spaces), and results are
+memoized with an LRU cache since slates repeat the same names constantly.
+
+    clean_team_name("St. Louis Blues")        -> "st louis blues"
+    clean_fighter_name('José "Pepe" Pérez')   -> "jose perez"
+
+See bench_name_normalization.py for the throughput comparison.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+CACHE_SIZE = 65536
+
+# Quoted nicknames ("Boots", 'Canelo') but not apostrophes inside names (O'Malley)
+_NICKNAME_RE = re.compile(r"(?:^|\s)[\"'‘“].*?[\"'’”](?=\s|$)")
+
+
+class _FoldTable(dict):
+    """str.translate table that fills itself in on first sight of a code point.
+
+    Letters and digits map to their lowercase form, combining marks (the
+    accents split off by NFKD) are deleted, whitespace stays a space and
+    everything else becomes `punctuation`. ASCII is precomputed up front.
+    """
+
+    def __init__(self, punctuation):
+        super().__init__()
+        self.punctuation = punctuation
+        for codepoint in range(128):
+            self[codepoint]
+
+    def __missing__(self, codepoint):
+        ch = chr(codepoint)
+        if unicodedata.combining(ch):
+            value = None
+        elif ch.isalnum():
+            value = ch.lower()
+        elif ch.isspace():
+            value = ' '
+        else:
+            value = self.punctuation
+        self[codepoint] = value
+        return value
+
+
+# Team names historically dropped punctuation ("76ers", "st louis");
+# fighter names split on it ("o malley") so tokens survive for fuzzy scoring.
+_TEAM_TABLE = _FoldTable(punctuation=None)
+_FIGHTER_TABLE = _FoldTable(punctuation=' ')
+
+
+def fold(name, table):
+    """NFKD-decompose, translate through `table` and collapse whitespace"""
+    if name.isascii():
+        translated = name.translate(table)
+    else:
+        translated = unicodedata.normalize('NFKD', name).translate(table)
+    return ' '.join(translated.split())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_team_name(name):
+    """Lowercase, accent-fold and strip punctuation from a team name"""
+    if not name:
+        return ''
+    return fold(name, _TEAM_TABLE)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_fighter_name(name):
+    """Fold accents, drop quoted nicknames and punctuation, lowercase"""
+    if not name:
+        return ''
+    return fold(_NICKNAME_RE.sub(' ', name), _FIGHTER_TABLE)
+
+
+def cache_info():
+    """LRU statistics for both normalizers"""
+    return {'team': clean_team_name.cache_info(), 'fighter': clean_fighter_name.cache_info()}
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Concurrent client for The Odds API (api.the-odds-api.com/v4).
+
+Every request goes through one pooled requests.Session with a timeout.
+The free endpoints are cached on disk in odds_api_cache.json:
+
+    /sports                    active sports list, refreshed once a day
+    /sports/{sport}/events     upcoming games (ids and commence times), hourly
+
+refresh() is the poll cycle: it lists the upcoming games of every active
+sport (free), asks the quota planner (odds_quota.OddsQuotaPlanner) which
+scores and odds fetches are worth spending on, runs all of them in
+parallel so the cycle costs one round trip of wall time, and appends the
+odds to the odds history store.
+
+Games seen completed in a scores response are kept in the same cache
+file (for COMPLETED_TTL), so a restarted poller doesn't spend quota on
+their scores again. Odds history is flushed once HISTORY_FLUSH_SNAPSHOTS
+snapshots are buffered or HISTORY_FLUSH_SECONDS have passed, and on
+close(), rather than as a tiny chunk every cycle.
+
+Usage:
+    python odds_api.py sports
+    python odds_api.py refresh [--exposure exposure.json] [--dry-run]
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from odds_history import OddsHistory
+from odds_quota import DEFAULT_MARKETS, DEFAULT_REGIONS, OddsQuotaPlanner
+
+BASE_URL = 'https://api.the-odds-api.com/v4'
+API_KEY = os.environ.get('ODDS_API_KEY', 'demo')
+REQUEST_TIMEOUT = 15
+
+CACHE_FILE = 'odds_api_cache.json'
+SPORTS_TTL = 24 * 3600
+EVENTS_TTL = 3600
+COMPLETED_TTL = 7 * 24 * 3600
+
+HISTORY_FLUSH_SNAPSHOTS = 500
+HISTORY_FLUSH_SECONDS = 15 * 60
+
+# Sports the app covers; None polls every active non-outright sport
+DEFAULT_SPORTS = (
+    'americanfootball_nfl',
+    'basketball_nba',
+    'baseball_mlb',
+    'icehockey_nhl',
+    'mma_mixed_martial_arts',
+    'soccer_epl',
+)
+
+
+class OddsAPI:
+    """The Odds API client with a pooled session and quota-planned refreshes"""
+
+    def __init__(self, api_key=API_KEY, pool_size=10, planner=None, history=None,
+                 cache_path=CACHE_FILE, markets=DEFAULT_MARKETS, regions=DEFAULT_REGIONS):
+        self.api_key = api_key
+        self.markets = tuple(markets)
+        self.regions = tuple(regions)
+        self.planner = planner or OddsQuotaPlanner(markets=markets, regions=regions)
+        self.history = history
+        self.pool_size = pool_size
+
+        # One keep-alive pool shared by every worker thread
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+
+        self.cache_path = cache_path
+        self._cache = {}
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path, 'r') as f:
+                self._cache = json.load(f)
+        # Games seen as completed in a scores response (id -> when); they need no more scores fetches
+        cutoff = time.time() - COMPLETED_TTL
+        self._completed = {game_id: seen for game_id, seen in self._cache.get('completed', {}).items()
+                           if seen >= cutoff}
+        self._cache['completed'] = self._completed
+        self._last_flush = time.monotonic()
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._cache, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _get(self, path, params=None):
+        """GET a path under BASE_URL; returns (parsed JSON or None, response headers)"""
+        params = dict(params or {}, apiKey=self.api_key)
+        try:
+            response = self.session.get(f"{BASE_URL}{path}", params=params, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            print(f"Error: {path}: {e}")
+            return None, {}
+
+        if response.status_code == 200:
+            return response.json(), response.headers
+        print(f"Error: {response.status_code} {path}")
+        print(f"Response: {response.text[:200]}")
+        return None, response.headers
+
+    def _cached(self, key, ttl, fetch):
+        """Cached body for a free endpoint, refetched when older than ttl"""
+        entry = self._cache.get(key)
+        if entry and time.time() - entry['fetched_at'] < ttl:
+            return entry['body']
+        body, _ = fetch()
+        if body is None:
+            return entry['body'] if entry else None
+        self._cache[key] = {'fetched_at': time.time(), 'body': body}
+        return body
+
+    # Endpoints -----------------------------------------------------------
+
+    def get_sports(self):
+        """Active sports (free call, cached for a day)"""
+        sports = self._cached('sports', SPORTS_TTL, lambda: self._get('/sports/'))
+        self._save_cache()
+        return [sport for sport in sports or [] if sport.get('active')]
+
+    def get_events(self, sport):
+        """Upcoming games for a sport without odds (free call, cached for an hour)"""
+        return self._cached(f"events:{sport}", EVENTS_TTL, lambda: self._get(f"/sports/{sport}/events")) or []
+
+    def get_scores(self, sport, days_from=None):
+        """(scores, headers) for live and, with days_from, recently completed games"""
+        params = {'daysFrom': days_from} if days_from else None
+        return self._get(f"/sports/{sport}/scores/", params)
+
+    def get_odds(self, sport, odds_format='american'):
+        """(odds, headers) for every upcoming game of a sport"""
+        params = {'regions': ','.join(self.regions), 'markets': ','.join(self.markets),
+                  'oddsFormat': odds_format}
+        return self._get(f"/sports/{sport}/odds/", params)
+
+    def fetch_many(self, calls):
+        """Run (name, func, args) calls in parallel; returns {name: result}"""
+        if not calls:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(calls))) as pool:
+            futures = {name: pool.submit(func, *args) for name, func, args in calls}
+            return {name: future.result() for name, future in futures.items()}
+
+    # Poll cycle ----------------------------------------------------------
+
+    def active_sports(self, sports=DEFAULT_SPORTS):
+        keys = [sport['key'] for sport in self.get_sports() if not sport.get('has_outrights')]
+        return [key for key in keys if sports is None or key in sports]
+
+    def upcoming_games(self, sports):
+        """Games for the planner, from the (cached) free events endpoint"""
+        listed = self.fetch_many([(sport, self.get_events, (sport,)) for sport in sports])
+        self._save_cache()
+        games = []
+        for sport in sports:
+            for game in listed.get(sport) or []:
+                games.append(dict(game, sport_key=game.get('sport_key', sport),
+                                  completed=game['id'] in self._completed))
+        return games
+
+    def refresh(self, sports=DEFAULT_SPORTS, exposure=None, dry_run=False):
+        """One poll cycle: plan, fetch everything planned in parallel, store odds.
+
+        Returns {'tasks': [...], 'odds': {sport: [...]}, 'scores': {sport: [...]}}.
+        """
+        games = self.upcoming_games(self.active_sports(sports))
+        tasks = self.planner.plan(games, exposure)
+        result = {'tasks': tasks, 'odds': {}, 'scores': {}}
+        if dry_run:
+            return result
+
+        fetchers = {'odds': self.get_odds, 'scores': self.get_scores}
+        responses = self.fetch_many([((task['kind'], task['sport']), fetchers[task['kind']], (task['sport'],))
+                                     for task in tasks])
+
+        for task in tasks:
+            body, headers = responses[(task['kind'], task['sport'])]
+            if body is None:
+                continue
+            self.planner.record_fetch(task, headers)
+            result[task['kind']][task['sport']] = body
+            if task['kind'] == 'scores':
+                now = time.time()
+                for game in body:
+                    if game.get('completed'):
+                        self._completed.setdefault(game['id'], now)
+
+        if self.history is not None:
+            for body in result['odds'].values():
+                self.history.append(body)
+            self._maybe_flush()
+        self.planner.save()
+        self._save_cache()
+        return result
+
+    def _maybe_flush(self):
+        """Flush odds history once enough snapshots are buffered or enough time has passed"""
+        pending = self.history.pending()
+        if not pending:
+            return
+        if pending >= HISTORY_FLUSH_SNAPSHOTS or time.monotonic() - self._last_flush >= HISTORY_FLUSH_SECONDS:
+            self.history.flush()
+            self._last_flush = time.monotonic()
+
+    def close(self):
+        """Flush buffered odds history; call before the process exits"""
+        if self.history is not None and self.history.pending():
+            self.history.flush()
+            self._last_flush = time.monotonic()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="The Odds API client")
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('sports', help="List active sports (cached for a day)")
+    refresh_cmd = sub.add_parser('refresh', help="Run one quota-planned poll cycle")
+    refresh_cmd.add_argument('--exposure', help="JSON {game_id: picks or coins staked}")
+    refresh_cmd.add_argument('--all-sports', action='store_true', help="Poll every active sport")
+    refresh_cmd.add_argument('--dry-run', action='store_true', help="Show the plan without spending quota")
+    args = parser.parse_args()
+
+    client = OddsAPI(history=OddsHistory())
+
+    if args.command == 'sports':
+        for sport in client.get_sports():
+            print(f"  {sport.get('key'):<40} {sport.get('title')}")
+        return
+
+    exposure = {}
+    if args.exposure:
+        with open(args.exposure, 'r') as f:
+            exposure = json.load(f)
+
+    start = time.perf_counter()
+    try:
+        result = client.refresh(None if args.all_sports else DEFAULT_SPORTS, exposure, args.dry_run)
+    finally:
+        client.close()
+    elapsed = time.perf_counter() - start
+
+    for task in result['tasks']:
+        status = 'planned' if args.dry_run else ('ok' if task['sport'] in result[task['kind']] else 'failed')
+        print(f"  {task['kind']:<7} {task['sport']:<32} cost {task['cost']}  {status}")
+    print(f"\n{len(result['tasks'])} fetches in {elapsed:.2f}s, "
+          f"{client.planner.remaining()} requests left this month")
+
+
+if __name__ == "__main__":
+    main()
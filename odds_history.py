@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Append-only, compressed odds time series.
+
+Odds responses used to be dumped to odds_api_*.json and overwritten on the
+next run, so line history was lost. OddsHistory keeps every snapshot:
+
+    odds_history/
+        games.json            game id -> sport, teams, commence time
+        {game_id}.odds        append-only chunk log for one game
+
+Snapshots are buffered per (game, bookmaker, market) and written by
+flush() as one chunk each. Once a game's file holds COMPACT_RATIO chunks
+per key (a flush per poll leaves many one-row chunks, which compress
+poorly and make reads walk thousands of headers), flush() rewrites it
+with each key's rows merged into chunks of up to CHUNK_ROWS. A chunk is
+stored column-wise (timestamps, then one price and point column per
+outcome) and zlib-compressed, behind a small uncompressed header so range
+queries can skip chunks by key and time span without decompressing them:
+
+    header    >IqqH  payload length, first and last timestamp (epoch s), key length
+    key       "bookmaker|market" (utf-8)
+    payload   zlib(msgpack {"t": [deltas], "names": [...], "price": [[...]], "point": [[...]]})
+
+Files are only appended to (compaction writes a new file and renames it
+over the old one), so a crash can at worst leave a torn last chunk.
+Readers ignore it and the next flush truncates it before appending.
+The newest snapshot of every key is read back from disk the first time a
+game is appended to, so a restarted poller does not store repeats.
+
+Usage:
+    python odds_history.py ingest odds_api_nba_odds.json [...]
+    python odds_history.py show <game_id> [--market h2h] [--bookmaker draftkings]
+    python odds_history.py compact [<game_id> ...]
+"""
+
+import argparse
+import json
+import os
+import struct
+import zlib
+from datetime import datetime, timezone
+
+import msgpack
+
+HISTORY_DIR = 'odds_history'
+GAMES_FILE = 'games.json'
+_CHUNK_HEADER = struct.Struct(">IqqH")
+# Rows per chunk when compacting
+CHUNK_ROWS = 512
+# Compact a game's file once it holds this many chunks per (bookmaker, market)
+COMPACT_RATIO = 8
+
+
+def parse_time(value):
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _epoch(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = parse_time(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def encode_chunk(key, rows):
+    """rows: [(t, {name: (price, point)})] sorted by t -> chunk bytes"""
+    names = sorted({name for _, outcomes in rows for name in outcomes})
+    times = [t for t, _ in rows]
+    deltas = [times[0]] + [b - a for a, b in zip(times, times[1:])]
+    columns = {
+        't': deltas,
+        'names': names,
+        'price': [[outcomes.get(name, (None, None))[0] for _, outcomes in rows] for name in names],
+        'point': [[outcomes.get(name, (None, None))[1] for _, outcomes in rows] for name in names],
+    }
+    payload = zlib.compress(msgpack.packb(columns, use_bin_type=True), 6)
+    key_bytes = key.encode('utf-8')
+    return _CHUNK_HEADER.pack(len(payload), times[0], times[-1], len(key_bytes)) + key_bytes + payload
+
+
+def decode_chunk(payload):
+    """Chunk payload -> (times, {name: {'price': [...], 'point': [...]}})"""
+    columns = msgpack.unpackb(zlib.decompress(payload), raw=False)
+    times = []
+    current = 0
+    for delta in columns['t']:
+        current += delta
+        times.append(current)
+    outcomes = {name: {'price': price, 'point': point}
+                for name, price, point in zip(columns['names'], columns['price'], columns['point'])}
+    return times, outcomes
+
+
+def decode_rows(payload):
+    """Chunk payload -> [(t, {name: (price, point)})], the rows encode_chunk took"""
+    times, outcomes = decode_chunk(payload)
+    rows = []
+    for i, t in enumerate(times):
+        row = {name: (column['price'][i], column['point'][i]) for name, column in outcomes.items()
+               if column['price'][i] is not None or column['point'][i] is not None}
+        rows.append((t, row))
+    return rows
+
+
+def _scan(data):
+    """Yield (key, t_first, t_last, payload start, chunk end) for each complete chunk"""
+    offset = 0
+    while offset + _CHUNK_HEADER.size <= len(data):
+        length, first, last, key_len = _CHUNK_HEADER.unpack_from(data, offset)
+        body = offset + _CHUNK_HEADER.size
+        end = body + key_len + length
+        if end > len(data):
+            return  # torn write at the tail
+        yield data[body:body + key_len].decode('utf-8'), first, last, body + key_len, end
+        offset = end
+
+
+def iter_chunks(path, key_filter=None, start=None, end=None):
+    """Yield (key, t_first, t_last, payload) for chunks overlapping [start, end]"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        data = f.read()
+    for key, first, last, payload_start, chunk_end in _scan(data):
+        if key_filter and not key_filter(key):
+            continue
+        if (start is not None and last < start) or (end is not None and first > end):
+            continue
+        yield key, first, last, data[payload_start:chunk_end]
+
+
+def _extend(entry, times, outcomes, keep):
+    """Append rows `keep` of a decoded chunk to a series entry, padding missing outcomes with None"""
+    filled = len(entry['t'])
+    entry['t'].extend(times[i] for i in keep)
+    for name in set(entry['outcomes']) | set(outcomes):
+        column = entry['outcomes'].setdefault(name, {'price': [None] * filled, 'point': [None] * filled})
+        source = outcomes.get(name)
+        for field in ('price', 'point'):
+            column[field].extend(source[field][i] if source else None for i in keep)
+
+
+def snapshot_rows(game, fetched_at=None):
+    """{(bookmaker, market): (t, {name: (price, point)})} from one Odds API game"""
+    fallback = _epoch(fetched_at or datetime.now(timezone.utc))
+    rows = {}
+    for bookmaker in game.get('bookmakers', []):
+        for market in bookmaker.get('markets', []):
+            when = _epoch(market.get('last_update') or bookmaker.get('last_update')) or fallback
+            outcomes = {}
+            for outcome in market.get('outcomes', []):
+                name = outcome['name']
+                if outcome.get('description'):
+                    name = f"{name} {outcome['description']}"
+                outcomes[name] = (outcome.get('price'), outcome.get('point'))
+            rows[(bookmaker['key'], market['key'])] = (when, outcomes)
+    return rows
+
+
+class OddsHistory:
+    """Append-only odds snapshots per (game, bookmaker, market)"""
+
+    def __init__(self, root=HISTORY_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._games_path = os.path.join(root, GAMES_FILE)
+        self.games = {}
+        if os.path.exists(self._games_path):
+            with open(self._games_path, 'r') as f:
+                self.games = json.load(f)
+        self._buffer = {}   # (game, bookmaker, market) -> [(t, outcomes)]
+        self._last = {}     # same key -> newest (t, outcomes) stored or buffered, to drop repeats
+        self._files = {}    # game -> {'end': bytes of complete chunks, 'chunks': count, 'keys': set}
+
+    def _path(self, game_id):
+        return os.path.join(self.root, f"{game_id}.odds")
+
+    def _open_game(self, game_id):
+        """Index a game's file once: valid length, chunk count, newest row per key into _last"""
+        if game_id in self._files:
+            return self._files[game_id]
+        path = self._path(game_id)
+        data = b''
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+
+        info = {'end': 0, 'chunks': 0, 'keys': set()}
+        newest = {}
+        for key, _, last, payload_start, chunk_end in _scan(data):
+            info['end'] = chunk_end
+            info['chunks'] += 1
+            info['keys'].add(key)
+            if key not in newest or last >= newest[key][0]:
+                newest[key] = (last, payload_start, chunk_end)
+
+        for key, (_, payload_start, chunk_end) in newest.items():
+            bookmaker, market = key.split('|', 1)
+            self._last.setdefault((game_id, bookmaker, market),
+                                  max(decode_rows(data[payload_start:chunk_end]), key=lambda row: row[0]))
+        self._files[game_id] = info
+        return info
+
+    def append(self, games, fetched_at=None):
+        """Buffer one Odds API odds response; returns the number of new snapshots"""
+        added = 0
+        for game in games:
+            self._open_game(game['id'])
+            self.games.setdefault(game['id'], {
+                'sport_key': game.get('sport_key'),
+                'home_team': game.get('home_team'),
+                'away_team': game.get('away_team'),
+                'commence_time': game.get('commence_time'),
+            })
+            for (bookmaker, market), (when, outcomes) in snapshot_rows(game, fetched_at).items():
+                key = (game['id'], bookmaker, market)
+                last = self._last.get(key)
+                if last and (last[0] >= when or last[1] == outcomes):
+                    continue
+                self._buffer.setdefault(key, []).append((when, outcomes))
+                self._last[key] = (when, outcomes)
+                added += 1
+        return added
+
+    def flush(self):
+        """Write buffered snapshots as one chunk per (game, bookmaker, market)"""
+        by_game = {}
+        for (game_id, bookmaker, market), rows in self._buffer.items():
+            rows.sort(key=lambda row: row[0])
+            key = f"{bookmaker}|{market}"
+            by_game.setdefault(game_id, []).append((key, encode_chunk(key, rows)))
+
+        for game_id, chunks in by_game.items():
+            info = self._open_game(game_id)
+            path = self._path(game_id)
+            with open(path, 'r+b' if os.path.exists(path) else 'wb') as f:
+                # Drop a torn tail left by a crash, or the chunks after it would be unreadable
+                f.truncate(info['end'])
+                f.seek(info['end'])
+                f.write(b''.join(chunk for _, chunk in chunks))
+                f.flush()
+                os.fsync(f.fileno())
+                info['end'] = f.tell()
+            info['chunks'] += len(chunks)
+            info['keys'].update(key for key, _ in chunks)
+            if info['chunks'] >= COMPACT_RATIO * len(info['keys']):
+                self.compact(game_id)
+
+        tmp_path = self._games_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.games, f, separators=(',', ':'), sort_keys=True)
+        os.replace(tmp_path, self._games_path)
+
+        written = sum(len(rows) for rows in self._buffer.values())
+        self._buffer = {}
+        return written
+
+    def pending(self):
+        """Snapshots buffered and not yet flushed"""
+        return sum(len(rows) for rows in self._buffer.values())
+
+    def compact(self, game_id):
+        """Rewrite a game's file with each key's rows merged into chunks of up to CHUNK_ROWS"""
+        path = self._path(game_id)
+        rows_by_key = {}
+        for key, _, _, payload in iter_chunks(path):
+            rows_by_key.setdefault(key, []).extend(decode_rows(payload))
+
+        chunks = []
+        for key in sorted(rows_by_key):
+            rows = sorted(rows_by_key[key], key=lambda row: row[0])
+            for i in range(0, len(rows), CHUNK_ROWS):
+                chunks.append(encode_chunk(key, rows[i:i + CHUNK_ROWS]))
+
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join(chunks))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        self._files[game_id] = {'end': sum(len(chunk) for chunk in chunks), 'chunks': len(chunks),
+                                'keys': set(rows_by_key)}
+        return len(chunks)
+
+    def series(self, game_id, market=None, bookmaker=None, start=None, end=None, prior=False):
+        """Line history for a game: {(bookmaker, market): {'t': [datetime], 'outcomes': {...}}}
+
+        start/end (datetimes or ISO strings) bound the snapshot times; chunks
+        outside the range or for other books/markets are not decompressed.
+        A snapshot is only stored when the line changes, so with prior=True
+        each key also gets its last snapshot before `start` (the line as it
+        stood when the range opened); only the chunk holding it is decoded.
+        """
+        start, end = _epoch(start), _epoch(end)
+        seed = prior and start is not None
+
+        def wanted(key):
+            book, mkt = key.split('|', 1)
+            return (bookmaker is None or book == bookmaker) and (market is None or mkt == market)
+
+        merged = {}
+        before = {}   # key -> (t, payload) of the newest chunk entirely before start
+        seeds = {}    # key -> (t, times, outcomes, i) of the newest decoded row before start
+        for key, _, last, payload in iter_chunks(self._path(game_id), wanted, None if seed else start, end):
+            if seed and last < start:
+                if key not in before or last > before[key][0]:
+                    before[key] = (last, payload)
+                continue
+            times, outcomes = decode_chunk(payload)
+            keep = [i for i, t in enumerate(times)
+                    if (start is None or t >= start) and (end is None or t <= end)]
+            _extend(merged.setdefault(tuple(key.split('|', 1)), {'t': [], 'outcomes': {}}), times, outcomes, keep)
+            if seed:
+                earlier = [i for i, t in enumerate(times) if t < start]
+                if earlier:
+                    i = max(earlier, key=times.__getitem__)
+                    if key not in seeds or times[i] > seeds[key][0]:
+                        seeds[key] = (times[i], times, outcomes, i)
+
+        for key, (last, payload) in before.items():
+            if key not in seeds or last > seeds[key][0]:
+                times, outcomes = decode_chunk(payload)
+                i = max(range(len(times)), key=times.__getitem__)
+                seeds[key] = (times[i], times, outcomes, i)
+        for key, (_, times, outcomes, i) in seeds.items():
+            _extend(merged.setdefault(tuple(key.split('|', 1)), {'t': [], 'outcomes': {}}), times, outcomes, [i])
+
+        for entry in merged.values():
+            order = sorted(range(len(entry['t'])), key=entry['t'].__getitem__)
+            entry['t'] = [datetime.fromtimestamp(entry['t'][i], timezone.utc) for i in order]
+            for column in entry['outcomes'].values():
+                for field in ('price', 'point'):
+                    column[field] = [column[field][i] for i in order]
+        return merged
+
+    def odds_at(self, game_id, when, market='h2h', bookmaker=None):
+        """Latest line at or before `when` per bookmaker: {bookmaker: {name: (price, point)}}"""
+        result = {}
+        for (book, _), entry in self.series(game_id, market, bookmaker, end=when).items():
+            if not entry['t']:
+                continue
+            last = len(entry['t']) - 1
+            result[book] = {name: (column['price'][last], column['point'][last])
+                            for name, column in entry['outcomes'].items()
+                            if column['price'][last] is not None}
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Odds time-series store")
+    parser.add_argument('--root', default=HISTORY_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+    ingest_cmd = sub.add_parser('ingest', help="Append saved Odds API odds responses")
+    ingest_cmd.add_argument('files', nargs='+')
+    show_cmd = sub.add_parser('show', help="Print a game's line history")
+    show_cmd.add_argument('game_id')
+    show_cmd.add_argument('--market')
+    show_cmd.add_argument('--bookmaker')
+    compact_cmd = sub.add_parser('compact', help="Merge small chunks (all games, or the ones given)")
+    compact_cmd.add_argument('game_ids', nargs='*')
+    args = parser.parse_args()
+
+    history = OddsHistory(args.root)
+
+    if args.command == 'ingest':
+        for path in args.files:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            fetched_at = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+            added = history.append(data if isinstance(data, list) else [], fetched_at)
+            print(f"{path}: {added} snapshots")
+        print(f"Wrote {history.flush()} snapshots to {args.root}")
+        return
+
+    if args.command == 'compact':
+        for game_id in args.game_ids or sorted(history.games):
+            if os.path.exists(history._path(game_id)):
+                print(f"{game_id}: {history.compact(game_id)} chunks")
+        return
+
+    game = history.games.get(args.game_id, {})
+    print(f"{game.get('away_team')} @ {game.get('home_team')}  {game.get('commence_time')}")
+    for (bookmaker, market), entry in sorted(history.series(args.game_id, args.market, args.bookmaker).items()):
+        print(f"\n{bookmaker} {market}")
+        for i, when in enumerate(entry['t']):
+            prices = "  ".join(f"{name} {column['price'][i]}" + (f" ({column['point'][i]})" if column['point'][i] is not None else "")
+                               for name, column in entry['outcomes'].items() if column['price'][i] is not None)
+            print(f"  {when:%Y-%m-%d %H:%M}  {prices}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Vectorized odds math: American <-> decimal <-> implied probability,
+margin (vig) removal and fair lines, over NumPy arrays of markets.
+
+calculatePayout in functions/index.js handles one American price at a
+time; payout() here is the same formula over arrays. Markets are 2-D
+arrays, one row per market and one column per outcome, padded with NaN
+when markets have different outcome counts (2-way h2h next to 3-way
+soccer), so a whole snapshot is checked in one call.
+
+Usage:
+    python odds_math.py [--markets 100000]     # timing of the sanity checks
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+# Margin outside this range marks a market as suspect (stale or mis-keyed
+# price); below zero is an arbitrage, above MAX_MARGIN a bad line
+MAX_MARGIN = 0.25
+
+
+def _array(values):
+    return np.asarray(values, dtype=float)
+
+
+def american_to_decimal(american):
+    american = _array(american)
+    # np.where evaluates both branches; the unused one may divide by zero
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(american > 0, 1.0 + american / 100.0, 1.0 + 100.0 / np.abs(american))
+
+
+def decimal_to_american(decimal):
+    """Decimal -> American (+X for 2.0 and up, -X below)"""
+    decimal = _array(decimal)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(decimal >= 2.0, (decimal - 1.0) * 100.0, -100.0 / (decimal - 1.0))
+
+
+def decimal_to_probability(decimal):
+    with np.errstate(divide='ignore'):
+        return 1.0 / _array(decimal)
+
+
+def probability_to_decimal(probability):
+    with np.errstate(divide='ignore'):
+        return 1.0 / _array(probability)
+
+
+def american_to_probability(american):
+    american = _array(american)
+    # +100 makes the unused negative branch divide by zero (and -100 the positive one)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(american > 0, 100.0 / (american + 100.0), -american / (100.0 - american))
+
+
+def probability_to_american(probability):
+    return decimal_to_american(probability_to_decimal(probability))
+
+
+def implied_probability(prices, fmt='auto'):
+    """Implied probability from 'american', 'decimal' or 'auto' prices.
+
+    'auto' treats |x| >= 100 as American and anything else as decimal,
+    since American prices never fall between -100 and +100. The Odds API
+    returns decimal unless oddsFormat=american is requested.
+    """
+    prices = _array(prices)
+    if fmt == 'american':
+        return american_to_probability(prices)
+    if fmt == 'decimal':
+        return decimal_to_probability(prices)
+    american = np.abs(prices) >= 100
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(american, american_to_probability(prices), 1.0 / prices)
+
+
+def payout(wager, american):
+    """Total return (stake + winnings) for American odds, as calculatePayout"""
+    wager = _array(wager)
+    return wager * american_to_decimal(american)
+
+
+def margin(probabilities):
+    """Bookmaker margin per market (row): sum of implied probabilities - 1"""
+    return np.nansum(_array(probabilities), axis=-1) - 1.0
+
+
+def remove_vig(probabilities, method='multiplicative'):
+    """Fair probabilities per market (rows sum to 1; NaN outcomes stay NaN).
+
+    multiplicative  scale each outcome by 1 / total (the common default)
+    additive        subtract an equal share of the margin from each outcome
+    power           p_i ** k with k solved so the row sums to 1; takes more
+                    margin off longshots, which matches how books shade them
+    """
+    probabilities = np.atleast_2d(_array(probabilities))
+    total = np.nansum(probabilities, axis=-1, keepdims=True)
+
+    if method == 'multiplicative':
+        return probabilities / total
+    if method == 'additive':
+        outcomes = np.sum(~np.isnan(probabilities), axis=-1, keepdims=True)
+        return probabilities - (total - 1.0) / outcomes
+    if method == 'power':
+        return _power_devig(probabilities)
+    raise ValueError(f"Unknown vig removal method: {method}")
+
+
+def _power_devig(probabilities, iterations=20):
+    """Newton's method on f(k) = sum(p_i ** k) - 1, all rows at once"""
+    logs = np.log(probabilities)
+    k = np.ones((probabilities.shape[0], 1))
+    for _ in range(iterations):
+        powered = np.exp(k * logs)
+        value = np.nansum(powered, axis=-1, keepdims=True) - 1.0
+        slope = np.nansum(powered * logs, axis=-1, keepdims=True)
+        step = np.divide(value, slope, out=np.zeros_like(value), where=slope != 0)
+        k -= step
+        if np.all(np.abs(step) < 1e-12):
+            break
+    return np.exp(k * logs)
+
+
+def fair_lines(prices, fmt='auto', method='multiplicative'):
+    """No-vig prices per market, returned in American format"""
+    return probability_to_american(remove_vig(implied_probability(prices, fmt), method))
+
+
+def sanity_check(prices, fmt='auto', max_margin=MAX_MARGIN):
+    """Boolean mask of markets (rows) whose margin is negative or above max_margin"""
+    market_margin = margin(np.atleast_2d(implied_probability(prices, fmt)))
+    return (market_margin < 0) | (market_margin > max_margin) | np.isnan(market_margin)
+
+
+def market_matrix(games, market='h2h'):
+    """Odds API games -> (keys, prices) with one row per (game, bookmaker) market"""
+    keys, rows = [], []
+    for game in games:
+        for bookmaker in game.get('bookmakers', []):
+            for entry in bookmaker.get('markets', []):
+                if entry.get('key') == market:
+                    keys.append((game['id'], bookmaker['key']))
+                    rows.append([outcome.get('price', np.nan) for outcome in entry.get('outcomes', [])])
+    width = max((len(row) for row in rows), default=0)
+    prices = np.full((len(rows), width), np.nan)
+    for i, row in enumerate(rows):
+        prices[i, :len(row)] = row
+    return keys, prices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Odds math timing")
+    parser.add_argument('--markets', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    fair = rng.uniform(0.1, 0.9, args.markets)
+    probabilities = np.column_stack([fair, 1.0 - fair]) * rng.uniform(1.02, 1.08, (args.markets, 1))
+    prices = np.round(probability_to_american(probabilities))
+
+    timings = {}
+    for name, func in [('implied probability', lambda: implied_probability(prices)),
+                       ('remove vig (mult)', lambda: remove_vig(implied_probability(prices))),
+                       ('remove vig (power)', lambda: remove_vig(implied_probability(prices), 'power')),
+                       ('fair lines', lambda: fair_lines(prices)),
+                       ('sanity check', lambda: sanity_check(prices))]:
+        start = time.perf_counter()
+        func()
+        timings[name] = time.perf_counter() - start
+
+    print(f"{args.markets:,} two-way markets")
+    for name, seconds in timings.items():
+        print(f"  {name:<20} {seconds * 1000:8.2f} ms  ({seconds * 1e6 / args.markets:.3f} us/market)")
+
+
+if __name__ == "__main__":
+    main()
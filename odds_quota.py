@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Quota planner for The Odds API (free tier: 500 requests a month).
+
+One odds call returns every upcoming game of a sport and costs
+markets x regions requests; one scores call costs 1 (2 with daysFrom).
+The sports list is free. So the unit of work is a (kind, sport) fetch,
+and the question each poll cycle is which of those to spend on.
+
+OddsQuotaPlanner keeps the budget in odds_quota.json:
+
+    - x-requests-used / x-requests-remaining from every response, so the
+      provider's count always wins over ours
+    - a daily allowance: what is left after the reserve, spread evenly
+      over the rest of the month, fixed at the first call of each UTC day
+    - when each (kind, sport) was last fetched
+
+plan() scores every candidate fetch by the games it would refresh. A
+game's weight grows as commence time gets closer and with user exposure
+(picks or coins riding on it); the weight counts only once the game's
+refresh interval has passed, and more the longer it is overdue. Fetches
+are then taken greedily by value per request until today's allowance is
+used up, so the freshest data goes to the games that matter and the
+month does not run dry halfway through.
+
+Usage:
+    python odds_quota.py status
+    python odds_quota.py plan odds_api_nfl_scores.json [...] [--exposure exposure.json]
+"""
+
+import argparse
+import json
+import math
+import os
+from datetime import datetime, timezone
+
+STATE_FILE = 'odds_quota.json'
+MONTHLY_QUOTA = 500
+# Requests kept back for manual checks and settlement-time lookups
+QUOTA_RESERVE = 25
+
+DEFAULT_REGIONS = ('us',)
+DEFAULT_MARKETS = ('h2h', 'spreads', 'totals')
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+# (seconds until commence, refresh interval). First match wins; None = don't fetch.
+ODDS_REFRESH = [
+    (0, None),               # started: picks are locked
+    (3 * HOUR, 30 * MINUTE),
+    (DAY, 2 * HOUR),
+    (3 * DAY, 8 * HOUR),
+    (7 * DAY, DAY),
+    (None, None),            # lines this far out barely move
+]
+# Scores only matter from commence time until the game is final
+SCORES_REFRESH = 15 * MINUTE
+# Games are assumed final this long after commence time if no score says so
+MAX_GAME_SECONDS = 6 * HOUR
+
+# How many intervals overdue still adds value (avoids one stale sport starving the rest)
+MAX_OVERDUE = 4.0
+EXPOSURE_WEIGHT = 1.0
+
+
+def parse_time(value):
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def odds_cost(markets=DEFAULT_MARKETS, regions=DEFAULT_REGIONS):
+    """Requests charged for one odds call"""
+    return max(1, len(markets)) * max(1, len(regions))
+
+
+def scores_cost(days_from=None):
+    return 2 if days_from else 1
+
+
+def refresh_interval(kind, game, now):
+    """Seconds between fetches of `kind` for this game, or None if it needs none"""
+    until = (parse_time(game['commence_time']) - now).total_seconds()
+    if kind == 'scores':
+        if until > 0 or game.get('completed') or -until > MAX_GAME_SECONDS:
+            return None
+        return SCORES_REFRESH
+    for limit, interval in ODDS_REFRESH:
+        if limit is None or until < limit:
+            return interval
+    return None
+
+
+def game_weight(game, now, exposure=None):
+    """Urgency by closeness to commence time, scaled up by user exposure"""
+    until = (parse_time(game['commence_time']) - now).total_seconds()
+    urgency = 1.0 / (1.0 + max(0.0, until) / (6 * HOUR))
+    staked = (exposure or {}).get(game.get('id'), 0)
+    return urgency * (1.0 + EXPOSURE_WEIGHT * math.log1p(staked))
+
+
+class OddsQuotaPlanner:
+    """Budget tracking and fetch scheduling for The Odds API"""
+
+    def __init__(self, path=STATE_FILE, monthly_quota=MONTHLY_QUOTA, reserve=QUOTA_RESERVE,
+                 markets=DEFAULT_MARKETS, regions=DEFAULT_REGIONS):
+        self.path = path
+        self.monthly_quota = monthly_quota
+        self.reserve = reserve
+        self.markets = tuple(markets)
+        self.regions = tuple(regions)
+        self.state = {'month': None, 'used': 0, 'remaining': None,
+                      'day': None, 'day_start_remaining': None, 'last_fetched': {}}
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            self.state.update(json.load(f))
+
+    def save(self):
+        """Write the state atomically"""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(dict(self.state, version=1), f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    # Budget --------------------------------------------------------------
+
+    def _roll(self, now):
+        """Reset counters on a new month; fix the daily allowance on a new day"""
+        month = now.strftime('%Y-%m')
+        if self.state['month'] != month:
+            self.state.update(month=month, used=0, remaining=None, day=None)
+        day = now.strftime('%Y-%m-%d')
+        if self.state['day'] != day:
+            self.state['day'] = day
+            self.state['day_start_remaining'] = self.remaining(now)
+
+    def remaining(self, now=None):
+        """Requests left this month (provider count when known)"""
+        now = now or datetime.now(timezone.utc)
+        if self.state['month'] != now.strftime('%Y-%m'):
+            return self.monthly_quota
+        if self.state['remaining'] is not None:
+            return self.state['remaining']
+        return self.monthly_quota - self.state['used']
+
+    def update_from_headers(self, headers, cost=1, now=None):
+        """Record a response's usage headers (or our own cost when they are missing)"""
+        now = now or datetime.now(timezone.utc)
+        self._roll(now)
+        used = headers.get('x-requests-used')
+        remaining = headers.get('x-requests-remaining')
+        if used is not None and remaining is not None:
+            self.state['used'] = int(float(used))
+            self.state['remaining'] = int(float(remaining))
+        else:
+            self.state['used'] += cost
+            if self.state['remaining'] is not None:
+                self.state['remaining'] = max(0, self.state['remaining'] - cost)
+
+    def day_budget(self, now=None):
+        """Requests still available today under an even spread over the month"""
+        now = now or datetime.now(timezone.utc)
+        self._roll(now)
+        next_month = datetime(now.year + now.month // 12, now.month % 12 + 1, 1, tzinfo=timezone.utc)
+        today = datetime(now.year, now.month, now.day, tzinfo=timezone.utc)
+        days_left = max(1.0, (next_month - today).total_seconds() / DAY)
+
+        allowance = max(0, self.state['day_start_remaining'] - self.reserve) / days_left
+        spent_today = self.state['day_start_remaining'] - self.remaining(now)
+        return max(0.0, allowance - spent_today)
+
+    # Scheduling ----------------------------------------------------------
+
+    def cost(self, kind):
+        return odds_cost(self.markets, self.regions) if kind == 'odds' else scores_cost()
+
+    def last_fetched(self, kind, sport):
+        stamp = self.state['last_fetched'].get(f"{kind}:{sport}")
+        return parse_time(stamp) if stamp else None
+
+    def candidates(self, games, exposure=None, now=None):
+        """Every (kind, sport) fetch with at least one overdue game, with its value"""
+        now = now or datetime.now(timezone.utc)
+        by_sport = {}
+        for game in games:
+            by_sport.setdefault(game['sport_key'], []).append(game)
+
+        tasks = []
+        for sport, sport_games in by_sport.items():
+            for kind in ('scores', 'odds'):
+                fetched = self.last_fetched(kind, sport)
+                age = (now - fetched).total_seconds() if fetched else float('inf')
+                value = 0.0
+                due_games = 0
+                for game in sport_games:
+                    interval = refresh_interval(kind, game, now)
+                    if interval is None or age < interval:
+                        continue
+                    due_games += 1
+                    value += game_weight(game, now, exposure) * min(MAX_OVERDUE, age / interval)
+                if due_games:
+                    cost = self.cost(kind)
+                    tasks.append({'kind': kind, 'sport': sport, 'cost': cost, 'games': due_games,
+                                  'value': value, 'priority': value / cost})
+        tasks.sort(key=lambda task: task['priority'], reverse=True)
+        return tasks
+
+    def plan(self, games, exposure=None, now=None):
+        """Fetches to make now: best value per request first, within today's budget.
+
+        Scores fetches for live games always fit if anything is left this
+        month above the reserve, since settlement depends on them.
+        """
+        now = now or datetime.now(timezone.utc)
+        budget = self.day_budget(now)
+        month_left = self.remaining(now) - self.reserve
+
+        chosen = []
+        for task in self.candidates(games, exposure, now):
+            if task['cost'] > month_left:
+                continue
+            if task['cost'] <= budget or task['kind'] == 'scores':
+                chosen.append(task)
+                budget -= task['cost']
+                month_left -= task['cost']
+        return chosen
+
+    def record_fetch(self, task, headers, now=None):
+        """Mark a planned fetch as done and account for it"""
+        now = now or datetime.now(timezone.utc)
+        self.update_from_headers(headers, cost=task['cost'], now=now)
+        self.state['last_fetched'][f"{task['kind']}:{task['sport']}"] = now.isoformat(timespec='seconds')
+
+    def status(self, now=None):
+        now = now or datetime.now(timezone.utc)
+        return {'month': now.strftime('%Y-%m'), 'remaining': self.remaining(now),
+                'reserve': self.reserve, 'day_budget': self.day_budget(now)}
+
+
+def load_games(paths):
+    """Odds API game objects (odds or scores responses) from saved files"""
+    games = {}
+    for path in paths:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        for game in data if isinstance(data, list) else []:
+            if 'commence_time' in game and 'sport_key' in game:
+                games[game['id']] = game
+    return list(games.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="The Odds API quota planner")
+    parser.add_argument('--state', default=STATE_FILE)
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('status', help="Show this month's budget")
+    plan_cmd = sub.add_parser('plan', help="Show the fetches the planner would make now")
+    plan_cmd.add_argument('games', nargs='+', help="Saved Odds API odds/scores responses")
+    plan_cmd.add_argument('--exposure', help="JSON {game_id: picks or coins staked}")
+    args = parser.parse_args()
+
+    planner = OddsQuotaPlanner(args.state)
+    status = planner.status()
+    print(f"{status['month']}: {status['remaining']} requests left "
+          f"({status['reserve']} reserved), {status['day_budget']:.1f} available today")
+
+    if args.command == 'plan':
+        exposure = {}
+        if args.exposure:
+            with open(args.exposure, 'r') as f:
+                exposure = json.load(f)
+        games = load_games(args.games)
+        tasks = planner.plan(games, exposure)
+        print(f"\n{len(games)} games, {len(tasks)} fetches planned:")
+        for task in tasks:
+            print(f"  {task['kind']:<7} {task['sport']:<32} cost {task['cost']}  "
+                  f"{task['games']} games due  priority {task['priority']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
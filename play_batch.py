@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Chunked, parallel inappproducts.batchUpdate with retries for failed SKUs only.
+
+batch_create_cards used to fall back to inserting every card one by one
+when batchUpdate raised anything, re-sending SKUs that had already gone
+through. BatchExecutor instead:
+
+    - splits the products into chunks of at most BATCH_LIMIT requests
+    - sends up to max_workers chunks at once, each worker thread over its own
+      http connection (httplib2.Http, which a googleapiclient service shares
+      between callers, is not thread-safe), and at most
+      max_calls_per_second calls overall
+    - treats SKUs missing from a successful response as failed
+    - on 429 / 5xx / network errors, resends the chunk with exponential backoff
+    - on other errors, fails the SKUs the error message names and resends the
+      rest; if it names none, halves the chunk to isolate the bad product in
+      log2(n) calls instead of n
+"""
+
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+BATCH_LIMIT = 100
+DEFAULT_WORKERS = 4
+MAX_RETRIES = 5
+BASE_DELAY = 1.0
+# Well under the androidpublisher default of 3000 queries a minute
+DEFAULT_CALLS_PER_SECOND = 10
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Auth or missing-app errors apply to the whole request, whatever it holds
+CHUNK_FATAL_STATUS = {401, 403, 404}
+
+
+def error_status(error):
+    """HTTP status of a googleapiclient HttpError (None for network errors etc.)"""
+    resp = getattr(error, 'resp', None)
+    status = getattr(resp, 'status', None)
+    return int(status) if status is not None else None
+
+
+def error_text(error):
+    content = getattr(error, 'content', None)
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', 'replace')
+    return f"{error} {content or ''}"
+
+
+def retry_call(func, max_retries=MAX_RETRIES, base_delay=BASE_DELAY):
+    """func() with jittered exponential backoff on 429 / 5xx / network errors"""
+    for attempt in range(max_retries + 1):
+        try:
+            return func()
+        except Exception as e:
+            status = error_status(e)
+            retryable = status is None or status in RETRYABLE_STATUS
+            if not retryable or attempt == max_retries:
+                raise
+            time.sleep(base_delay * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+
+class RateLimiter:
+    """Spaces calls at least 1 / calls_per_second apart across threads"""
+
+    def __init__(self, calls_per_second):
+        self.interval = 1.0 / calls_per_second if calls_per_second else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def service_http_factory(service):
+    """Per-thread http factory for a googleapiclient service (None when it has no credentials, like the fake)"""
+    creds = getattr(getattr(service, '_http', None), 'credentials', None)
+    if creds is None:
+        return None
+    from play_service import authorized_http
+    return partial(authorized_http, creds)
+
+
+class BatchExecutor:
+    """Pushes product bodies through batchUpdate, retrying only what failed"""
+
+    def __init__(self, service, package_name, chunk_size=BATCH_LIMIT, max_workers=DEFAULT_WORKERS,
+                 max_retries=MAX_RETRIES, base_delay=BASE_DELAY, max_calls_per_second=DEFAULT_CALLS_PER_SECOND,
+                 http_factory=None):
+        """http_factory() builds one thread's http; by default one is derived from the service's credentials"""
+        self.service = service
+        self.package_name = package_name
+        self.chunk_size = min(chunk_size, BATCH_LIMIT)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.http_factory = http_factory or service_http_factory(service)
+        self.limiter = RateLimiter(max_calls_per_second)
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _http(self):
+        """This thread's http, built on first use (None to use the service's own)"""
+        if self.http_factory is None:
+            return None
+        if not hasattr(self._local, 'http'):
+            self._local.http = self.http_factory()
+        return self._local.http
+
+    def _request(self, body):
+        return {'packageName': self.package_name, 'sku': body['sku'], 'inappproduct': body,
+                'allowMissing': True, 'autoConvertMissingPrices': True}
+
+    def _send(self, bodies, attempt):
+        """One batchUpdate call after the backoff for this attempt; returns (returned skus, error)"""
+        if attempt:
+            time.sleep(self.base_delay * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+        self.limiter.wait()
+        with self._lock:
+            self.calls += 1
+        try:
+            request = self.service.inappproducts().batchUpdate(
+                packageName=self.package_name,
+                body={'requests': [self._request(body) for body in bodies]}
+            )
+            http = self._http()
+            result = request.execute(http=http) if http is not None else request.execute()
+        except Exception as e:
+            return None, e
+        return {product.get('sku') for product in result.get('inappproducts', [])}, None
+
+    def run(self, bodies):
+        """Push every body; returns {'succeeded': [skus], 'failed': {sku: error}}"""
+        succeeded, failed = [], {}
+        pending = [(bodies[i:i + self.chunk_size], 0) for i in range(0, len(bodies), self.chunk_size)]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending:
+                futures = [(chunk, attempt, pool.submit(self._send, chunk, attempt))
+                           for chunk, attempt in pending]
+                pending = []
+                for chunk, attempt, future in futures:
+                    returned, error = future.result()
+                    for retry, next_attempt, reason in self._outcome(chunk, attempt, returned, error,
+                                                                     succeeded, failed):
+                        if next_attempt > self.max_retries:
+                            for body in retry:
+                                failed[body['sku']] = reason
+                        else:
+                            pending.append((retry, next_attempt))
+
+        return {'succeeded': succeeded, 'failed': failed}
+
+    def _outcome(self, chunk, attempt, returned, error, succeeded, failed):
+        """Record successes and permanent failures; returns [(bodies to resend, attempt, reason)]"""
+        if error is None:
+            missing = []
+            for body in chunk:
+                if body['sku'] in returned:
+                    succeeded.append(body['sku'])
+                else:
+                    missing.append(body)
+            return [(missing, attempt + 1, "not in batchUpdate response")] if missing else []
+
+        status = error_status(error)
+        reason = str(error)[:200]
+        if status is None or status in RETRYABLE_STATUS:
+            return [(chunk, attempt + 1, reason)]
+        if status in CHUNK_FATAL_STATUS:
+            for body in chunk:
+                failed[body['sku']] = reason
+            return []
+
+        text = error_text(error)
+        named = [body for body in chunk if re.search(rf"\b{re.escape(body['sku'])}\b", text)]
+        if named:
+            for body in named:
+                failed[body['sku']] = reason
+            rest = [body for body in chunk if body not in named]
+            return [(rest, attempt, reason)] if rest else []
+        if len(chunk) == 1 or status != 400:
+            # Only a 400 validation error is worth bisecting to find the bad item
+            for body in chunk:
+                failed[body['sku']] = reason
+            return []
+        middle = len(chunk) // 2
+        return [(chunk[:middle], attempt, reason), (chunk[middle:], attempt, reason)]
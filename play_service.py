@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Shared Google Play Developer API (androidpublisher v3) access for the
+product scripts.
+
+Each script used to repeat the same token.json dance and call
+build('androidpublisher', 'v3'), which parses (and, on older client
+versions, downloads) the ~1 MB discovery document every run. Here:
+
+    - get_credentials() loads token.json, refreshes it if expired and
+      writes the refreshed token back so the next run skips the refresh;
+      the browser flow only runs when there is no usable token at all
+    - the discovery document is cached in play_discovery_v3.json (a week)
+      and the service is built from it with build_from_document
+    - get_service() builds the service on first use and returns the same
+      one afterwards, so importing a script costs nothing
+    - authorized_http() gives each worker thread its own connection;
+      the service's shared httplib2.Http is not thread-safe
+
+Google client libraries are imported inside the functions, so tools that
+only read the catalog start without loading them.
+"""
+
+import json
+import os
+import time
+from functools import lru_cache
+
+import requests
+
+PACKAGE_NAME = 'com.braggingrights.bragging_rights_app'
+SCOPES = ['https://www.googleapis.com/auth/androidpublisher']
+
+TOKEN_FILE = 'token.json'
+CLIENT_SECRETS_FILE = 'credentials.json'
+DISCOVERY_CACHE_FILE = 'play_discovery_v3.json'
+DISCOVERY_URL = 'https://androidpublisher.googleapis.com/$discovery/rest?version=v3'
+DISCOVERY_TTL = 7 * 24 * 3600
+HTTP_TIMEOUT = 60
+
+
+def _print_credentials_help():
+    print("ERROR: Missing credentials.json file!")
+    print("\nTo create OAuth credentials:")
+    print("1. Go to https://console.cloud.google.com")
+    print("2. Select your project")
+    print("3. Go to APIs & Services -> Credentials")
+    print("4. Create Credentials -> OAuth client ID")
+    print("5. Application type: Desktop app")
+    print("6. Download JSON -> Save as 'credentials.json' in this folder")
+
+
+def get_credentials(interactive=True):
+    """OAuth credentials from token.json, refreshed and saved back when expired.
+
+    With interactive=True and no usable token, runs the browser flow from
+    credentials.json. Returns None when no credentials can be had.
+    """
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+
+    creds = None
+    if os.path.exists(TOKEN_FILE):
+        creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+
+    if creds and creds.valid:
+        return creds
+
+    if creds and creds.expired and creds.refresh_token:
+        creds.refresh(Request())
+    elif interactive:
+        if not os.path.exists(CLIENT_SECRETS_FILE):
+            _print_credentials_help()
+            return None
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        flow = InstalledAppFlow.from_client_secrets_file(CLIENT_SECRETS_FILE, SCOPES)
+        creds = flow.run_local_server(port=0)
+    else:
+        print("No valid credentials")
+        return None
+
+    # Save the credentials for the next run
+    with open(TOKEN_FILE, 'w') as token:
+        token.write(creds.to_json())
+    return creds
+
+
+def discovery_document(path=DISCOVERY_CACHE_FILE, ttl=DISCOVERY_TTL):
+    """androidpublisher v3 discovery document, from disk while younger than ttl"""
+    if os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    try:
+        response = requests.get(DISCOVERY_URL, timeout=30)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        if os.path.exists(path):
+            # A stale document still describes the API
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        print(f"Could not fetch discovery document: {e}")
+        return None
+
+    document = response.text
+    json.loads(document)  # don't cache an error page
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(document)
+    os.replace(tmp_path, path)
+    return document
+
+
+@lru_cache(maxsize=None)
+def get_service(interactive=True):
+    """The androidpublisher v3 service, built once per process (None without credentials)"""
+    creds = get_credentials(interactive)
+    if not creds:
+        return None
+
+    from googleapiclient.discovery import build, build_from_document
+
+    document = discovery_document()
+    if document:
+        return build_from_document(document, credentials=creds)
+    return build('androidpublisher', 'v3', credentials=creds)
+
+
+def authorized_http(creds=None):
+    """A new AuthorizedHttp over its own httplib2.Http, for one thread's execute(http=...) calls"""
+    import google_auth_httplib2
+    import httplib2
+
+    creds = creds or get_credentials(interactive=False)
+    return google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
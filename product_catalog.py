@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Single in-app product catalog and diff-based Play Console sync.
+
+iap_catalog.json is the one list of SKUs. The product scripts
+(create_all_products, add_power_cards, batch_create_cards,
+add_all_remaining_cards, create_products_oauth and
+bragging_rights_app/create_iap_products) all read it instead of carrying
+their own copies, which had drifted in descriptions and purchaseType.
+
+sync() lists the products on Play once, diffs them against the catalog
+field by field and pushes only the SKUs that differ, in batchUpdate
+calls. Products on Play that are not in the catalog are reported, never
+touched. purchaseType cannot change after creation, so a mismatch there
+is reported as a conflict instead of pushed.
+
+Usage:
+    python product_catalog.py list
+    python product_catalog.py diff [--category coins]
+    python product_catalog.py sync [--category coins] [--dry-run]
+    python product_catalog.py export live_catalog.json
+    python product_catalog.py export --csv products.csv
+"""
+
+import argparse
+import copy
+import csv
+import json
+import os
+import sys
+
+from play_batch import BASE_DELAY, BatchExecutor, retry_call
+from play_service import get_service
+
+CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'iap_catalog.json')
+# Fields compared and pushed; everything else on the Play side (regional prices etc.) is left alone
+SYNC_FIELDS = ('status', 'defaultPrice', 'defaultLanguage', 'listings')
+
+
+def load_catalog(path=CATALOG_FILE):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def play_body(product):
+    """Catalog entry -> Play API product body (drops catalog-only keys)"""
+    return {key: copy.deepcopy(value) for key, value in product.items() if key != 'category'}
+
+
+def catalog_products(category=None, skus=None, path=CATALOG_FILE):
+    """Products as Play API bodies, optionally filtered by category or SKU list (kept in catalog order)"""
+    products = []
+    for product in load_catalog(path)['products']:
+        if category and product['category'] != category:
+            continue
+        if skus is not None and product['sku'] not in skus:
+            continue
+        products.append(play_body(product))
+    return products
+
+
+def card_summary(product, language='en-US'):
+    """The short {'sku', 'price', 'title', 'desc'} shape the batch scripts print from"""
+    listing = product['listings'][language]
+    return {'sku': product['sku'], 'price': product['defaultPrice']['priceMicros'],
+            'title': listing['title'], 'desc': listing['description']}
+
+
+def _flatten(value, prefix=''):
+    """{'a': {'b': 1}} -> {'a.b': 1}, with prices compared as integers"""
+    if isinstance(value, dict):
+        flat = {}
+        for key, item in value.items():
+            flat.update(_flatten(item, f"{prefix}.{key}" if prefix else key))
+        return flat
+    if prefix.endswith('priceMicros') and value is not None:
+        return {prefix: int(value)}
+    return {prefix: value}
+
+
+def diff_product(wanted, remote):
+    """Field-level changes {path: (remote value, catalog value)} for the synced fields.
+
+    Only paths the catalog defines are compared, so locales or fields Play
+    adds on its own never show up as changes.
+    """
+    changes = {}
+    for field in SYNC_FIELDS:
+        if field not in wanted:
+            continue
+        have = _flatten(remote.get(field), field)
+        for path, value in _flatten(wanted[field], field).items():
+            if have.get(path) != value:
+                changes[path] = (have.get(path), value)
+    return changes
+
+
+def diff_catalog(products, remote_products):
+    """Plan: {'insert': [...], 'update': [(product, changes)], 'unchanged', 'unmanaged', 'conflicts'}"""
+    remote = {product['sku']: product for product in remote_products}
+    plan = {'insert': [], 'update': [], 'unchanged': [], 'unmanaged': [], 'conflicts': []}
+
+    for product in products:
+        existing = remote.get(product['sku'])
+        if existing is None:
+            plan['insert'].append(product)
+            continue
+        if existing.get('purchaseType') and existing['purchaseType'] != product.get('purchaseType'):
+            plan['conflicts'].append((product['sku'], 'purchaseType', existing['purchaseType'],
+                                      product.get('purchaseType')))
+        changes = diff_product(product, existing)
+        if changes:
+            plan['update'].append((product, changes))
+        else:
+            plan['unchanged'].append(product['sku'])
+
+    wanted = {product['sku'] for product in products}
+    plan['unmanaged'] = sorted(sku for sku in remote if sku not in wanted)
+    return plan
+
+
+def update_body(product, remote, package_name):
+    """Body for pushing a product: catalog fields over the remote copy, remote-only locales kept"""
+    body = copy.deepcopy(remote or {})
+    for key, value in product.items():
+        if key == 'listings':
+            body['listings'] = dict(body.get('listings', {}), **value)
+        else:
+            body[key] = copy.deepcopy(value)
+    body['packageName'] = package_name
+    if remote and remote.get('purchaseType'):
+        body['purchaseType'] = remote['purchaseType']
+    return body
+
+
+def list_remote(service, package_name, base_delay=BASE_DELAY):
+    """Every in-app product on Play (one list call per page, retried on transient errors)"""
+    products = []
+    token = None
+    while True:
+        params = {'packageName': package_name}
+        if token:
+            params['token'] = token
+        result = retry_call(service.inappproducts().list(**params).execute, base_delay=base_delay)
+        products.extend(result.get('inappproduct', []))
+        token = result.get('tokenPagination', {}).get('nextPageToken')
+        if not token:
+            return products
+
+
+def push(service, package_name, bodies, **batch_options):
+    """batchUpdate the bodies (allowMissing, so inserts and updates share one path).
+
+    batch_options go to BatchExecutor (chunk_size, max_workers, ...).
+    Returns (pushed skus, {sku: error}).
+    """
+    result = BatchExecutor(service, package_name, **batch_options).run(bodies)
+    return result['succeeded'], result['failed']
+
+
+def sync(service, catalog=None, dry_run=False, category=None, batch_options=None):
+    """List once, diff, push only what changed. Returns the plan plus push results.
+
+    With a category, only that part of the catalog is synced (and no other
+    SKU is reported as unmanaged).
+    """
+    catalog = catalog or load_catalog()
+    package_name = catalog['packageName']
+    products = [play_body(product) for product in catalog['products']
+                if category is None or product['category'] == category]
+
+    remote_products = list_remote(service, package_name, (batch_options or {}).get('base_delay', BASE_DELAY))
+    remote = {product['sku']: product for product in remote_products}
+    plan = diff_catalog(products, remote_products)
+    if category:
+        plan['unmanaged'] = []
+    plan['pushed'], plan['failed'] = [], {}
+
+    bodies = [update_body(product, None, package_name) for product in plan['insert']]
+    bodies += [update_body(product, remote[product['sku']], package_name) for product, _ in plan['update']]
+    if bodies and not dry_run:
+        plan['pushed'], plan['failed'] = push(service, package_name, bodies, **(batch_options or {}))
+    return plan
+
+
+def print_plan(plan):
+    for product in plan['insert']:
+        print(f"+ {product['sku']:<22} new")
+    for product, changes in plan['update']:
+        print(f"~ {product['sku']:<22} {len(changes)} field(s)")
+        for path, (old, new) in sorted(changes.items()):
+            print(f"      {path}: {old!r} -> {new!r}")
+    for sku, field, old, new in plan['conflicts']:
+        print(f"! {sku:<22} {field} is {old!r} on Play, {new!r} in catalog (cannot change)")
+    for sku in plan['unmanaged']:
+        print(f"? {sku:<22} on Play but not in the catalog")
+    print(f"\n{len(plan['insert'])} new, {len(plan['update'])} changed, "
+          f"{len(plan['unchanged'])} unchanged, {len(plan['unmanaged'])} unmanaged")
+
+
+def export_csv(products, path, language='en-US'):
+    """Play Console bulk-import CSV (same layout as bragging_rights_app/br_coins_products.csv)"""
+    header = ['Product ID', 'Published State (published/unpublished)', 'Title', 'Description',
+              'Auto Translate', 'Locale; Title; Description', 'Locale; Title; Description', 'Price']
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(header)
+        for product in products:
+            listing = product['listings'][language]
+            state = 'published' if product.get('status') == 'active' else 'unpublished'
+            writer.writerow([product['sku'], state, listing['title'], listing['description'], 'false', '', '',
+                             product['defaultPrice']['priceMicros']])
+
+
+def export_remote(remote_products, catalog, path):
+    """Write what is live on Play as a catalog file (categories kept from the current catalog)"""
+    categories = {product['sku']: product['category'] for product in catalog['products']}
+    products = []
+    for remote in sorted(remote_products, key=lambda product: product['sku']):
+        entry = {'sku': remote['sku'], 'category': categories.get(remote['sku'], 'uncategorized')}
+        for field in ('status', 'purchaseType') + SYNC_FIELDS[1:]:
+            if field in remote:
+                entry[field] = remote[field]
+        products.append(entry)
+    data = {'version': catalog.get('version', 1), 'packageName': catalog['packageName'], 'products': products}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    return len(products)
+
+
+def print_products(products, package_name):
+    if not products:
+        print(f"\nNo products found for {package_name}")
+        return
+    print(f"\nExisting products for {package_name}:\n")
+    print("=" * 60)
+    for product in products:
+        title = product.get('listings', {}).get('en-US', {}).get('title', 'No title')
+        print(f"  {product.get('sku', 'Unknown SKU'):<25} {product.get('status', 'Unknown'):<10} {title}")
+    print("=" * 60)
+    print(f"Total: {len(products)} products")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="In-app product catalog tools (non-interactive)")
+    parser.add_argument('--catalog', default=CATALOG_FILE)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('list', help="List the products live on Play")
+    diff_cmd = sub.add_parser('diff', help="Show what sync would change")
+    diff_cmd.add_argument('--category')
+    sync_cmd = sub.add_parser('sync', help="Push new and changed products")
+    sync_cmd.add_argument('--category', help="Only sync one catalog category (e.g. coins)")
+    sync_cmd.add_argument('--dry-run', action='store_true')
+    export_cmd = sub.add_parser('export', help="Write the live products as a catalog file, or the catalog as CSV")
+    export_cmd.add_argument('output')
+    export_cmd.add_argument('--csv', action='store_true', help="Play Console CSV of the catalog (no API calls)")
+    args = parser.parse_args(argv)
+
+    catalog = load_catalog(args.catalog)
+
+    if args.command == 'export' and args.csv:
+        products = [play_body(product) for product in catalog['products']]
+        export_csv(products, args.output)
+        print(f"Wrote {len(products)} products to {args.output}")
+        return 0
+
+    service = get_service(interactive=False)
+    if not service:
+        return 1
+
+    if args.command == 'list':
+        print_products(list_remote(service, catalog['packageName']), catalog['packageName'])
+        return 0
+
+    if args.command == 'export':
+        count = export_remote(list_remote(service, catalog['packageName']), catalog, args.output)
+        print(f"Wrote {count} products to {args.output}")
+        return 0
+
+    dry_run = args.command == 'diff' or args.dry_run
+    plan = sync(service, catalog, dry_run=dry_run, category=args.category)
+    print_plan(plan)
+
+    if plan['pushed'] or plan['failed']:
+        print(f"Pushed {len(plan['pushed'])} products")
+        for sku, error in plan['failed'].items():
+            print(f"X {sku:<22} {error}")
+    return 1 if plan['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
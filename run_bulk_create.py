@@ -1,20 +1,13 @@
 #!/usr/bin/env python
 """
-Run the bulk product creation script
+Run the bulk product creation (sync the whole catalog to Play)
+
+Same as `python product_catalog.py sync`, without the interactive menu in
+create_all_products.py.
 """
 
-import subprocess
 import sys
 
-# Run the script with option 1
-process = subprocess.Popen(
-    [sys.executable, 'create_all_products.py'],
-    stdin=subprocess.PIPE,
-    stdout=subprocess.PIPE,
-    stderr=subprocess.STDOUT,
-    text=True
-)
+import product_catalog
 
-# Send option 1 to create products
-output, _ = process.communicate(input='1\n')
-print(output)
\ No newline at end of file
+sys.exit(product_catalog.main(['sync'] + sys.argv[1:]))
@@ -1,20 +1,12 @@
 #!/usr/bin/env python
 """
-Run the create_products_oauth.py script with option 1 (create products)
+Create/update the BR Coins products (what option 1 of create_products_oauth.py does)
+
+Same as `python product_catalog.py sync --category coins`.
 """
 
-import subprocess
 import sys
 
-# Run the script with option 1
-process = subprocess.Popen(
-    [sys.executable, 'create_products_oauth.py'],
-    stdin=subprocess.PIPE,
-    stdout=subprocess.PIPE,
-    stderr=subprocess.STDOUT,
-    text=True
-)
+import product_catalog
 
-# Send option 1 to create products
-output, _ = process.communicate(input='1\n')
-print(output)
\ No newline at end of file
+sys.exit(product_catalog.main(['sync', '--category', 'coins'] + sys.argv[1:]))
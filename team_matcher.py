@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Hash-indexed team matcher for ESPN scoreboard events.
+
+test_nba_api.test_matching used to normalize every event on a date and
+compare it against the target pair, repeating the normalization for every
+lookup. TeamMatcher normalizes a slate once and indexes it by an
+order-insensitive (home, away) key, so each lookup is a dict access.
+
+Typical use at settlement time (one scoreboard call for a 3-day window):
+
+    scoreboard = fetch(f"...scoreboard?dates={espn_date_range('20260115')}")
+    matcher = TeamMatcher(scoreboard['events'])
+    for bet in bets:
+        event = matcher.lookup(bet['homeTeam'], bet['awayTeam'], bet['gameDate'])
+
+Names are resolved through the alias table built by
+generate_team_aliases.py, so "Thunder", "OKC" and "Oklahoma City Thunder"
+all index to the same team. Names the table doesn't know (or every name,
+before the table has been generated) fall back to the original hard-coded
+nickname rules in FALLBACK_NICKNAMES.
+"""
+
+import json
+import os
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
+from zoneinfo import ZoneInfo
+
+from name_normalization import clean_team_name
+
+
+ALIAS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'team_aliases.json')
+
+_alias_tables = None
+
+# ESPN's US leagues schedule in Eastern time; dates= days follow it
+DEFAULT_TIMEZONE = 'America/New_York'
+
+# The rules normalize_team_name used before the generated table:
+# nickname -> (word that marks the full name, canonical name)
+FALLBACK_NICKNAMES = {
+    'thunder': ('oklahoma', 'oklahoma city thunder'),
+    'rockets': ('houston', 'houston rockets'),
+}
+FALLBACK_LEAGUES = (None, 'all', 'nba')
+
+
+def load_alias_tables(path=ALIAS_FILE):
+    """Load team_aliases.json (see generate_team_aliases.py) once per process"""
+    if _alias_tables is not None:
+        return _alias_tables
+
+    leagues = {}
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            leagues = json.load(f).get('leagues', {})
+    else:
+        print(f"Warning: {path} not found, run generate_team_aliases.py")
+
+    return install_alias_tables(leagues)
+
+
+def install_alias_tables(leagues):
+    """Use {league: {alias: canonical}} as the alias tables for this process.
+
+    A None canonical marks an alias that is ambiguous within its league.
+    Adds an 'all' table holding the aliases every league agrees on, for
+    callers that don't know which league a name belongs to; an alias any
+    league marks as ambiguous is left out of it.
+    """
+    global _alias_tables
+
+    combined = {}
+    for table in leagues.values():
+        for alias, canonical in table.items():
+            combined.setdefault(alias, set()).add(canonical)
+
+    _alias_tables = dict(leagues)
+    _alias_tables['all'] = {alias: next(iter(canonicals)) for alias, canonicals in combined.items()
+                            if len(canonicals) == 1 and None not in canonicals}
+    return _alias_tables
+
+
+def _fallback_name(normalized):
+    for nickname, (marker, canonical) in FALLBACK_NICKNAMES.items():
+        if nickname in normalized and marker not in normalized:
+            return canonical
+    return normalized
+
+
+def normalize_team_name(team, league=None):
+    """Normalize team name for matching: clean it, then resolve aliases"""
+    normalized = clean_team_name(team)
+    aliases = load_alias_tables().get(league or 'all', {})
+    if normalized in aliases:
+        return aliases[normalized] or normalized
+    if league in FALLBACK_LEAGUES:
+        return _fallback_name(normalized)
+    return normalized
+
+
+def matchup_key(team_a, team_b):
+    """Order-insensitive key for a pair of already-normalized names"""
+    return (team_a, team_b) if team_a <= team_b else (team_b, team_a)
+
+
+def event_teams(event):
+    """Return (home_name, away_name) display names for an ESPN event"""
+    competition = event.get('competitions', [{}])[0]
+    competitors = competition.get('competitors', [])
+    if len(competitors) < 2:
+        return None, None
+
+    home_team = next((c for c in competitors if c.get('homeAway') == 'home'), {})
+    away_team = next((c for c in competitors if c.get('homeAway') == 'away'), {})
+    return (home_team.get('team', {}).get('displayName', ''),
+            away_team.get('team', {}).get('displayName', ''))
+
+
+def parse_match_date(value):
+    """'YYYYMMDD', 'YYYY-MM-DD', date or datetime -> date"""
+    if value is None or (isinstance(value, date) and not isinstance(value, datetime)):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    value = value.replace('-', '')
+    return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+
+
+def event_dates(event, tz):
+    """(UTC date, local date) an ESPN event falls on; (None, None) if undated"""
+    raw = event.get('date') or event.get('competitions', [{}])[0].get('date')
+    if not raw:
+        return None, None
+    start = datetime.fromisoformat(raw.replace('Z', '+00:00'))
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return start.astimezone(timezone.utc).date(), start.astimezone(tz).date()
+
+
+def espn_date_range(center, days_before=1, days_after=1):
+    """ESPN scoreboard `dates=` value covering a window around a date"""
+    center = parse_match_date(center)
+    start = center - timedelta(days=days_before)
+    end = center + timedelta(days=days_after)
+    return f"{start:%Y%m%d}-{end:%Y%m%d}"
+
+
+class TeamMatcher:
+    """Index of ESPN events keyed by normalized matchup.
+
+    Events can span several days (one `dates=YYYYMMDD-YYYYMMDD` scoreboard
+    call). Each event remembers both its UTC date and its date in the
+    league's local time zone, so a late West Coast game that ESPN files
+    under the next UTC day still matches the local date a bet was placed on.
+    """
+
+    def __init__(self, events=(), league=None, normalize=None, tz=DEFAULT_TIMEZONE):
+        self.league = league
+        self.normalize = normalize or partial(normalize_team_name, league=league)
+        self.tz = ZoneInfo(tz) if isinstance(tz, str) else tz
+        self._index = {}
+        self.events = []
+        self.add_events(events)
+
+    def add_events(self, events):
+        """Index more events (e.g. another league or another date)"""
+        for event in events:
+            home_name, away_name = event_teams(event)
+            if not home_name or not away_name:
+                continue
+            key = matchup_key(self.normalize(home_name), self.normalize(away_name))
+            utc_date, local_date = event_dates(event, self.tz)
+            # Lists, because doubleheaders and series put one matchup on the index more than once
+            self._index.setdefault(key, []).append((event, utc_date, local_date))
+            self.events.append(event)
+
+    def __len__(self):
+        return len(self.events)
+
+    def lookup_all(self, home, away, on_date=None, tolerance_days=1):
+        """All events for a matchup, in either home/away order.
+
+        With `on_date`, events on that local or UTC date come first; if there
+        are none, events within `tolerance_days` of it are returned instead,
+        nearest first.
+        """
+        key = matchup_key(self.normalize(home), self.normalize(away))
+        entries = self._index.get(key, [])
+        if on_date is None:
+            return [event for event, _, _ in entries]
+
+        target = parse_match_date(on_date)
+        exact = [event for event, utc_date, local_date in entries if target in (utc_date, local_date)]
+        if exact:
+            return exact
+
+        window = timedelta(days=tolerance_days)
+        near = [(abs(local_date - target), event) for event, utc_date, local_date in entries
+                if utc_date and abs(local_date - target) <= window]
+        near.sort(key=lambda pair: pair[0])
+        return [event for _, event in near]
+
+    def lookup(self, home, away, on_date=None):
+        """First event for a matchup (on or near a date), or None"""
+        if on_date is None:
+            entries = self._index.get(matchup_key(self.normalize(home), self.normalize(away)))
+            return entries[0][0] if entries else None
+        matches = self.lookup_all(home, away, on_date)
+        return matches[0] if matches else None
+
+    def match_many(self, pairs):
+        """Resolve many (home, away) or (home, away, date) tuples; returns event ids (None if unmatched)"""
+        results = []
+        for pair in pairs:
+            event = self.lookup(*pair)
+            results.append(event.get('id') if event else None)
+        return results
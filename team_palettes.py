@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Precompute team/fighter color palettes from cached logo images.
+
+ESPN's `color`/`alternateColor` fields (see test_mlb_logo_integration.py)
+are missing for many teams and for every fighter. This batch job reads the
+asset manifest written by thumbnail_pipeline.py, extracts a dominant and a
+contrast color from each original image, and stores them next to the
+manifest so the app never has to compute palettes at render time.
+
+Output (asset_cache/palettes.json), keyed by asset content hash:
+    {"<sha256>": {"primary": "1d428a", "secondary": "ffffff", "text": "ffffff"}}
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+from thumbnail_pipeline import CACHE_DIR, load_manifest
+
+PALETTE_FILE = 'palettes.json'
+
+# Downscale before quantizing; palette extraction does not need full resolution
+SAMPLE_SIZE = 64
+PALETTE_COLORS = 8
+# Pixels more transparent than this are background, not logo
+ALPHA_CUTOFF = 128
+# WCAG AA for large text / UI components
+MIN_CONTRAST = 3.0
+
+
+def to_hex(rgb):
+    """(r, g, b) -> 'rrggbb' (same format ESPN uses for team colors)"""
+    return '%02x%02x%02x' % rgb
+
+
+def relative_luminance(rgb):
+    """WCAG relative luminance of an sRGB color"""
+    def channel(c):
+        c = c / 255.0
+        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    r, g, b = rgb
+    return 0.2126 * channel(r) + 0.7152 * channel(g) + 0.0722 * channel(b)
+
+
+def contrast_ratio(a, b):
+    """WCAG contrast ratio between two colors"""
+    la, lb = relative_luminance(a), relative_luminance(b)
+    lighter, darker = max(la, lb), min(la, lb)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def extract_palette(path):
+    """Return (primary, secondary, text) RGB tuples for one image, or None"""
+    with Image.open(path) as img:
+        img = img.convert('RGBA')
+        img.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE))
+
+        # Keep only opaque pixels so transparent logo backgrounds don't win
+        opaque = [(r, g, b) for r, g, b, a in img.getdata() if a >= ALPHA_CUTOFF]
+
+    if not opaque:
+        return None
+
+    sample = Image.new('RGB', (len(opaque), 1))
+    sample.putdata(opaque)
+    quantized = sample.quantize(colors=PALETTE_COLORS, method=Image.Quantize.MEDIANCUT)
+
+    palette = quantized.getpalette()
+    counts = sorted(quantized.getcolors(), reverse=True)
+    colors = [tuple(palette[index * 3:index * 3 + 3]) for _, index in counts]
+
+    primary = colors[0]
+
+    # Secondary: the most common remaining color that is readable against primary
+    secondary = next((c for c in colors[1:] if contrast_ratio(primary, c) >= MIN_CONTRAST), None)
+    if secondary is None:
+        secondary = (255, 255, 255) if relative_luminance(primary) < 0.5 else (0, 0, 0)
+
+    # Text color on top of primary: whichever of white/black contrasts more
+    white, black = (255, 255, 255), (0, 0, 0)
+    text = white if contrast_ratio(primary, white) >= contrast_ratio(primary, black) else black
+
+    return primary, secondary, text
+
+
+def palette_job(job):
+    """Worker entry point: (digest, path) -> (digest, palette dict or None)"""
+    digest, path = job
+    try:
+        result = extract_palette(path)
+    except Exception as e:
+        print(f"  [FAIL] {digest[:12]}: {e}")
+        return digest, None
+
+    if result is None:
+        return digest, None
+    primary, secondary, text = result
+    return digest, {'primary': to_hex(primary), 'secondary': to_hex(secondary), 'text': to_hex(text)}
+
+
+def load_palettes(cache_dir=CACHE_DIR):
+    """Load stored palettes keyed by asset hash"""
+    path = os.path.join(cache_dir, PALETTE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def build_palettes(cache_dir=CACHE_DIR, workers=None, force=False):
+    """Extract palettes for every manifest asset that does not have one yet"""
+    manifest = load_manifest(cache_dir)
+    palettes = {} if force else load_palettes(cache_dir)
+
+    jobs = {}
+    for entry in manifest.values():
+        if entry['hash'] not in palettes:
+            jobs[entry['hash']] = entry['original']
+
+    print(f"Assets: {len(manifest)}, palettes to compute: {len(jobs)}")
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for digest, palette in pool.map(palette_job, jobs.items(), chunksize=8):
+                if palette:
+                    palettes[digest] = palette
+
+    path = os.path.join(cache_dir, PALETTE_FILE)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(palettes, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+    return palettes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract dominant/contrast colors from cached logos")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help="Recompute every palette")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Team Palette Extraction")
+    print("=" * 60)
+
+    palettes = build_palettes(cache_dir=args.cache_dir, workers=args.workers, force=args.force)
+
+    manifest = load_manifest(args.cache_dir)
+    for url, entry in list(manifest.items())[:5]:
+        palette = palettes.get(entry['hash'])
+        if palette:
+            print(f"  {url[-40:]:<40} Primary=#{palette['primary']}, Secondary=#{palette['secondary']}")
+
+    print(f"\nSaved {len(palettes)} palettes to {os.path.join(args.cache_dir, PALETTE_FILE)}")
+
+
+if __name__ == "__main__":
+    main()
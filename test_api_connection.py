@@ -2,31 +2,14 @@
 Test API connection and list any existing products
 """
 
-import os
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
-
-PACKAGE_NAME = 'com.braggingrights.bragging_rights_app'
-SCOPES = ['https://www.googleapis.com/auth/androidpublisher']
+from play_service import PACKAGE_NAME, get_service
 
 def test_connection():
     """Test connection and list products"""
-    creds = None
-    
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-    
-    if not creds:
-        print("No valid credentials")
+    service = get_service(interactive=False)
+    if not service:
         return
     
-    service = build('androidpublisher', 'v3', credentials=creds)
-    
     # Try to list products
     try:
         print(f"Testing connection for package: {PACKAGE_NAME}")
@@ -1,94 +1,58 @@
+import asyncio
+import time
+
 import requests
-from datetime import datetime, timedelta
-import json
-
-class BoxingDataAPI:
-    def __init__(self, api_key):
-        self.api_key = api_key
-        self.base_url = "https://boxing-data-api.p.rapidapi.com/v1"
-        self.headers = {
-            "x-rapidapi-host": "boxing-data-api.p.rapidapi.com",
-            "x-rapidapi-key": api_key
-        }
-
-    def get_all_events(self):
-        """Get all boxing events"""
-        url = f"{self.base_url}/events"
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"Error: {response.status_code}")
-            return None
-
-    def get_event_by_id(self, event_id):
-        """Get specific event details by ID"""
-        url = f"{self.base_url}/events/{event_id}"
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"Error: {response.status_code}")
-            return None
-
-    def search_events(self, page_num=1, page_size=25, date_sort="DESC"):
-        """Search events with pagination"""
-        url = f"{self.base_url}/events/"
-        params = {
-            "page_num": page_num,
-            "page_size": page_size,
-            "date_sort": date_sort
-        }
-        response = requests.get(url, headers=self.headers, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"Error: {response.status_code}")
-            return None
-
-    def get_schedule(self, days=7, past_hours=12, date_sort="ASC", page_num=1, page_size=25):
-        """Get event schedule for specified time period"""
-        url = f"{self.base_url}/events/schedule"
-        params = {
-            "days": days,
-            "past_hours": past_hours,
-            "date_sort": date_sort,
-            "page_num": page_num,
-            "page_size": page_size
-        }
-        response = requests.get(url, headers=self.headers, params=params)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            print(f"Error: {response.status_code}")
-            print(f"Response: {response.text}")
-            return None
 
-    def format_event_display(self, event):
-        """Format event for display"""
-        date_obj = datetime.fromisoformat(event['date'].replace('Z', '+00:00'))
-        formatted_date = date_obj.strftime("%B %d, %Y at %I:%M %p")
+from boxing_data_api import BoxingDataAPI
+
+
+# Offline checks (python -m pytest test_boxing_data_api.py); main() below hits the live API
+
+def collect_pages(page_lengths, prefetch=0, page_size=25):
+    """Run aiter_pages over fake pages; returns (items, pages requested)"""
+    requested = []
 
-        output = f"\n{'='*60}\n"
-        output += f"Event: {event['title']}\n"
-        output += f"Date: {formatted_date}\n"
-        output += f"Location: {event.get('location', 'TBA')}\n"
-        output += f"Venue: {event.get('venue', 'TBA')}\n"
+    def fetch_page(page_num):
+        requested.append(page_num)
+        time.sleep(0.05 if page_num == 1 else 0.01)
+        length = page_lengths[page_num - 1] if page_num <= len(page_lengths) else 0
+        return [f"{page_num}-{i}" for i in range(length)]
 
-        if event.get('promotion'):
-            output += f"Promotion: {event['promotion']}\n"
+    async def collect():
+        api = BoxingDataAPI("test-key", cache_path=None)
+        return [item async for item in api.aiter_pages(fetch_page, page_size=page_size, prefetch=prefetch)]
 
-        if event.get('broadcasters'):
-            broadcasters = []
-            for broadcaster in event['broadcasters']:
-                for country, network in broadcaster.items():
-                    broadcasters.append(f"{country}: {network}")
-            output += f"Broadcast: {', '.join(broadcasters)}\n"
+    return asyncio.run(collect()), requested
 
-        if event.get('poster_image_url'):
-            output += f"Poster: {event['poster_image_url']}\n"
 
-        return output
+def test_pages_stop_at_short_page_without_extra_calls():
+    items, requested = collect_pages([25, 25, 25, 10])
+    assert len(items) == 85
+    assert requested == [1, 2, 3, 4]
+
+
+def test_prefetch_stops_scheduling_after_short_page():
+    items, requested = collect_pages([25, 10], prefetch=3)
+    assert len(items) == 35
+    # Pages 1-4 go out together; page 2 is back short before page 1, so nothing past 4 is asked for
+    assert sorted(requested) == [1, 2, 3, 4]
+
+
+def test_network_error_serves_stale_cache(tmp_path):
+    api = BoxingDataAPI("test-key", cache_path=str(tmp_path / "cache.db"))
+    event = {'id': 'e1', 'title': 'Cached card', 'date': '2099-10-18T23:00:00Z'}
+    key = api._cache_key("/events/e1")
+    api.cache.put(key, event)
+    # Age the copy past any freshness window so a refetch is attempted
+    api.cache._db.execute("UPDATE responses SET fetched_at = 0 WHERE key = ?", (key,))
+
+    def timeout(*args, **kwargs):
+        raise requests.Timeout("read timed out")
+
+    api.session.get = timeout
+    assert api.get_event_by_id('e1') == event
+    assert api.get_event_by_id('missing') is None
+
 
 def main():
     # Your RapidAPI key
@@ -133,5 +97,23 @@ def main():
         if event_details.get('co_promotion'):
             print(f"Co-Promotions: {', '.join(event_details['co_promotion'])}")
 
+    # Test 4: Full schedule across every page
+    print("\n4. FULL SCHEDULE (All Pages, Next 30 Days):")
+    start = time.perf_counter()
+    full_schedule = api.get_full_schedule(days=30)
+    elapsed = time.perf_counter() - start
+    print(f"Fetched {len(full_schedule)} events in {elapsed:.2f}s")
+
+    # Test 5: Bulk details for every scheduled event (deduped, cache first)
+    print("\n5. BULK EVENT DETAILS:")
+    event_ids = [event['id'] for event in full_schedule if event.get('id')]
+    start = time.perf_counter()
+    details = api.get_events(event_ids)
+    elapsed = time.perf_counter() - start
+    print(f"Fetched {sum(1 for d in details if d)}/{len(event_ids)} event details in {elapsed:.2f}s")
+
+    if api.cache:
+        print(f"\nCache: {api.cache.stats()}")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Offline checks for boxing_sync (python -m pytest test_boxing_sync.py)"""
+
+import json
+import os
+
+from boxing_sync import BoxingStore
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'brown_vs_gongora_fights.json')
+
+
+def load_fights():
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_fighters_are_stored_and_found_by_full_name(tmp_path):
+    store = BoxingStore(str(tmp_path / 'store.db'))
+    for fight in load_fights():
+        assert store.upsert_fight(fight, '2025-09-20T00:00:00Z')
+
+    found = store.fights_for_fighter('Breyon Gorham')
+    assert [fight['id'] for fight in found] == ['689fce0958bc79939699ec5c']
+    assert store.fights_for_fighter('Gorham') == []
+
+    cards = store.cards_between('2025-09-20', '2025-09-22')
+    names = {(fight['home'], fight['away']) for card in cards for fight in card['fights']}
+    assert ('Breyon Gorham', 'Yomar Alamo') in names
+    store.close()
+
+
+def test_surname_rows_from_older_stores_are_reindexed(tmp_path):
+    path = str(tmp_path / 'store.db')
+    store = BoxingStore(path)
+    fight = load_fights()[0]
+    store.upsert_fight(fight, '2025-09-20T00:00:00Z')
+    # Rewind to what a store written before full names looked like
+    store.db.execute("UPDATE fights SET fighter_1 = 'Gorham', fighter_2 = 'Alamo'")
+    store.db.execute("UPDATE fight_fighters SET fighter = lower(fighter) || '-old'")
+    store.db.execute("DELETE FROM sync_state WHERE key = 'fighter_names'")
+    store.db.commit()
+    store.close()
+
+    store = BoxingStore(path)
+    assert [f['id'] for f in store.fights_for_fighter('Yomar Alamo')] == [fight['id']]
+    assert not store.upsert_fight(fight, '2025-09-21T00:00:00Z')
+    cards = store.cards_between('2025-09-20', '2025-09-22')
+    assert cards[0]['fights'][0]['home'] == 'Breyon Gorham'
+    store.close()
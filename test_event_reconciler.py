@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Offline checks for event_reconciler (python -m pytest test_event_reconciler.py)"""
+
+import json
+import os
+
+from event_reconciler import EventReconciler, boxing_data_event, espn_events, odds_event
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'brown_vs_gongora_fights.json')
+
+
+def test_boxing_data_fights_link_to_odds_and_espn(tmp_path):
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        fights = json.load(f)
+
+    # The same bouts as the Odds API and ESPN list them: full names, their own ids and times
+    odds = [odds_event({'id': f"odds{i}", 'sport_key': 'boxing_boxing',
+                        'commence_time': fight['date'][:16] + ':00Z',
+                        'home_team': fight['fighters']['fighter_1']['full_name'],
+                        'away_team': fight['fighters']['fighter_2']['full_name']})
+            for i, fight in enumerate(fights)]
+    espn = espn_events({'id': 'card1', 'date': '2025-09-21T00:00Z', 'competitions': [
+        {'id': f"bout{i}", 'date': fight['date'][:16] + 'Z', 'competitors': [
+            {'athlete': {'displayName': fight['fighters']['fighter_2']['full_name']}},
+            {'athlete': {'displayName': fight['fighters']['fighter_1']['full_name']}}]}
+        for i, fight in enumerate(fights)]})
+
+    reconciler = EventReconciler(str(tmp_path / 'event_id_map.json'))
+    reconciler.reconcile([boxing_data_event(fight) for fight in fights])
+    reconciler.reconcile(odds)
+    reconciler.reconcile(espn)
+
+    assert len(reconciler.canonical) == len(fights)
+    assert reconciler.stats['matched'] == 2 * len(fights)
+    for record in reconciler.canonical.values():
+        assert set(record['ids']) == {'boxing_data', 'odds', 'espn'}
+
+
+def test_surname_only_records_fall_back_to_name():
+    event = boxing_data_event({'id': 'x', 'date': '2025-09-21T00:00:00',
+                               'fighters': {'fighter_1': {'name': 'Brown'}, 'fighter_2': {'name': 'Gongora'}}})
+    assert event['participants'] == ('Brown', 'Gongora')
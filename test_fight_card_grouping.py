@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Offline checks for fight_card_grouping (python -m pytest test_fight_card_grouping.py)"""
+
+from datetime import datetime, timezone
+
+from fight_card_grouping import CardGrouper, fight_from_boxing_data, group_fights
+
+
+def fight(fight_id, hour, day=18, venue='T-Mobile Arena', promotion='UFC'):
+    return {'id': fight_id, 'home': f"A{fight_id}", 'away': f"B{fight_id}",
+            'datetime': datetime(2025, 10, day, hour, tzinfo=timezone.utc),
+            'venue': venue, 'promotion': promotion}
+
+
+def test_card_across_utc_midnight_stays_together():
+    fights = [fight('1', 23), fight('2', 3, day=19)]
+    cards = group_fights(fights)
+    assert len(cards) == 1
+    assert [f['id'] for f in cards[0]['fights']] == ['1', '2']
+    assert cards[0]['date'].day == 18
+
+    grouper = CardGrouper(fights)
+    assert len(grouper) == 1
+
+
+def test_next_night_at_same_venue_is_a_new_card():
+    cards = group_fights([fight('1', 23), fight('2', 2, day=19), fight('3', 23, day=19)])
+    assert [[f['id'] for f in card['fights']] for card in cards] == [['1', '2'], ['3']]
+
+
+def test_grouper_matches_full_rebuild_and_moves_rescheduled_fights():
+    grouper = CardGrouper([fight('1', 23), fight('3', 23, day=19)])
+    assert len(grouper) == 2
+
+    # A bout after midnight bridges nothing across a 20 hour gap
+    grouper.add_fights([fight('2', 1, day=19)])
+    assert len(grouper) == 2
+
+    # Rescheduling fight 3 onto the first night merges it into that card
+    changed = grouper.add_fights([fight('3', 2, day=19)])
+    cards = grouper.cards()
+    assert len(cards) == 1
+    assert [f['id'] for f in cards[0]['fights']] == ['1', '2', '3']
+    assert len(changed) == 2
+
+
+def test_boxing_data_fights_use_full_names():
+    flat = fight_from_boxing_data({'id': 7, 'date': '2025-09-21T03:00:00',
+                                   'fighters': {'fighter_1': {'name': 'Brown', 'full_name': 'Tiara Brown'},
+                                                'fighter_2': {'name': 'Gongora'}}})
+    assert (flat['home'], flat['away']) == ('Tiara Brown', 'Gongora')
+
+
+if __name__ == "__main__":
+    test_card_across_utc_midnight_stays_together()
+    test_next_night_at_same_venue_is_a_new_card()
+    test_grouper_matches_full_rebuild_and_moves_rescheduled_fights()
+    test_boxing_data_fights_use_full_names()
+    print("ok")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Offline checks for line_movement (python -m pytest test_line_movement.py)"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from line_movement import analyze, detect, movement
+from odds_history import OddsHistory
+from odds_math import implied_probability
+
+
+def frame_for(books, times, prices):
+    """h2h frame with one 'Home' series per book, all polled at the same times"""
+    keys, series, t, value = [], [], [], []
+    for index, book in enumerate(books):
+        keys.append(('game1', 'Home', book))
+        series.extend([index] * len(times))
+        t.extend(times)
+        value.extend(prices)
+    return {'keys': keys, 'series': np.asarray(series, dtype=np.int64), 't': np.asarray(t, dtype=np.int64),
+            'value': implied_probability(np.asarray(value, dtype=float))}
+
+
+def test_sparse_polls_still_show_the_move():
+    # Polls 40 minutes apart, window 30 minutes: the baseline is the previous poll
+    frame = frame_for(['a', 'b', 'c'], [0, 2400], [2.0, 1.5])
+    flags = detect(frame, 'h2h', window=1800)
+    kinds = sorted(flag['kind'] for flag in flags)
+    assert kinds == ['move', 'move', 'move', 'steam']
+    assert abs(flags[0]['change'] - (1 / 1.5 - 0.5)) < 1e-9
+
+
+def test_change_uses_last_snapshot_before_window():
+    frame = frame_for(['a'], [0, 600, 1200, 2400], [2.0, 1.9, 1.8, 1.5])
+    movement(frame, window=1800)
+    # Row 3 (t=2400) compares with t=600, the last poll at or before 2400 - 1800
+    expected = implied_probability(np.array([1.5, 1.9]))
+    assert abs(frame['change'][3] - (expected[0] - expected[1])) < 1e-9
+    # Rows inside the first window compare with the first snapshot
+    assert frame['change'][0] == 0
+    assert frame['change'][1] > 0
+
+
+def test_flat_lines_raise_nothing():
+    frame = frame_for(['a', 'b', 'c'], [0, 2400, 4800], [2.0, 2.0, 2.0])
+    assert detect(frame, 'h2h', window=1800) == []
+
+
+def odds_game(price, when, books=('a', 'b', 'c')):
+    stamp = when.isoformat().replace('+00:00', 'Z')
+    return {'id': 'game1', 'sport_key': 'basketball_nba', 'home_team': 'Home', 'away_team': 'Away',
+            'commence_time': stamp,
+            'bookmakers': [{'key': book, 'markets': [{'key': 'h2h', 'last_update': stamp, 'outcomes': [
+                {'name': 'Home', 'price': price}, {'name': 'Away', 'price': round(1 / (1.05 - 1 / price), 2)}]}]}
+                for book in books]}
+
+
+def test_move_after_long_flat_line_is_flagged(tmp_path):
+    # Stored once 10 hours ago, unchanged since (so nothing inside the 6 hour lookback), then moves
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    history = OddsHistory(str(tmp_path))
+    history.append([odds_game(2.0, now - timedelta(hours=10))])
+    history.append([odds_game(1.5, now - timedelta(minutes=5))])
+    history.flush()
+
+    flags = analyze(OddsHistory(str(tmp_path)), markets=('h2h',))
+    kinds = sorted(flag['kind'] for flag in flags if flag['outcome'] == 'Home')
+    assert kinds == ['move', 'move', 'move', 'steam']
+
+
+if __name__ == "__main__":
+    test_sparse_polls_still_show_the_move()
+    test_change_uses_last_snapshot_before_window()
+    test_flat_lines_raise_nothing()
+    print("ok")
@@ -5,27 +5,22 @@ import json
 import urllib.request
 from datetime import datetime, timedelta
 
+from team_matcher import TeamMatcher, espn_date_range, event_teams
+
 def fetch_nba_games(date_str):
     """Fetch NBA games for a specific date"""
     url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date_str}"
     with urllib.request.urlopen(url) as response:
         return json.loads(response.read())
 
-def normalize_team_name(team):
-    """Normalize team name for matching (similar to Flutter app logic)"""
-    normalized = team.lower().strip()
-
-    # NBA team name variations
-    if 'thunder' in normalized and 'oklahoma' not in normalized:
-        return 'oklahoma city thunder'
-    if 'rockets' in normalized and 'houston' not in normalized:
-        return 'houston rockets'
-
-    # Remove special characters and extra spaces
-    normalized = ''.join(c if c.isalnum() or c.isspace() else '' for c in normalized)
-    normalized = ' '.join(normalized.split())
+def fetch_nba_games_around(date_str):
+    """Fetch NBA games for the day before through the day after, in one call.
 
-    return normalized
+    Late West Coast games are filed under the next UTC day, so a single
+    date= request can miss them; the matcher sorts out which day each game
+    belongs to.
+    """
+    return fetch_nba_games(espn_date_range(date_str))
 
 def test_matching(target_home, target_away, date_str):
     """Test matching logic for a specific game"""
@@ -33,42 +28,29 @@ def test_matching(target_home, target_away, date_str):
     print(f"Looking for: {target_away} @ {target_home}")
     print("-" * 60)
 
-    data = fetch_nba_games(date_str)
+    data = fetch_nba_games_around(date_str)
     events = data.get('events', [])
 
     if not events:
-        print(f"No games found for {date_str}")
+        print(f"No games found around {date_str}")
         return False
 
-    print(f"Found {len(events)} games on this date")
-
-    for event in events:
-        competitions = event.get('competitions', [{}])[0]
-        competitors = competitions.get('competitors', [])
-
-        if len(competitors) >= 2:
-            home_team = next((c for c in competitors if c.get('homeAway') == 'home'), {})
-            away_team = next((c for c in competitors if c.get('homeAway') == 'away'), {})
-
-            home_name = home_team.get('team', {}).get('displayName', '')
-            away_name = away_team.get('team', {}).get('displayName', '')
+    print(f"Found {len(events)} games from {espn_date_range(date_str)}")
 
-            # Normalize for comparison
-            norm_home = normalize_team_name(home_name)
-            norm_away = normalize_team_name(away_name)
-            norm_target_home = normalize_team_name(target_home)
-            norm_target_away = normalize_team_name(target_away)
+    # Normalize and index the whole window once; the lookup is a dict access
+    matcher = TeamMatcher(events, league='nba')
 
-            print(f"\n  Game: {away_name} @ {home_name}")
-            print(f"  ESPN ID: {event.get('id')}")
-            print(f"  Normalized: {norm_away} @ {norm_home}")
+    for event in matcher.events:
+        home_name, away_name = event_teams(event)
+        print(f"\n  Game: {away_name} @ {home_name}")
+        print(f"  ESPN ID: {event.get('id')}")
+        print(f"  Normalized: {matcher.normalize(away_name)} @ {matcher.normalize(home_name)}")
 
-            # Check both normal and reversed order
-            if (norm_home == norm_target_home and norm_away == norm_target_away) or \
-               (norm_home == norm_target_away and norm_away == norm_target_home):
-                print(f"  >>> MATCH FOUND! ESPN ID: {event.get('id')}")
-                print(f"  Game time: {event.get('date')}")
-                return True
+    event = matcher.lookup(target_home, target_away, date_str)
+    if event:
+        print(f"\n  >>> MATCH FOUND! ESPN ID: {event.get('id')}")
+        print(f"  Game time: {event.get('date')}")
+        return True
 
     print("\n>>> No matching game found")
     return False
@@ -1,98 +1,101 @@
 #!/usr/bin/env python3
 """Test The Odds API for game state information"""
 
-import requests
 import json
+import time
 from datetime import datetime
 
+from odds_api import OddsAPI
+
 # The Odds API - Free tier allows 500 requests/month
 # Get your free key at: https://the-odds-api.com/
 
+def print_quota(headers):
+    print(f"Requests Used: {headers.get('x-requests-used', 'N/A')}")
+    print(f"Requests Remaining: {headers.get('x-requests-remaining', 'N/A')}")
+
+
 def test_odds_api():
     """Test The Odds API endpoints"""
     
     # You can get a free API key at https://the-odds-api.com/
     # Free tier: 500 requests/month
-    API_KEY = 'demo'  # Using demo key for testing
+    client = OddsAPI()  # ODDS_API_KEY from the environment, else the demo key
     
     print("="*80)
     print("THE ODDS API TESTING")
     print("="*80)
-    print("Note: Using demo API key. Get your free key at https://the-odds-api.com/")
+    print("Note: Using demo API key unless ODDS_API_KEY is set. Get your free key at https://the-odds-api.com/")
     print("Free tier: 500 requests/month\n")
     
-    endpoints = {
-        'Active Sports': f'https://api.the-odds-api.com/v4/sports/?apiKey={API_KEY}',
-        'NFL Scores': f'https://api.the-odds-api.com/v4/sports/americanfootball_nfl/scores/?apiKey={API_KEY}&daysFrom=3',
-        'NBA Scores': f'https://api.the-odds-api.com/v4/sports/basketball_nba/scores/?apiKey={API_KEY}&daysFrom=3',
-        'MLB Scores': f'https://api.the-odds-api.com/v4/sports/baseball_mlb/scores/?apiKey={API_KEY}&daysFrom=3',
-        'UFC Scores': f'https://api.the-odds-api.com/v4/sports/mma_mixed_martial_arts/scores/?apiKey={API_KEY}&daysFrom=3',
-        'Soccer Scores': f'https://api.the-odds-api.com/v4/sports/soccer_epl/scores/?apiKey={API_KEY}&daysFrom=3',
+    score_sports = {
+        'NFL Scores': 'americanfootball_nfl',
+        'NBA Scores': 'basketball_nba',
+        'MLB Scores': 'baseball_mlb',
+        'UFC Scores': 'mma_mixed_martial_arts',
+        'Soccer Scores': 'soccer_epl',
     }
     
-    for name, url in endpoints.items():
+    # Sports list is free and cached for a day; scores calls all go out at once
+    start = time.perf_counter()
+    sports = client.get_sports()
+    responses = client.fetch_many([(name, client.get_scores, (sport, 3)) for name, sport in score_sports.items()])
+    print(f"Fetched {len(responses)} scores endpoints in {time.perf_counter() - start:.2f}s")
+    
+    print(f"\n{'-'*60}")
+    print("Testing: Active Sports (cached)")
+    print(f"Total items: {len(sports)}")
+    print("\nAvailable sports (first 5):")
+    for sport in sports[:5]:
+        print(f"  - {sport.get('title', 'N/A')} ({sport.get('key', 'N/A')})")
+        print(f"    Active: {sport.get('active', 'N/A')}, In-Season: {sport.get('has_outrights', 'N/A')}")
+    print("-"*60)
+    
+    for name, (data, headers) in responses.items():
         print(f"\n{'-'*60}")
         print(f"Testing: {name}")
-        print(f"URL: {url[:100]}...")
+        print_quota(headers)
+        if headers:
+            client.planner.update_from_headers(headers, cost=2)
         
-        try:
-            response = requests.get(url)
-            
-            # Check headers for usage limits
-            print(f"Status: {response.status_code}")
-            print(f"Requests Used: {response.headers.get('x-requests-used', 'N/A')}")
-            print(f"Requests Remaining: {response.headers.get('x-requests-remaining', 'N/A')}")
+        if data is None:
+            print("-"*60)
+            continue
+        
+        # Save for analysis
+        filename = f"odds_api_{name.replace(' ', '_').lower()}.json"
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=2)
+        print(f"[OK] Saved to {filename}")
+        
+        # Analyze the data
+        if isinstance(data, list):
+            print(f"Total items: {len(data)}")
             
-            if response.status_code == 200:
-                data = response.json()
+            if data:
+                game = data[0]
+                print("\nSample game data:")
+                print(f"  ID: {game.get('id', 'N/A')}")
+                print(f"  Sport: {game.get('sport_key', 'N/A')}")
+                print(f"  Commence Time: {game.get('commence_time', 'N/A')}")
+                print(f"  Completed: {game.get('completed', 'N/A')}")
                 
-                # Save for analysis
-                filename = f"odds_api_{name.replace(' ', '_').lower()}.json"
-                with open(filename, 'w') as f:
-                    json.dump(data, f, indent=2)
-                print(f"[OK] Saved to {filename}")
+                if 'scores' in game and game['scores']:
+                    print(f"  Scores:")
+                    for score in game['scores']:
+                        print(f"    {score.get('name', 'N/A')}: {score.get('score', 'N/A')}")
                 
-                # Analyze the data
-                if isinstance(data, list):
-                    print(f"Total items: {len(data)}")
-                    
-                    if data and 'scores' in name.lower():
-                        # This is a scores endpoint
-                        game = data[0] if data else {}
-                        print("\nSample game data:")
-                        print(f"  ID: {game.get('id', 'N/A')}")
-                        print(f"  Sport: {game.get('sport_key', 'N/A')}")
-                        print(f"  Commence Time: {game.get('commence_time', 'N/A')}")
-                        print(f"  Completed: {game.get('completed', 'N/A')}")
-                        
-                        if 'scores' in game and game['scores']:
-                            print(f"  Scores:")
-                            for score in game['scores']:
-                                print(f"    {score.get('name', 'N/A')}: {score.get('score', 'N/A')}")
-                        
-                        # Check for period/quarter data
-                        if 'periods' in game:
-                            print(f"  Periods available: Yes")
-                            print(f"  Period data: {game['periods']}")
-                        
-                        if 'last_update' in game:
-                            print(f"  Last Update: {game['last_update']}")
-                    
-                    elif data and 'sports' in name.lower():
-                        # This is the sports list
-                        print("\nAvailable sports (first 5):")
-                        for sport in data[:5]:
-                            print(f"  - {sport.get('title', 'N/A')} ({sport.get('key', 'N/A')})")
-                            print(f"    Active: {sport.get('active', 'N/A')}, In-Season: {sport.get('has_outrights', 'N/A')}")
+                # Check for period/quarter data
+                if 'periods' in game:
+                    print(f"  Periods available: Yes")
+                    print(f"  Period data: {game['periods']}")
                 
-            else:
-                print(f"Error: {response.status_code}")
-                print(f"Response: {response.text[:200]}")
-                
-        except Exception as e:
-            print(f"Error: {e}")
+                if 'last_update' in game:
+                    print(f"  Last Update: {game['last_update']}")
         
         print("-"*60)
+    
+    client.planner.save()
 
 def analyze_odds_api_capabilities():
     """Analyze what The Odds API provides"""
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Offline checks for odds_history (python -m pytest test_odds_history.py)"""
+
+import os
+
+from odds_history import COMPACT_RATIO, OddsHistory, iter_chunks
+
+
+def game(price, t, game_id='g1', books=('draftkings', 'fanduel')):
+    return {
+        'id': game_id, 'sport_key': 'basketball_nba', 'home_team': 'Home', 'away_team': 'Away',
+        'commence_time': '2025-10-20T23:00:00Z',
+        'bookmakers': [{'key': book, 'markets': [{
+            'key': 'h2h', 'last_update': t,
+            'outcomes': [{'name': 'Home', 'price': price}, {'name': 'Away', 'price': round(4.0 - price, 2)}],
+        }]} for book in books],
+    }
+
+
+def stamp(minute):
+    return f"2025-10-20T{18 + minute // 60:02d}:{minute % 60:02d}:00Z"
+
+
+def test_restarted_writer_skips_unchanged_snapshots(tmp_path):
+    history = OddsHistory(str(tmp_path))
+    assert history.append([game(1.9, stamp(0))]) == 2
+    history.flush()
+
+    # A new process sees the same lines again (later last_update, same prices)
+    restarted = OddsHistory(str(tmp_path))
+    assert restarted.append([game(1.9, stamp(5))]) == 0
+    assert restarted.append([game(1.8, stamp(10))]) == 2
+    restarted.flush()
+
+    series = OddsHistory(str(tmp_path)).series('g1', 'h2h', 'draftkings')
+    assert series[('draftkings', 'h2h')]['outcomes']['Home']['price'] == [1.9, 1.8]
+
+
+def test_torn_tail_is_truncated_before_appending(tmp_path):
+    history = OddsHistory(str(tmp_path))
+    history.append([game(1.9, stamp(0))])
+    history.flush()
+    path = os.path.join(str(tmp_path), 'g1.odds')
+    with open(path, 'ab') as f:
+        f.write(b'\x00\x00\x01\x00partial chunk')
+
+    restarted = OddsHistory(str(tmp_path))
+    restarted.append([game(1.7, stamp(10))])
+    restarted.flush()
+
+    series = OddsHistory(str(tmp_path)).series('g1', 'h2h', 'fanduel')
+    assert series[('fanduel', 'h2h')]['outcomes']['Home']['price'] == [1.9, 1.7]
+
+
+def test_small_chunks_are_compacted(tmp_path):
+    history = OddsHistory(str(tmp_path))
+    prices = [round(1.5 + 0.01 * i, 2) for i in range(COMPACT_RATIO * 3)]
+    for minute, price in enumerate(prices):
+        history.append([game(price, stamp(minute))])
+        history.flush()
+
+    chunks = list(iter_chunks(os.path.join(str(tmp_path), 'g1.odds')))
+    assert len(chunks) < COMPACT_RATIO * 2
+    series = OddsHistory(str(tmp_path)).series('g1', 'h2h', 'draftkings')
+    assert series[('draftkings', 'h2h')]['outcomes']['Home']['price'] == prices
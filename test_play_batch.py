@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Offline checks for play_batch against fake_play (python -m pytest test_play_batch.py)"""
+
+import time
+
+from fake_play import FakeAndroidPublisher
+from play_batch import BatchExecutor, RateLimiter
+
+
+def product(i):
+    return {'sku': f"card_{i:04d}", 'status': 'active', 'purchaseType': 'managedUser',
+            'defaultPrice': {'priceMicros': '990000', 'currency': 'USD'}, 'defaultLanguage': 'en-US',
+            'listings': {'en-US': {'title': f"Card {i}", 'description': "Power card"}}}
+
+
+def test_each_worker_thread_uses_its_own_http():
+    fake = FakeAndroidPublisher(latency=0.01, require_http=True, seed=1)
+    built = []
+
+    def http_factory():
+        http = object()
+        built.append(http)
+        return http
+
+    executor = BatchExecutor(fake, 'com.example', chunk_size=10, max_workers=4,
+                             max_calls_per_second=None, http_factory=http_factory)
+    result = executor.run([product(i) for i in range(200)])
+
+    assert len(result['succeeded']) == 200 and not result['failed']
+    assert 1 <= len(built) <= 4
+    assert all(len(threads) == 1 for threads in fake.http_threads.values())
+    assert set(fake.http_threads) == {id(http) for http in built}
+
+
+def test_calls_per_second_cap_avoids_429s():
+    fake = FakeAndroidPublisher(rate_limit=5, seed=2)
+    executor = BatchExecutor(fake, 'com.example', chunk_size=10, max_workers=4,
+                             max_calls_per_second=4, base_delay=0.01)
+    start = time.monotonic()
+    result = executor.run([product(i) for i in range(80)])
+
+    assert len(result['succeeded']) == 80
+    assert fake.errors[429] == 0
+    assert time.monotonic() - start >= 7 / 4
+
+
+class ForbiddenPublisher(FakeAndroidPublisher):
+    """Rejects every batchUpdate the way a service account without access does"""
+
+    def _batch_update(self, package_name, body):
+        self._fail(403, "The caller does not have permission")
+
+
+def test_forbidden_chunk_fails_in_one_call():
+    fake = ForbiddenPublisher(seed=3)
+    executor = BatchExecutor(fake, 'com.example', chunk_size=100, max_workers=1,
+                             max_calls_per_second=None, base_delay=0.01)
+    result = executor.run([product(i) for i in range(100)])
+
+    assert fake.calls['batchUpdate'] == 1
+    assert not result['succeeded'] and len(result['failed']) == 100
+
+
+def test_rate_limiter_spaces_calls():
+    limiter = RateLimiter(50)
+    stamps = []
+    for _ in range(5):
+        limiter.wait()
+        stamps.append(time.monotonic())
+    assert stamps[-1] - stamps[0] >= 4 / 50 - 0.002
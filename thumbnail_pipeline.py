@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Image derivative pipeline for ESPN headshots and team logos.
+
+Downloads full-size assets (e.g. https://a.espncdn.com/i/headshots/mma/players/full/{id}.png)
+into a local cache and produces fixed-size thumbnails for list views.
+
+Everything is named by content hash, so re-running the pipeline only
+downloads new URLs and only resizes images that have no derivative yet.
+Resizing runs in a process pool to use every core.
+
+Layout:
+    asset_cache/
+        manifest.json              url -> {hash, original, thumbnails}
+        originals/{sha256}.png
+        thumbs/{sha256}_{size}.{webp|png}
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from PIL import Image
+
+CACHE_DIR = 'asset_cache'
+MANIFEST_FILE = 'manifest.json'
+
+# Avatar sizes used by the list screens (logical px * 2 for high density)
+THUMBNAIL_SIZES = (48, 96, 192)
+THUMBNAIL_FORMATS = ('webp', 'png')
+
+HEADSHOT_URL = "https://a.espncdn.com/i/headshots/{sport}/players/full/{athlete_id}.png"
+FIGHTCENTER_URL = "https://site.api.espn.com/apis/site/v2/sports/mma/ufc/fightcenter/{event_id}"
+TEAMS_URL = "https://site.api.espn.com/apis/site/v2/sports/{sport}/{league}/teams"
+
+
+def load_manifest(cache_dir=CACHE_DIR):
+    """Load the asset manifest, or an empty one if it does not exist yet"""
+    path = os.path.join(cache_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, cache_dir=CACHE_DIR):
+    """Write the manifest atomically so an interrupted run never corrupts it"""
+    path = os.path.join(cache_dir, MANIFEST_FILE)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def fighter_headshot_urls(event_id):
+    """Collect headshot URLs for every fighter on a UFC event"""
+    url = FIGHTCENTER_URL.format(event_id=event_id)
+    with urllib.request.urlopen(url, timeout=15) as response:
+        data = json.loads(response.read())
+
+    urls = []
+    for card in data.get('cards', []):
+        for comp in card.get('competitions', []):
+            for competitor in comp.get('competitors', []):
+                athlete_id = str(competitor.get('athlete', {}).get('id', ''))
+                if athlete_id:
+                    urls.append(HEADSHOT_URL.format(sport='mma', athlete_id=athlete_id))
+    return urls
+
+
+def team_logo_urls(sport, league):
+    """Collect logo URLs from an ESPN teams endpoint (same shape as fetch_mlb_teams)"""
+    url = TEAMS_URL.format(sport=sport, league=league)
+    with urllib.request.urlopen(url, timeout=15) as response:
+        data = json.loads(response.read())
+
+    teams = data.get('sports', [{}])[0].get('leagues', [{}])[0].get('teams', [])
+    urls = []
+    for team_data in teams:
+        logos = team_data.get('team', {}).get('logos', [])
+        if logos and logos[0].get('href'):
+            urls.append(logos[0]['href'])
+    return urls
+
+
+def download_asset(url, cache_dir=CACHE_DIR):
+    """Download one asset and store it under its content hash.
+
+    Returns (url, sha256, path) or (url, None, None) on failure.
+    """
+    try:
+        with urllib.request.urlopen(url, timeout=15) as response:
+            content = response.read()
+    except Exception as e:
+        print(f"  [FAIL] {url}: {e}")
+        return url, None, None
+
+    digest = hashlib.sha256(content).hexdigest()
+    path = os.path.join(cache_dir, 'originals', f"{digest}.png")
+    if not os.path.exists(path):
+        with open(path, 'wb') as f:
+            f.write(content)
+    return url, digest, path
+
+
+def thumbnail_path(digest, size, fmt, cache_dir=CACHE_DIR):
+    """Derivative path for an original hash, size and format"""
+    return os.path.join(cache_dir, 'thumbs', f"{digest}_{size}.{fmt}")
+
+
+def make_thumbnails(job):
+    """Resize one original into every requested size/format (runs in a worker process).
+
+    Returns (digest, {"{size}.{fmt}": path}) for the derivatives that exist
+    after the call. Existing derivatives are never regenerated.
+    """
+    digest, original, sizes, formats, cache_dir = job
+    results = {}
+    pending = []
+    for size in sizes:
+        for fmt in formats:
+            out = thumbnail_path(digest, size, fmt, cache_dir)
+            if os.path.exists(out):
+                results[f"{size}.{fmt}"] = out
+            else:
+                pending.append((size, fmt, out))
+
+    if not pending:
+        return digest, results
+
+    try:
+        with Image.open(original) as img:
+            img = img.convert('RGBA')
+            for size, fmt, out in pending:
+                thumb = img.copy()
+                # Fit inside a square box, then center on a transparent canvas
+                thumb.thumbnail((size, size), Image.LANCZOS)
+                canvas = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+                canvas.paste(thumb, ((size - thumb.width) // 2, (size - thumb.height) // 2))
+
+                tmp_out = out + '.tmp'
+                if fmt == 'webp':
+                    canvas.save(tmp_out, 'WEBP', quality=80, method=6)
+                else:
+                    canvas.save(tmp_out, 'PNG', optimize=True)
+                os.replace(tmp_out, out)
+                results[f"{size}.{fmt}"] = out
+    except Exception as e:
+        print(f"  [FAIL] thumbnail {digest[:12]}: {e}")
+
+    return digest, results
+
+
+def run_pipeline(urls, cache_dir=CACHE_DIR, sizes=THUMBNAIL_SIZES,
+                 formats=THUMBNAIL_FORMATS, workers=None, download_workers=8):
+    """Download new assets and generate any missing thumbnails.
+
+    Returns the updated manifest.
+    """
+    os.makedirs(os.path.join(cache_dir, 'originals'), exist_ok=True)
+    os.makedirs(os.path.join(cache_dir, 'thumbs'), exist_ok=True)
+
+    manifest = load_manifest(cache_dir)
+
+    # 1. Download only URLs we have never seen (I/O bound -> threads)
+    new_urls = [url for url in dict.fromkeys(urls) if url not in manifest]
+    print(f"Assets: {len(urls)} requested, {len(new_urls)} new")
+
+    if new_urls:
+        with ThreadPoolExecutor(max_workers=download_workers) as pool:
+            for url, digest, path in pool.map(lambda u: download_asset(u, cache_dir), new_urls):
+                if digest:
+                    manifest[url] = {'hash': digest, 'original': path, 'thumbnails': {}}
+
+    # 2. Resize each distinct original once (CPU bound -> processes)
+    by_hash = {}
+    for entry in manifest.values():
+        wanted = {f"{size}.{fmt}" for size in sizes for fmt in formats}
+        if not wanted.issubset(entry.get('thumbnails', {})):
+            by_hash[entry['hash']] = entry['original']
+
+    print(f"Originals needing thumbnails: {len(by_hash)}")
+
+    if by_hash:
+        jobs = [(digest, original, sizes, formats, cache_dir) for digest, original in by_hash.items()]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            generated = dict(pool.map(make_thumbnails, jobs, chunksize=8))
+
+        for entry in manifest.values():
+            if entry['hash'] in generated:
+                entry.setdefault('thumbnails', {}).update(generated[entry['hash']])
+
+    save_manifest(manifest, cache_dir)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate thumbnails for ESPN headshots and logos")
+    parser.add_argument('--event', action='append', default=[],
+                        help="UFC event id to collect fighter headshots from (repeatable)")
+    parser.add_argument('--teams', action='append', default=[],
+                        help="sport/league to collect team logos from, e.g. baseball/mlb (repeatable)")
+    parser.add_argument('--url', action='append', default=[], help="Extra asset URL (repeatable)")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--workers', type=int, default=None, help="Resize processes (default: all cores)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Image Derivative Pipeline")
+    print("=" * 60)
+
+    urls = list(args.url)
+    for event_id in args.event:
+        urls.extend(fighter_headshot_urls(event_id))
+    for sport_league in args.teams:
+        sport, league = sport_league.split('/', 1)
+        urls.extend(team_logo_urls(sport, league))
+
+    if not urls:
+        parser.print_help()
+        return
+
+    manifest = run_pipeline(urls, cache_dir=args.cache_dir, workers=args.workers)
+
+    thumbs = sum(len(entry.get('thumbnails', {})) for entry in manifest.values())
+    print(f"\nManifest: {len(manifest)} assets, {thumbs} thumbnails")
+    print(f"Saved to {os.path.join(args.cache_dir, MANIFEST_FILE)}")
+
+
+if __name__ == "__main__":
+    main()